@@ -0,0 +1,213 @@
+import argparse
+import functools
+import json
+import multiprocessing
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from physics import SCENES, load_scene  # noqa: E402
+from profiling import wrap_updaters  # noqa: E402
+
+# Benchmark pentru scenele din src/: timpul de construcție (tot ce se
+# întâmplă în afara self.play), costul per cadru al randării și al fiecărui
+# updater, plus memoria de vârf. Scenele rulează la calitate mică, fără a
+# scrie video, fiecare caz într-un proces separat.
+
+RESULTS_DIR = ROOT / "benchmarks" / "results"
+
+# Parametrii de rezoluție variați: "params.<nume>" trece prin physics,
+# celelalte chei sunt atribute ale clasei scenei
+SWEEPS = {
+    "WavePropagation1D": {"params.n_samples": [200, 2000], "params.solver": ["fdtd"]},
+    "Reflection": {},
+    "Refraction": {},
+    "Interference": {"params.resolution": [20, 40, 80], "params.solver": ["fdtd"]},
+    "PhotonicModel": {},
+    "Polarization": {},
+    "DoubleSlit": {"n_particles": [15, 2000, 20000], "params.n_screen": [80, 320]},
+    "PrismRays": {"params.n_rays": [20, 2000]},
+    "SlabRays": {"params.n_rays": [10, 1000]},
+    "LensRays": {"params.n_rays": [5, 500]},
+}
+
+
+def cases(scene_names):
+    """Variantele de rulat: (scenă, {parametru: valoare})"""
+    for name in scene_names:
+        yield name, {}
+        for key, values in SWEEPS[name].items():
+            for value in values:
+                yield name, {key: value}
+
+
+def variant_class(scene_name, variant):
+    """Subclasă a scenei cu parametrii variantei"""
+    base = load_scene(scene_name)
+    attrs = {"params": dict(base.params)}
+    for key, value in variant.items():
+        if key.startswith("params."):
+            attrs["params"][key.removeprefix("params.")] = value
+        else:
+            attrs[key] = value
+    return type(scene_name, (base,), attrs)
+
+
+def timed(function, totals, key):
+    """Învelește o funcție și adună durata apelurilor în totals[key]"""
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            totals[key] = totals.get(key, 0.0) + time.perf_counter() - start
+    return wrapper
+
+
+def run_case(scene_name, variant, quality="low_quality", memory=False):
+    """Rulează o variantă și întoarce măsurătorile"""
+    from manim import Mobject, tempconfig
+
+    updaters = {}
+    totals = {}
+    # Fiecare updater (inclusiv cele din always_redraw) este cronometrat separat;
+    # patch-ul global se scoate și dacă scena ridică o excepție
+    original_add_updater = Mobject.add_updater
+    Mobject.add_updater = wrap_updaters(
+        original_add_updater, lambda function, name: timed(function, updaters, name))
+    try:
+        with tempfile.TemporaryDirectory() as media_dir, tempconfig({
+            "quality": quality,
+            "write_to_movie": False,
+            "save_last_frame": False,
+            "disable_caching": True,
+            "preview": False,
+            "media_dir": media_dir,
+            "verbosity": "ERROR",
+            "progress_bar": "none",
+        }):
+            scene = variant_class(scene_name, variant)()
+            scene.renderer.play = timed(scene.renderer.play, totals, "play")
+            camera = scene.renderer.camera
+            frames = [0]
+            capture = camera.capture_mobjects
+
+            def capture_mobjects(*args, **kwargs):
+                frames[0] += 1
+                return capture(*args, **kwargs)
+
+            camera.capture_mobjects = timed(capture_mobjects, totals, "draw")
+
+            if memory:
+                tracemalloc.start()
+            try:
+                start = time.perf_counter()
+                scene.render()
+                total = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1] if memory else None
+            finally:
+                if memory:
+                    tracemalloc.stop()
+    finally:
+        Mobject.add_updater = original_add_updater
+
+    n = max(frames[0], 1)
+    return {
+        "scene": scene_name,
+        "variant": variant,
+        "total_s": total,
+        "setup_s": total - totals.get("play", 0.0),
+        "frames": frames[0],
+        "frame_ms": 1e3 * totals.get("play", 0.0) / n,
+        "draw_ms": 1e3 * totals.get("draw", 0.0) / n,
+        "updaters_ms": {key: 1e3 * seconds / n for key, seconds in sorted(updaters.items())},
+        "peak_memory_mb": peak / 1024**2 if peak is not None else None,
+    }
+
+
+def run_isolated(scene_name, variant, quality, memory):
+    """Un caz într-un proces nou, ca să nu împartă starea globală Manim"""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        return pool.submit(run_case, scene_name, variant, quality, memory).result()
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results, baseline_path):
+    """Afișează raportul timpilor față de un fișier JSON anterior"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    old = {(r["scene"], json.dumps(r["variant"], sort_keys=True)): r for r in baseline["results"]}
+    print(f"\nComparație cu {baseline['commit']}:")
+    for r in results:
+        key = (r["scene"], json.dumps(r["variant"], sort_keys=True))
+        if key not in old:
+            continue
+        for metric in ("setup_s", "frame_ms"):
+            before, after = old[key][metric], r[metric]
+            ratio = after / before if before else float("nan")
+            flag = "  <-- regresie" if ratio > 1.1 else ""
+            print(f"  {r['scene']:<18} {key[1]:<28} {metric:<9} {before:9.3f} -> {after:9.3f} ({ratio:.2f}x){flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pentru scenele Manim")
+    parser.add_argument("scenes", nargs="*", metavar="SCENE",
+                        help=f"scenele măsurate (implicit toate): {', '.join(SCENES)}")
+    parser.add_argument("--quality", default="low_quality")
+    parser.add_argument("--memory", action="store_true",
+                        help="măsoară și memoria de vârf (tracemalloc, mai lent)")
+    parser.add_argument("--no-sweep", action="store_true", help="doar parametrii impliciți")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="fișierul JSON (implicit benchmarks/results/<commit>.json)")
+    parser.add_argument("--compare", type=Path, default=None, metavar="JSON",
+                        help="compară cu rezultatele unui commit anterior")
+    args = parser.parse_args()
+    unknown = set(args.scenes) - set(SCENES)
+    if unknown:
+        parser.error(f"scene necunoscute: {', '.join(sorted(unknown))}")
+
+    scene_names = args.scenes or list(SCENES)
+    todo = [(name, {}) for name in scene_names] if args.no_sweep else list(cases(scene_names))
+
+    results = []
+    for scene_name, variant in todo:
+        result = run_isolated(scene_name, variant, args.quality, args.memory)
+        results.append(result)
+        memory = f"{result['peak_memory_mb']:8.1f} MB" if args.memory else ""
+        print(f"{scene_name:<18} {json.dumps(variant):<28} setup {result['setup_s']:7.2f} s  "
+              f"cadru {result['frame_ms']:8.2f} ms  {memory}", flush=True)
+
+    commit = git_commit()
+    output = args.output or RESULTS_DIR / f"{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps({
+        "commit": commit,
+        "quality": args.quality,
+        "python": sys.version.split()[0],
+        "results": results,
+    }, indent=2))
+    print(f"\nRezultate: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
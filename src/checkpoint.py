@@ -0,0 +1,170 @@
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+
+from manim import config, logger
+
+from physics import SCENES, to_json
+from render_cache import manim_version, source_hash
+
+# Randare reluabilă pentru scenele lungi. Fiecare self.play / self.wait
+# produce un segment video (fișierul parțial al Manim); după ce segmentul
+# s-a terminat, el este păstrat în directorul de checkpoint împreună cu
+# hash-ul stării scenei la începutul lui. O randare întreruptă și repornită
+# sare peste segmentele deja terminate (animațiile lor rulează fără cadre,
+# ca la `-n`, deci starea scenei ajunge aceeași) și randează de la primul
+# segment incomplet. La final Manim concatenează segmentele prin copiere de
+# pachete, fără recodare, iar directorul de checkpoint este șters.
+#
+#   media_output/checkpoints/<scenă>-<stare>/
+#       manifest.json            starea inițială și segmentele terminate
+#       00003-<hash>.mp4         segmentul animației 3
+#
+# Hash-ul unui segment înlănțuie hash-ul celui anterior cu descrierea
+# apelului (tipurile animațiilor, argumentele, numărul de mobject-uri);
+# starea inițială acoperă sursa scenei și a modulelor locale, parametrii
+# fizici, rezoluția, frame rate-ul și versiunea Manim. Orice modificare a
+# scenei invalidează deci toate segmentele de după ea.
+
+CHECKPOINT_DIR = Path(__file__).resolve().parent.parent / "media_output" / "checkpoints"
+
+_PLAIN = (bool, int, float, str, list, tuple, dict, type(None))
+
+
+def _describe(value):
+    """Descriere stabilă a unui argument al lui self.play (fără id-uri de obiecte)"""
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_describe(v) for v in value) + "]"
+    if callable(value) and hasattr(value, "__name__"):
+        return value.__name__
+    return type(value).__name__
+
+
+class Checkpointed:
+    """Mixin pentru scene Manim; se pune înaintea clasei de bază:
+
+        class Interference(Checkpointed, ThreeDScene): ...
+
+    Funcționează doar cu renderer-ul Cairo și cu scriere video; altfel
+    scena se randează normal.
+    """
+
+    # Directorul checkpoint-urilor (None = media_output/checkpoints)
+    checkpoint_dir = None
+    # Păstrează segmentele și după o randare reușită
+    keep_checkpoints = False
+
+    def checkpoint_state(self):
+        """Hash-ul stării inițiale a scenei"""
+        # Subclasele (DoubleSlitPhotonHits, variante din load_scene) folosesc
+        # sursa scenei din SCENES și atributele de clasă suprascrise
+        classes = [cls for cls in type(self).__mro__
+                   if cls is not Checkpointed and not cls.__module__.startswith("manim")]
+        source = next(cls.__name__ for cls in classes if cls.__name__ in SCENES)
+        attributes = {}
+        for cls in reversed(classes):
+            attributes.update({key: value for key, value in vars(cls).items()
+                               if not key.startswith("_") and isinstance(value, _PLAIN)})
+        payload = {
+            "scene": type(self).__name__,
+            "source": source_hash(source),
+            "attributes": to_json(attributes),
+            "resolution": [config.pixel_width, config.pixel_height],
+            "frame_rate": config.frame_rate,
+            "extension": config.movie_file_extension,
+            "manim": manim_version(),
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+    def render(self, preview=False):
+        writer = self.renderer.file_writer
+        if not (hasattr(self.renderer, "_original_skipping_status")
+                and hasattr(writer, "partial_movie_directory")):
+            return super().render(preview)
+
+        state = self.checkpoint_state()
+        root = Path(self.checkpoint_dir or CHECKPOINT_DIR)
+        self._checkpoint_path = root / f"{type(self).__name__}-{state[:16]}"
+        self._checkpoint_path.mkdir(parents=True, exist_ok=True)
+        self._checkpoint_state = self._checkpoint_hash = state
+        self._segments = self._load_manifest(state)
+        if self._segments:
+            logger.info(f"Checkpoint: {len(self._segments)} segmente terminate în {self._checkpoint_path}")
+
+        result = super().render(preview)
+        if not self.keep_checkpoints:
+            shutil.rmtree(self._checkpoint_path, ignore_errors=True)
+        return result
+
+    def play(self, *args, **kwargs):
+        if not hasattr(self, "_segments"):
+            return super().play(*args, **kwargs)
+
+        renderer = self.renderer
+        writer = renderer.file_writer
+        index = renderer.num_plays
+        description = [_describe(arg) for arg in args]
+        description += [f"{key}={_describe(value)}" for key, value in sorted(kwargs.items())]
+        description.append(len(self.mobjects))
+        segment_hash = hashlib.sha256(
+            json.dumps([self._checkpoint_hash, index, description]).encode()
+        ).hexdigest()
+        self._checkpoint_hash = segment_hash
+
+        done = self._segments.get(str(index))
+        path = None if done is None else self._checkpoint_path / done["file"]
+        if path is not None and done["hash"] == segment_hash and path.exists():
+            # Segment terminat: animația rulează fără cadre, iar în lista de
+            # fișiere parțiale intră segmentul salvat
+            original = renderer._original_skipping_status
+            renderer._original_skipping_status = True
+            try:
+                result = super().play(*args, **kwargs)
+            finally:
+                renderer._original_skipping_status = original
+            if writer.partial_movie_files and writer.partial_movie_files[-1] is None:
+                writer.partial_movie_files[-1] = str(path)
+                writer.sections[-1].partial_movie_files[-1] = str(path)
+            return result
+
+        result = super().play(*args, **kwargs)
+        partial = writer.partial_movie_files[index] if len(writer.partial_movie_files) > index else None
+        if partial is not None and Path(partial).exists():
+            name = f"{index:05}-{segment_hash[:16]}{config.movie_file_extension}"
+            self._save_segment(Path(partial), name)
+            self._segments[str(index)] = {"hash": segment_hash, "file": name}
+            self._save_manifest()
+        return result
+
+    def _save_segment(self, partial, name):
+        """Leagă (hard link) sau copiază fișierul parțial în directorul de checkpoint"""
+        target = self._checkpoint_path / name
+        tmp = target.with_suffix(".tmp")
+        tmp.unlink(missing_ok=True)
+        try:
+            os.link(partial, tmp)
+        except OSError:
+            shutil.copyfile(partial, tmp)
+        os.replace(tmp, target)
+
+    def _load_manifest(self, state):
+        """Segmentele terminate ale unei randări anterioare cu aceeași stare inițială"""
+        path = self._checkpoint_path / "manifest.json"
+        try:
+            manifest = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if manifest.get("state") != state:
+            return {}
+        return manifest.get("segments", {})
+
+    def _save_manifest(self):
+        path = self._checkpoint_path / "manifest.json"
+        tmp = path.with_suffix(".tmp")
+        manifest = {"state": self._checkpoint_state, "segments": self._segments}
+        tmp.write_text(json.dumps(manifest, indent=1))
+        os.replace(tmp, path)
@@ -0,0 +1,255 @@
+import argparse
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+try:
+    import scipy.fft as _scipy_fft
+except ImportError:
+    _scipy_fft = None
+
+# Difracție scalară prin FFT, fără Manim: o mască de apertură (1D sau 2D)
+# este propagată prin spectrul unghiular (exact în aproximația scalară, deci
+# acoperă și regimul Fresnel) sau transformată direct în câmp îndepărtat
+# (Fraunhofer). Costul este O(N log N) pe grilă.
+#
+# Un AngularSpectrum are grila fixă: spectrul aperturii se calculează o
+# singură dată, funcțiile de transfer H(λ, z) stau într-un cache LRU, iar
+# buffer-ele de lucru sunt refolosite, deci un sweep pe lungimi de undă și
+# distanțe costă câte o înmulțire și o FFT inversă per configurație.
+# Backend-ul este scipy.fft (multi-fir) când există, altfel numpy.fft; ambele
+# păstrează în cache planurile pentru dimensiunile deja folosite.
+
+ROOT = Path(__file__).resolve().parent.parent
+PLOT_FILE = ROOT / "plots" / "diffraction.png"
+
+
+def _fft(x, out, inverse=False):
+    """FFT n-dimensională a lui x scrisă în out (poate fi chiar x)"""
+    if _scipy_fft is not None:
+        transform = _scipy_fft.ifftn if inverse else _scipy_fft.fftn
+        result = transform(x, overwrite_x=x is out, workers=-1)
+        if result is not out:
+            np.copyto(out, result)
+        return out
+    return (np.fft.ifftn if inverse else np.fft.fftn)(x, out=out)
+
+
+def _shift_into(source, out):
+    """fftshift(source) scris în out, fără temporare (blocuri copiate direct)"""
+    blocks = [[(slice(0, n - n // 2), slice(n // 2, n)), (slice(n - n // 2, n), slice(0, n // 2))]
+              for n in source.shape]
+    for combination in np.ndindex(*(2,) * source.ndim):
+        src = tuple(blocks[axis][half][0] for axis, half in enumerate(combination))
+        dst = tuple(blocks[axis][half][1] for axis, half in enumerate(combination))
+        out[dst] = source[src]
+    return out
+
+
+def coordinates(n, dx):
+    """Coordonatele centrate ale unei grile cu n puncte și pasul dx"""
+    return (np.arange(n) - n // 2) * dx
+
+
+def slits(y, centers, width):
+    """Mască 0/1 cu fante de lățimea `width` centrate în `centers`"""
+    y = np.asarray(y)
+    mask = np.zeros(y.shape, dtype=bool)
+    for center in np.atleast_1d(centers):
+        mask |= np.abs(y - center) < width / 2
+    return mask.astype(np.float32)
+
+
+def grating(y, n_slits, period, width):
+    """Rețea de n_slits fante cu perioada `period`, centrată în 0"""
+    return slits(y, (np.arange(n_slits) - (n_slits - 1) / 2) * period, width)
+
+
+def circular(X, Y, radius):
+    return (np.hypot(X, Y) < radius).astype(np.float32)
+
+
+def rectangular(X, Y, width, height):
+    return ((np.abs(X) < width / 2) & (np.abs(Y) < height / 2)).astype(np.float32)
+
+
+class AngularSpectrum:
+    """Propagare prin spectrul unghiular pe o grilă fixă
+
+    U(z) = IFFT[FFT(U0) · H], H = exp(i z (kz - k)), kz = √(k² - kx² - ky²);
+    componentele evanescente (kx² + ky² > k²) se atenuează. Faza globală
+    e^{ikz} este omisă, ca diferențele de fază să rămână precise în complex64.
+    Grila are forma `shape` și pasul dx pe toate axele; lungimile de undă și
+    distanțele sunt în aceleași unități ca dx.
+
+    Cu band_limit, H este tăiat la frecvențele pe care grila nu le poate
+    eșantiona (Matsushima & Shimobaba): altfel lumina difractată la unghiuri
+    mari iese din fereastră și reapare periodic pe partea opusă.
+    """
+
+    def __init__(self, shape, dx, dtype=np.complex64, max_bytes=512 * 1024**2,
+                 band_limit=True):
+        self.shape = tuple(np.atleast_1d(shape))
+        self.dx = dx
+        self.dtype = np.dtype(dtype)
+        self.max_bytes = max_bytes
+        self.band_limit = band_limit
+        real = np.finfo(self.dtype).dtype
+        self._frequencies = [np.fft.fftfreq(n, dx) for n in self.shape]
+        k2 = np.zeros(self.shape, dtype=real)
+        for axis, f in enumerate(self._frequencies):
+            k = (2 * np.pi * f).astype(real)
+            k2 += (k**2).reshape((-1,) + (1,) * (len(self.shape) - axis - 1))
+        self._k2 = k2
+        self._spectrum = np.empty(self.shape, dtype=self.dtype)
+        self._field = np.empty(self.shape, dtype=self.dtype)
+        self._centered = None
+        self._transfers = OrderedDict()
+        self._bytes = 0
+
+    @property
+    def coordinates(self):
+        """Coordonatele centrate pe fiecare axă; câmpul este pe grila fftshift-ată"""
+        return [coordinates(n, self.dx) for n in self.shape]
+
+    def set_aperture(self, aperture):
+        """Câmpul din planul aperturii (mască sau câmp complex), centrat pe grilă"""
+        np.copyto(self._spectrum, np.fft.ifftshift(aperture), casting="same_kind")
+        _fft(self._spectrum, self._spectrum)
+        return self
+
+    def transfer(self, wavelength, distance):
+        """H(λ, z), din cache"""
+        key = (float(wavelength), float(distance))
+        transfer = self._transfers.get(key)
+        if transfer is not None:
+            self._transfers.move_to_end(key)
+            return transfer
+        k = 2 * np.pi / wavelength
+        # kz - k = -(kx² + ky²) / (kz + k), fără anularea din kz - k
+        transfer = np.subtract(k**2, self._k2, dtype=self.dtype)
+        np.sqrt(transfer, out=transfer)
+        transfer += k
+        np.divide(self._k2, transfer, out=transfer)
+        transfer *= -1j * distance
+        np.exp(transfer, out=transfer)
+        if self.band_limit:
+            for axis, (n, f) in enumerate(zip(self.shape, self._frequencies)):
+                limit = 1 / (wavelength * np.hypot(2 * distance / (n * self.dx), 1))
+                transfer[(slice(None),) * axis + (np.abs(f) > limit,)] = 0
+        self._transfers[key] = transfer
+        self._bytes += transfer.nbytes
+        while self._bytes > self.max_bytes and len(self._transfers) > 1:
+            _, old = self._transfers.popitem(last=False)
+            self._bytes -= old.nbytes
+        return transfer
+
+    def _propagate(self, wavelength, distance):
+        """Câmpul la distanța z, în ordinea FFT (necentrat), în buffer-ul de lucru"""
+        np.multiply(self._spectrum, self.transfer(wavelength, distance), out=self._field)
+        return _fft(self._field, self._field, inverse=True)
+
+    def field(self, wavelength, distance):
+        """Câmpul complex la distanța z, centrat; buffer refolosit la apelul următor"""
+        if self._centered is None:
+            self._centered = np.empty(self.shape, dtype=self.dtype)
+        return _shift_into(self._propagate(wavelength, distance), self._centered)
+
+    def intensity(self, wavelength, distance, out=None):
+        """|U(z)|², centrat"""
+        field = self._propagate(wavelength, distance)
+        if out is None:
+            out = np.empty(self.shape, dtype=np.finfo(self.dtype).dtype)
+        # |U|² calculat pe loc în partea reală a buffer-ului, apoi centrat în out
+        squared = field.real
+        np.multiply(squared, squared, out=squared)
+        squared += field.imag**2
+        return _shift_into(squared, out)
+
+    def sweep(self, wavelengths, distances):
+        """Generator (λ, z, intensitate) pe produsul cartezian, cu un singur buffer de ieșire
+
+        Intensitatea produsă este suprascrisă la pasul următor; se copiază
+        dacă trebuie păstrată.
+        """
+        out = np.empty(self.shape, dtype=np.finfo(self.dtype).dtype)
+        for wavelength in np.atleast_1d(wavelengths):
+            for distance in np.atleast_1d(distances):
+                yield wavelength, distance, self.intensity(wavelength, distance, out=out)
+
+
+def fraunhofer(aperture, dx, wavelength, distance):
+    """Intensitatea în câmp îndepărtat: (coordonatele pe ecran per axă, |FFT(U0)|²)
+
+    Pe ecran, x = λ z fx; intensitatea este normalizată la maximul ei.
+    """
+    aperture = np.asarray(aperture)
+    spectrum = np.fft.ifftshift(aperture).astype(np.complex64)
+    _fft(spectrum, spectrum)
+    intensity = np.fft.fftshift(np.abs(spectrum) ** 2)
+    screen = [wavelength * distance * np.fft.fftshift(np.fft.fftfreq(n, dx))
+              for n in aperture.shape]
+    return screen, intensity / intensity.max()
+
+
+def slit_screen_intensity(y_screen, *, wavelength, distance, centers, width,
+                          illumination=None, n_samples=1 << 15, window=None):
+    """Intensitatea pe ecran a unor fante finite, prin spectrul unghiular (1D)
+
+    `illumination(y)` dă câmpul complex incident în planul fantelor (implicit
+    undă plană). Fereastra implicită este mult mai largă decât ecranul, ca
+    lumina difractată la unghiuri mari să nu se întoarcă periodic pe ecran
+    (fante mai înguste decât λ difractă practic în toate direcțiile).
+    """
+    y_screen = np.asarray(y_screen, dtype=float)
+    if window is None:
+        window = 32 * (np.abs(y_screen).max() + distance)
+    dx = window / n_samples
+    y = coordinates(n_samples, dx)
+    aperture = slits(y, centers, width).astype(np.complex64)
+    if illumination is not None:
+        aperture *= illumination(y)
+    propagator = AngularSpectrum(n_samples, dx)
+    intensity = propagator.set_aperture(aperture).intensity(wavelength, distance)
+    return np.interp(y_screen, y, intensity)
+
+
+def plot_diffraction(path=PLOT_FILE, wavelength=500e-9, width=10e-6, distance=1.0,
+                     orders=3):
+    """Regenerează plots/diffraction.png: fanta unică, intensitate și minime"""
+    import matplotlib.pyplot as plt
+
+    n, dx = 1 << 14, width / 64
+    (screen,), intensity = fraunhofer(slits(coordinates(n, dx), 0.0, width), dx,
+                                      wavelength, distance)
+    theta = np.degrees(np.arctan2(screen, distance))
+    visible = np.abs(theta) < 10
+    m = np.arange(-orders, orders + 1)
+    minima = np.degrees(np.arcsin(m[m != 0] * wavelength / width))
+
+    plt.style.use("seaborn-v0_8-whitegrid")
+    fig, ax = plt.subplots(figsize=(5, 3))
+    ax.plot(theta[visible], intensity[visible], color="C2")
+    for angle in minima:
+        ax.axvline(angle, color="k", ls="--", lw=0.7)
+    ax.set_xlabel(r"$\theta$ (deg)")
+    ax.set_ylabel(r"$I / I_0$")
+    ax.set_title(r"Difracție – fantă unică, minime la $a \sin\theta = m\lambda$")
+    fig.tight_layout()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerează graficul de difracție")
+    parser.add_argument("-o", "--output", type=Path, default=PLOT_FILE)
+    args = parser.parse_args()
+    print(plot_diffraction(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,24 @@
 from manim import *
 import numpy as np
 
-class DoubleSlit(Scene):
+from checkpoint import Checkpointed
+from mobjects import NumericLabel
+from physics import double_slit
+from wavefield import (
+    hit_histogram_frames,
+    hits_raster,
+    particle_trajectories,
+    screen_intensity,
+    wavefield_frames,
+)
+
+class DoubleSlit(Checkpointed, Scene):
+    # Parametri fizici suprascriși (vezi physics.double_slit)
+    params = {}
+    n_particles = 2000
+    # Număr de impacte de fotoni pe ecran; None = pattern-ul clasic cu bare
+    n_photon_hits = None
+    
     def construct(self):
         self.camera.background_color = "#0a0a0a"
         
@@ -18,22 +35,22 @@ class DoubleSlit(Scene):
         self.play(Write(formula), run_time=1)
         
         # Parametri fizici
-        wavelength = 0.5  # lungime de undă (unități arbitrare)
-        k = 2 * np.pi / wavelength  # număr de undă
-        omega = k  # frecvență angulară
-        slit_separation = 1.5
-        slit_width = 0.2
+        physics = double_slit(**self.params)
+        geometry = physics["geometry"]
+        wavelength = physics["wavelength"]  # lungime de undă (unități arbitrare)
+        slit_separation = physics["slit_separation"]
+        slit_width = physics["slit_width"]
         
         # Poziții
-        source_x = -5
-        barrier_x = -2
-        screen_x = 3
+        source_x = physics["source_x"]
+        barrier_x = physics["barrier_x"]
+        screen_x = physics["screen_x"]
         
         # === PARTEA 1: Setup experimental ===
         
         # Sursă cuantică
         source = Circle(radius=0.15, color=YELLOW, fill_opacity=0.9)
-        source.shift(LEFT * 5 + UP * 0.5)
+        source.move_to(RIGHT * source_x + UP * geometry["source"][1])
         source_glow = Circle(radius=0.25, color=YELLOW, fill_opacity=0.3, stroke_width=0)
         source_glow.move_to(source.get_center())
         source_label = Text("Sursă\nfoton", font_size=11).next_to(source, DOWN, buff=0.15)
@@ -54,7 +71,7 @@ class DoubleSlit(Scene):
             width=0.15,
             color=WHITE,
             fill_opacity=0.95
-        ).shift(LEFT * 2 + UP * 2.1)
+        ).shift(RIGHT * barrier_x + UP * 2.1)
         
         # Partea de jos a barierei
         barrier_bottom = Rectangle(
@@ -62,7 +79,7 @@ class DoubleSlit(Scene):
             width=0.15,
             color=WHITE,
             fill_opacity=0.95
-        ).shift(LEFT * 2 + DOWN * 2.1)
+        ).shift(RIGHT * barrier_x + DOWN * 2.1)
         
         # Mijlocul barierei
         barrier_middle = Rectangle(
@@ -70,21 +87,21 @@ class DoubleSlit(Scene):
             width=0.15,
             color=WHITE,
             fill_opacity=0.95
-        ).shift(LEFT * 2)
+        ).shift(RIGHT * barrier_x)
         
         # Fantele
         slit1_y = slit_separation / 2
         slit2_y = -slit_separation / 2
         
         slit1 = Line(
-            LEFT * 2 + UP * (slit1_y + slit_width/2),
-            LEFT * 2 + UP * (slit1_y - slit_width/2),
+            RIGHT * barrier_x + UP * (slit1_y + slit_width/2),
+            RIGHT * barrier_x + UP * (slit1_y - slit_width/2),
             color=BLUE,
             stroke_width=4
         )
         slit2 = Line(
-            LEFT * 2 + UP * (slit2_y + slit_width/2),
-            LEFT * 2 + UP * (slit2_y - slit_width/2),
+            RIGHT * barrier_x + UP * (slit2_y + slit_width/2),
+            RIGHT * barrier_x + UP * (slit2_y - slit_width/2),
             color=BLUE,
             stroke_width=4
         )
@@ -120,139 +137,70 @@ class DoubleSlit(Scene):
         y_range = np.linspace(-2.5, 2.5, 50)
         X, Y = np.meshgrid(x_range, y_range)
         
-        def quantum_wave_function(X, Y, t, phase_offset=0):
-            """Funcție de undă cuantică în spațiu 2D"""
-            # Distanța de la sursă
-            r = np.sqrt((X - source_x)**2 + (Y - 0.5)**2)
-            
-            # Funcția de undă sferică
-            psi = np.exp(1j * (k * r - omega * t + phase_offset)) / np.sqrt(r + 1)
-            
-            # Mascare pentru barieră
-            mask = np.ones_like(X)
-            barrier_region = (X > barrier_x - 0.1) & (X < barrier_x + 0.1)
-            
-            # Blocăm unde în afara fantelor
-            slit1_region = (Y > slit1_y - slit_width/2) & (Y < slit1_y + slit_width/2)
-            slit2_region = (Y > slit2_y - slit_width/2) & (Y < slit2_y + slit_width/2)
-            
-            mask[barrier_region & ~(slit1_region | slit2_region)] = 0
-            
-            return psi * mask
-        
-        # Animație undă
-        wave_points = VGroup()
-        n_particles = 15
-        
-        for i in range(n_particles):
-            angle = (i / n_particles) * 0.4 - 0.2
-            particle = Dot(radius=0.04, color=YELLOW, fill_opacity=0.8)
-            particle.move_to(source.get_center())
-            wave_points.add(particle)
-        
-        def update_particles(mob, dt):
-            for i, particle in enumerate(mob):
-                pos = particle.get_center()
-                if pos[0] < screen_x - 0.2:
-                    # Propagare înainte de barieră
-                    if pos[0] < barrier_x - 0.2:
-                        particle.shift(RIGHT * dt * 1.5)
-                    # Trecere prin fante
-                    elif abs(pos[0] - barrier_x) < 0.3:
-                        # Determină prin ce fantă trece
-                        if abs(pos[1] - slit1_y) < slit_width/2:
-                            particle.shift(RIGHT * dt * 1.5)
-                        elif abs(pos[1] - slit2_y) < slit_width/2:
-                            particle.shift(RIGHT * dt * 1.5)
-                    # După barieră - interferență
-                    else:
-                        particle.shift(RIGHT * dt * 1.2)
-                        # Adăugăm deviație bazată pe interferență
-                        r1 = np.sqrt((pos[0] - barrier_x)**2 + (pos[1] - slit1_y)**2)
-                        r2 = np.sqrt((pos[0] - barrier_x)**2 + (pos[1] - slit2_y)**2)
-                        phase_diff = k * (r1 - r2)
-                        deviation = 0.3 * np.sin(phase_diff) * dt
-                        particle.shift(UP * deviation)
-                else:
-                    # Reset particula
-                    angle = (i / n_particles) * 0.4 - 0.2
-                    particle.move_to(source.get_center() + UP * angle * 0.5)
+        # Precalculăm tot: câmpul Ψ mascat și traiectoriile fotonilor
+        fps = config.frame_rate
+        duration = 3
+        n_frames = int(duration * fps) + 1
+        times = np.arange(n_frames) / fps
+        
+        psi_frames = wavefield_frames(X, Y, times, **geometry)
+        field_alpha = np.clip(np.abs(psi_frames.real) * 255, 0, 160).astype(np.uint8)
+        trajectories = particle_trajectories(
+            self.n_particles, n_frames, 1 / fps,
+            screen_x=screen_x, **geometry
+        )
         
-        wave_points.add_updater(update_particles)
-        self.add(wave_points)
-        self.wait(3)
-        wave_points.clear_updaters()
-        self.play(FadeOut(wave_points), run_time=0.5)
+        # Câmpul Ψ ca o singură imagine (rândul 0 = sus)
+        field_pixels = np.zeros((len(y_range), len(x_range), 4), dtype=np.uint8)
+        field_pixels[..., :3] = (80, 140, 255)
+        field_pixels[..., 3] = field_alpha[0, ::-1]
+        field_image = ImageMobject(field_pixels)
+        field_image.stretch_to_fit_width(x_range[-1] - x_range[0])
+        field_image.stretch_to_fit_height(y_range[-1] - y_range[0])
+        field_image.move_to(RIGHT * (x_range[0] + x_range[-1]) / 2)
+        
+        # Toți fotonii într-un singur nor de puncte
+        wave_points = PMobject(stroke_width=4)
+        wave_points.add_points(
+            np.column_stack([trajectories[0], np.zeros(self.n_particles)]),
+            color=YELLOW,
+            alpha=0.8
+        )
         
-        # === PARTEA 3: Pattern de interferență cuantică ===
+        t_tracker = ValueTracker(0)
         
-        # Calcul probabilitate cuantică |Ψ|²
-        y_screen = np.linspace(-2.5, 2.5, 80)
-        intensities = []
+        def frame_index():
+            return min(int(round(t_tracker.get_value() * fps)), n_frames - 1)
         
-        for y in y_screen:
-            # Distanțe de la fante la punct
-            r1 = np.sqrt((screen_x - barrier_x)**2 + (y - slit1_y)**2)
-            r2 = np.sqrt((screen_x - barrier_x)**2 + (y - slit2_y)**2)
-            
-            # Funcții de undă de la fiecare fantă
-            psi1 = np.exp(1j * k * r1) / np.sqrt(r1)
-            psi2 = np.exp(1j * k * r2) / np.sqrt(r2)
-            
-            # Superpoziție cuantică
-            psi_total = psi1 + psi2
-            
-            # Densitate de probabilitate
-            intensity = np.abs(psi_total)**2
-            intensities.append(intensity)
+        def update_field(mob):
+            mob.pixel_array[..., 3] = field_alpha[frame_index(), ::-1]
         
-        # Normalizare
-        intensities = np.array(intensities)
-        intensities = intensities / np.max(intensities)
+        def update_particles(mob):
+            mob.points[:, :2] = trajectories[frame_index()]
         
-        # Creăm pattern-ul vizual
-        dots = VGroup()
-        bars = VGroup()
+        field_image.add_updater(update_field)
+        wave_points.add_updater(update_particles)
+        self.add(field_image, wave_points)
+        self.play(t_tracker.animate.set_value(duration), rate_func=linear, run_time=duration)
+        field_image.clear_updaters()
+        wave_points.clear_updaters()
+        self.play(FadeOut(field_image), FadeOut(wave_points), run_time=0.5)
         
-        for i, (y, intensity) in enumerate(zip(y_screen, intensities)):
-            # Punct pe ecran
-            dot = Dot(
-                point=RIGHT * screen_x + UP * y,
-                radius=0.04,
-                color=YELLOW,
-                fill_opacity=intensity
-            )
-            dots.add(dot)
-            
-            # Bare de intensitate
-            if i % 3 == 0:
-                bar = Rectangle(
-                    height=0.08,
-                    width=intensity * 0.8,
-                    color=YELLOW,
-                    fill_opacity=0.7,
-                    stroke_width=0
-                ).next_to(RIGHT * screen_x + UP * y, RIGHT, buff=0)
-                bars.add(bar)
+        # === PARTEA 3: Pattern de interferență cuantică ===
         
-        self.play(
-            *[FadeIn(dot) for dot in dots],
-            lag_ratio=0.01,
-            run_time=2
-        )
-        self.play(
-            *[Create(bar) for bar in bars],
-            lag_ratio=0.01,
-            run_time=1.5
-        )
+        # Probabilitate cuantică |Ψ|², normalizată
+        y_screen = physics["y_screen"]
+        intensities = physics["intensity"]
+        
+        if self.n_photon_hits:
+            self.play_photon_hits(geometry, screen_x)
+        else:
+            self.play_intensity_pattern(y_screen, intensities, screen_x)
         
         # === PARTEA 4: Etichetare și explicații ===
         
         # Maxime și minime
-        max_indices = []
-        for i in range(1, len(intensities) - 1):
-            if intensities[i] > 0.7 and intensities[i] > intensities[i-1] and intensities[i] > intensities[i+1]:
-                max_indices.append(i)
+        max_indices = physics["maxima"]
         
         if len(max_indices) > 2:
             mid_max = max_indices[len(max_indices)//2]
@@ -290,5 +238,75 @@ class DoubleSlit(Scene):
         self.play(Write(explanation), run_time=2)
         
         self.wait(3)
+    
+    def play_intensity_pattern(self, y_screen, intensities, screen_x):
+        # Creăm pattern-ul vizual
+        dots = VGroup()
+        bars = VGroup()
+        
+        for i, (y, intensity) in enumerate(zip(y_screen, intensities)):
+            # Punct pe ecran
+            dot = Dot(
+                point=RIGHT * screen_x + UP * y,
+                radius=0.04,
+                color=YELLOW,
+                fill_opacity=intensity
+            )
+            dots.add(dot)
             
-            
\ No newline at end of file
+            # Bare de intensitate
+            if i % 3 == 0:
+                bar = Rectangle(
+                    height=0.08,
+                    width=intensity * 0.8,
+                    color=YELLOW,
+                    fill_opacity=0.7,
+                    stroke_width=0
+                ).next_to(RIGHT * screen_x + UP * y, RIGHT, buff=0)
+                bars.add(bar)
+        
+        self.play(
+            *[FadeIn(dot) for dot in dots],
+            lag_ratio=0.01,
+            run_time=2
+        )
+        self.play(
+            *[Create(bar) for bar in bars],
+            lag_ratio=0.01,
+            run_time=1.5
+        )
+    
+    def play_photon_hits(self, geometry, screen_x, run_time=3.5):
+        # Acumulare foton cu foton: impactele intră într-o histogramă cu
+        # bin-uri fixe, afișată ca o singură imagine
+        fps = config.frame_rate
+        n_frames = int(run_time * fps) + 1
+        y_fine = np.linspace(-2.5, 2.5, 2048)
+        density = screen_intensity(y_fine, screen_x=screen_x, **geometry)
+        hist_frames = hit_histogram_frames(self.n_photon_hits, n_frames, y_fine, density)
+        
+        pixels = hits_raster(hist_frames[0])
+        hits_image = ImageMobject(pixels)
+        hits_image.set_resampling_algorithm(RESAMPLING_ALGORITHMS["nearest"])
+        hits_image.stretch_to_fit_width(0.9)
+        hits_image.stretch_to_fit_height(y_fine[-1] - y_fine[0])
+        hits_image.next_to(RIGHT * screen_x, RIGHT, buff=0)
+        
+        hits_tracker = ValueTracker(0)
+        # Contorul este asamblat din glife cache-uite, fără LaTeX per cadru
+        counter = NumericLabel("{hits:d}", font_size=20, color=YELLOW, hits=0)
+        counter.next_to(hits_image, UP, buff=0.1)
+        hit_counts = hist_frames.sum(axis=1)
+        
+        def update_hits(mob):
+            i = min(int(round(hits_tracker.get_value() * fps)), n_frames - 1)
+            hits_raster(hist_frames[i], out=mob.pixel_array)
+            counter.set_value(hits=int(hit_counts[i]))
+        
+        hits_image.add_updater(update_hits)
+        self.add(hits_image, counter)
+        self.play(hits_tracker.animate.set_value(run_time), rate_func=linear, run_time=run_time)
+        hits_image.clear_updaters()
+
+class DoubleSlitPhotonHits(DoubleSlit):
+    n_photon_hits = 10**6
@@ -0,0 +1,240 @@
+import argparse
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+
+from physics import double_slit, interference, interference_harmonic, interference_solver
+from wavefield import quantum_field
+
+# Export headless al animațiilor de câmp: aceleași date ca în scene (Re Ψ din
+# Interference, Ψ / |Ψ|² din DoubleSlit), dar fără Manim și fără mobject-uri.
+# Fiecare cadru este calculat într-un buffer refolosit, colorat printr-un LUT
+# precalculat și scris imediat într-un pipe ffmpeg (video) sau într-un .npy
+# mapat în memorie, deci memoria nu crește cu numărul de cadre.
+#
+#   python export_frames.py Interference interference.mp4 --duration 10 --width 1080
+#   python export_frames.py DoubleSlit psi.npy --raw -p wavelength=0.3
+#   python export_frames.py Interference fdtd.mp4 -p solver='"fdtd"'
+
+ROOT = Path(__file__).resolve().parent.parent
+OUTPUT_DIR = ROOT / "media_output" / "frames"
+
+# Puncte de control (poziție în [0, 1], RGB) ale hărților de culori
+COLORMAPS = {
+    # Câmp cu semn: albastru (negativ) - negru - galben (pozitiv)
+    "field": [(0.0, (80, 140, 255)), (0.5, (10, 10, 10)), (1.0, (255, 220, 60))],
+    # Intensitate: negru - albastru - alb
+    "intensity": [(0.0, (10, 10, 10)), (0.5, (40, 90, 220)), (1.0, (255, 255, 255))],
+}
+
+
+def colormap_lut(name="field", size=256):
+    """Tabelul (size, 3) uint8 al unei hărți de culori, interpolat liniar"""
+    positions, colors = zip(*COLORMAPS[name])
+    samples = np.linspace(0, 1, size)
+    return np.stack([
+        np.interp(samples, positions, channel) for channel in np.transpose(colors)
+    ], axis=-1).round().astype(np.uint8)
+
+
+class Colorizer:
+    """Valori (H, W) -> imagine RGB (H, W, 3) uint8 printr-un LUT, în buffere prealocate"""
+
+    def __init__(self, shape, vmin, vmax, lut):
+        self.lut = lut
+        self.vmin = vmin
+        self.scale = (len(lut) - 1) / (vmax - vmin)
+        self._scaled = np.empty(shape, dtype=np.float32)
+        self._index = np.empty(shape, dtype=np.intp)
+        self._rgb = np.empty(tuple(shape) + (3,), dtype=np.uint8)
+
+    def __call__(self, values):
+        np.subtract(values, self.vmin, out=self._scaled)
+        self._scaled *= self.scale
+        np.clip(self._scaled, 0, len(self.lut) - 1, out=self._scaled)
+        np.copyto(self._index, self._scaled, casting="unsafe")
+        return np.take(self.lut, self._index, axis=0, out=self._rgb)
+
+
+class NpyWriter:
+    """Stivă de cadre (n_frames, ...) într-un .npy mapat în memorie"""
+
+    def __init__(self, path, n_frames, frame_shape, dtype):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._frames = np.lib.format.open_memmap(
+            self.path, mode="w+", dtype=dtype, shape=(n_frames,) + tuple(frame_shape))
+        self._count = 0
+
+    def write(self, frame):
+        self._frames[self._count] = frame
+        self._count += 1
+
+    def close(self):
+        self._frames.flush()
+        del self._frames
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class FFmpegWriter:
+    """Cadre RGB brute trimise prin stdin către ffmpeg (libx264)"""
+
+    def __init__(self, path, width, height, fps, crf=18):
+        executable = shutil.which("ffmpeg")
+        if executable is None:
+            raise RuntimeError("ffmpeg nu este instalat; folosiți un fișier .npy")
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._process = subprocess.Popen([
+            executable, "-y", "-loglevel", "error",
+            "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{width}x{height}", "-r", str(fps),
+            "-i", "-",
+            "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", str(crf), str(self.path),
+        ], stdin=subprocess.PIPE)
+
+    def write(self, frame):
+        self._process.stdin.write(np.ascontiguousarray(frame).data)
+
+    def close(self):
+        self._process.stdin.close()
+        if self._process.wait():
+            raise RuntimeError(f"ffmpeg a eșuat (cod {self._process.returncode})")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _grid(x_range, y_range, width):
+    """Grila pixelilor (rândul 0 = sus), cu înălțimea din raportul domeniului; dimensiuni pare"""
+    height = int(round(width * (y_range[1] - y_range[0]) / (x_range[1] - x_range[0])))
+    width, height = width + width % 2, height + height % 2
+    x = np.linspace(*x_range, width)
+    y = np.linspace(y_range[1], y_range[0], height)
+    return np.meshgrid(x, y)
+
+
+def interference_frames(times, width=720, **params):
+    """Re Ψ din Interference pe cadrele `times`; (generator, vmin, vmax, hartă)"""
+    physics = interference(**params, simulate=False)
+    extent = physics["extent"]
+    X, Y = _grid((-extent, extent), (-extent, extent), width)
+    if physics["solver"] == "fdtd":
+        # Rezolvitorul (cu firele lui) există doar cât rulează generatorul;
+        # se închide și dacă exportul se oprește înainte de ultimul cadru
+        def frames():
+            solver = interference_solver(physics)
+            try:
+                solver.run_until(physics["t_start"])
+                start = solver.time
+                cells = np.ravel_multi_index(solver.sampler(X, Y), solver.field.shape)
+                out = np.empty(X.shape, dtype=solver.dtype)
+                for t in times:
+                    solver.run_until(start + t)
+                    yield np.take(solver.field, cells, out=out)
+            finally:
+                solver.close()
+
+        vmax = 2 * physics["amplitude"]
+    else:
+        field = interference_harmonic(X, Y, **physics["wave"])
+        out = np.empty(X.shape)
+        frames = lambda: (field.real(t, out=out) for t in times)
+        vmax = float(np.abs(field.amplitude).max())
+    return frames(), -vmax, vmax, "field"
+
+
+def double_slit_frames(times, width=960, quantity="real", **params):
+    """Ψ din DoubleSlit (quantity="real": Re Ψ, "probability": |Ψ|²)"""
+    physics = double_slit(**params)
+    X, Y = _grid((-6.0, 4.0), (-2.5, 2.5), width)
+    field = quantum_field(X, Y, **physics["geometry"])
+    peak = float(np.abs(field.amplitude).max())
+    if quantity == "probability":
+        probability = np.abs(field.amplitude) ** 2
+        # |A e^{-iωt}|² nu depinde de timp: același cadru pentru toate momentele
+        return (probability for _ in times), 0.0, peak**2, "intensity"
+    out = np.empty(X.shape)
+    return (field.real(t, out=out) for t in times), -peak, peak, "field"
+
+
+SOURCES = {
+    "Interference": interference_frames,
+    "DoubleSlit": double_slit_frames,
+}
+
+
+def export(scene_name, path, duration=5.0, fps=30, raw=False, **options):
+    """Scrie animația câmpului în `path` (.npy sau video); întoarce (cale, număr de cadre)
+
+    Cu raw=True (doar .npy) se păstrează valorile câmpului (float32), fără
+    culori. `options` ajung la sursa scenei (width, quantity, parametri fizici).
+    """
+    path = Path(path)
+    if raw and path.suffix != ".npy":
+        raise ValueError("raw=True cere un fișier .npy")
+    times = np.arange(int(round(duration * fps))) / fps
+    if not len(times):
+        raise ValueError(f"niciun cadru pentru duration={duration} și fps={fps}")
+    frames, vmin, vmax, colormap = SOURCES[scene_name](times, **options)
+    # Închiderea generatorului eliberează și rezolvitorul FDTD dacă scrierea eșuează
+    try:
+        first = next(frames)
+        shape = first.shape
+        colorize = Colorizer(shape, vmin, vmax, colormap_lut(colormap))
+
+        if path.suffix == ".npy":
+            writer = NpyWriter(path, len(times), shape if raw else shape + (3,),
+                               np.float32 if raw else np.uint8)
+        else:
+            writer = FFmpegWriter(path, shape[1], shape[0], fps)
+
+        with writer:
+            writer.write(first if raw else colorize(first))
+            for frame in frames:
+                writer.write(frame if raw else colorize(frame))
+    finally:
+        frames.close()
+    return path, len(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Exportă cadrele unui câmp fără Manim")
+    parser.add_argument("scene", choices=sorted(SOURCES))
+    parser.add_argument("output", type=Path, help=f".npy sau video (relativ la {OUTPUT_DIR})")
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--width", type=int, default=None, help="lățimea cadrului (pixeli)")
+    parser.add_argument("--raw", action="store_true", help="valorile câmpului, fără culori (.npy)")
+    parser.add_argument("--quantity", choices=("real", "probability"), default=None,
+                        help="DoubleSlit: Re Ψ sau |Ψ|²")
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="NUME=VALOARE",
+                        help="suprascrie un parametru fizic (valoare JSON)")
+    args = parser.parse_args()
+
+    options = {}
+    for item in args.param:
+        name, _, value = item.partition("=")
+        options[name] = json.loads(value)
+    if args.width is not None:
+        options["width"] = args.width
+    if args.quantity is not None:
+        options["quantity"] = args.quantity
+
+    path, n_frames = export(args.scene, OUTPUT_DIR / args.output, args.duration, args.fps,
+                            raw=args.raw, **options)
+    print(f"{n_frames} cadre -> {path}")
+
+
+if __name__ == "__main__":
+    main()
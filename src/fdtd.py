@@ -0,0 +1,388 @@
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+# Rezolvitor FDTD (Yee) pentru undele din WavePropagation1D și Interference,
+# calculabil fără Manim. Câmpurile sunt array-uri prealocate actualizate pe
+# loc (stencil-uri NumPy cu out=, fără temporare per pas); marginile sunt
+# straturi PML cu conductivitate graduală, iar mediul este o hartă n(x[, y])
+# plus o conductivitate opțională (absorbție).
+#
+# Unități: ε0 = 1, μ0 = 1/c², deci viteza în vid este c și n = √ε_r. Modul 2D
+# este TMz (Ez, Hx, Hy), cu Ez despărțit Berenger în Ezx + Ezy ca PML-ul să
+# absoarbă la orice unghi. Cadrele sunt produse de un generator în două
+# buffere alternative (ping-pong), deci istoria în timp nu este păstrată.
+#
+#   python fdtd.py --size 2048 --steps 1000 --workers 8     # benchmark
+
+
+def continuous(omega, amplitude=1.0, ramp=None):
+    """Sursă armonică amplitude·sin(ωt), pornită lin pe `ramp` (implicit o perioadă)"""
+    ramp = 2 * np.pi / omega if ramp is None else ramp
+
+    def waveform(t):
+        envelope = 1.0 if t >= ramp else np.sin(0.5 * np.pi * t / ramp) ** 2
+        return amplitude * envelope * np.sin(omega * t)
+    return waveform
+
+
+def gaussian_pulse(t0, width, omega=0.0, amplitude=1.0):
+    """Puls gaussian centrat în t0 (purtătoare cos ωt opțională)"""
+    def waveform(t):
+        return amplitude * np.exp(-0.5 * ((t - t0) / width) ** 2) * np.cos(omega * (t - t0))
+    return waveform
+
+
+def line_current(amplitude, omega, c=1.0):
+    """Curentul liniar care dă câmpul `amplitude` la distanța 1 de o sursă 2D în vid
+
+    |Ez|(r) = (ω μ0 I / 4) √(2 / (π k r)), k = ω / c.
+    """
+    return amplitude * 4 * c**2 / omega * np.sqrt(np.pi * omega / (2 * c))
+
+
+def _grid(values):
+    values = np.asarray(values, dtype=float)
+    step = np.diff(values)
+    if len(values) < 3 or not np.allclose(step, step[0]):
+        raise ValueError("grila FDTD trebuie să fie uniformă, cu cel puțin 3 puncte")
+    return values, float(step[0])
+
+
+def _padded(values, dx, cells):
+    """Grila extinsă cu `cells` celule PML de fiecare parte"""
+    pad = dx * np.arange(1, cells + 1)
+    return np.concatenate([values[0] - pad[::-1], values, values[-1] + pad])
+
+
+def _pml_profile(n_points, cells, dx, c, order=3, reflection=1e-6):
+    """σ/ε normalizat (1/s) pe noduri și pe pozițiile de la jumătate de pas
+
+    Profil polinomial de ordinul `order`, cu σ_max ales pentru reflexia
+    teoretică `reflection` la incidență normală.
+    """
+    if not cells:
+        return np.zeros(n_points), np.zeros(n_points - 1)
+    thickness = cells * dx
+    sigma_max = -(order + 1) * c * np.log(reflection) / (2 * thickness)
+    position = np.arange(n_points, dtype=float)
+    depth = np.maximum(cells - position, position - (n_points - 1 - cells)) / cells
+    half = position[:-1] + 0.5
+    half_depth = np.maximum(cells - half, half - (n_points - 1 - cells)) / cells
+    profile = lambda d: sigma_max * np.clip(d, 0, None) ** order
+    return profile(depth), profile(half_depth)
+
+
+def _coefficients(sigma, dt, scale, dtype):
+    """(decay, gain) pentru u ← decay·u + gain·rotor, cu σ normalizat"""
+    loss = 0.5 * sigma * dt
+    return ((1 - loss) / (1 + loss)).astype(dtype), (scale / (1 + loss)).astype(dtype)
+
+
+def _medium(values, coords, dtype=float):
+    """Harta unei proprietăți: scalar, array sau funcție de coordonate"""
+    shape = np.broadcast_shapes(*[c.shape for c in coords])
+    if callable(values):
+        values = values(*coords)
+    return np.broadcast_to(np.asarray(values, dtype=dtype), shape)
+
+
+class _Solver:
+    """Pașii de timp, sursele și generatorul de cadre, comune 1D și 2D"""
+
+    def __init__(self, dx, c, courant, dims, dtype):
+        self.c = c
+        self.dx = dx
+        self.dtype = np.dtype(dtype)
+        courant = 0.99 / np.sqrt(dims) if courant is None else courant
+        self.dt = courant * dx / c
+        self.time = 0.0
+        self.steps = 0
+        self.sources = []
+
+    @property
+    def field(self):
+        raise NotImplementedError
+
+    def _step(self):
+        raise NotImplementedError
+
+    def _inject(self, t):
+        for index, waveform, scale in self.sources:
+            self._add_source(index, scale * waveform(t))
+
+    def step(self, n=1):
+        """Avansează n pași de timp"""
+        for _ in range(n):
+            self._step()
+            self.steps += 1
+            self.time = self.steps * self.dt
+        return self
+
+    def run_until(self, t):
+        """Avansează până la primul pas cu timpul ≥ t"""
+        remaining = int(np.ceil((t - self.time) / self.dt - 1e-9))
+        return self.step(max(remaining, 0))
+
+    def frames(self, every=None, n_frames=None, region=None, stride=1):
+        """Generator de cadre (timp, câmp) la intervale `every` de timp
+
+        Fiecare cadru este copiat într-unul din două buffere alternative: un
+        cadru rămâne valid până când generatorul mai produce încă unul, deci
+        consumatorul poate citi cadrul curent în timp ce următorul se
+        calculează. `region` (slice-uri) și `stride` decupează câmpul copiat.
+        Fără n_frames, generatorul este infinit.
+        """
+        every = self.dt if every is None else every
+        view = lambda: self.field[region or ...][(slice(None, None, stride),) * self.field.ndim]
+        buffers = [np.empty_like(view()), np.empty_like(view())]
+        start, count = self.time, 0
+        while n_frames is None or count < n_frames:
+            frame = buffers[count % 2]
+            np.copyto(frame, view())
+            yield self.time, frame
+            count += 1
+            self.run_until(start + count * every)
+
+
+class FDTD1D(_Solver):
+    """Unda Ez(x, t) pe grila uniformă x, cu PML la ambele capete
+
+    index și conductivity sunt scalare, array-uri pe x sau funcții de x;
+    celulele PML se adaugă în afara grilei date și continuă mediul de la
+    margine. Sursele sunt curenți de suprafață K(t) (vezi add_source).
+    """
+
+    def __init__(self, x, index=1.0, conductivity=0.0, pml_cells=40, courant=None,
+                 c=1.0, dtype=np.float64):
+        x, dx = _grid(x)
+        super().__init__(dx, c, courant, 1, dtype)
+        self.pml_cells = pml_cells
+        self.interior = slice(pml_cells, pml_cells + len(x))
+        self.x = x
+        grid = _padded(x, dx, pml_cells)
+        n = len(grid)
+
+        index = np.pad(_medium(index, (x,)), pml_cells, mode="edge")
+        conductivity = np.pad(_medium(conductivity, (x,)), pml_cells, mode="edge")
+        self.permittivity = index**2
+        sigma, sigma_half = _pml_profile(n, pml_cells, dx, c)
+        self._ce = _coefficients(sigma + conductivity / self.permittivity, self.dt,
+                                 self.dt / (self.permittivity * dx), self.dtype)
+        self._ch = _coefficients(sigma_half, self.dt, self.dt * c**2 / dx, self.dtype)
+
+        self.E = np.zeros(n, dtype=self.dtype)
+        self.H = np.zeros(n - 1, dtype=self.dtype)
+        self._curl = np.empty(n - 1, dtype=self.dtype)
+
+    @property
+    def field(self):
+        """Ez pe grila dată (fără PML); vedere în buffer-ul solver-ului"""
+        return self.E[self.interior]
+
+    def add_source(self, x0, waveform, plane_wave=True):
+        """Sursă moale în celula cea mai apropiată de x0
+
+        Cu plane_wave=True, waveform(t) este amplitudinea undei plane emise în
+        fiecare sens (curentul de suprafață K = 2E / η, η = 1 / (c n) local);
+        altfel este chiar curentul K(t).
+        """
+        index = self.pml_cells + int(np.argmin(np.abs(self.x - x0)))
+        eps = self.permittivity[index]
+        scale = self.dt / (eps * self.dx)
+        if plane_wave:
+            scale *= 2 * self.c * np.sqrt(eps)
+        self.sources.append((index, waveform, scale))
+        return self
+
+    def _add_source(self, index, value):
+        self.E[index] += value
+
+    def _step(self):
+        decay_e, gain_e = self._ce
+        decay_h, gain_h = self._ch
+        # H ← decay·H + gain·∂E/∂x (la x + dx/2)
+        np.subtract(self.E[1:], self.E[:-1], out=self._curl)
+        self._curl *= gain_h
+        self.H *= decay_h
+        self.H += self._curl
+        # E ← decay·E + gain·∂H/∂x (nodurile interioare; capetele rămân 0)
+        curl = self._curl[:-1]
+        np.subtract(self.H[1:], self.H[:-1], out=curl)
+        curl *= gain_e[1:-1]
+        self.E[1:-1] *= decay_e[1:-1]
+        self.E[1:-1] += curl
+        self._inject(self.time + self.dt)
+
+    def sample(self, x):
+        """Ez interpolat liniar în punctele x"""
+        return np.interp(x, self.x, self.field)
+
+
+class FDTD2D(_Solver):
+    """Unda TMz Ez(x, y, t) pe grila x × y, cu PML split-field pe margini
+
+    index și conductivity sunt scalare, array-uri (ny, nx) sau funcții
+    f(X, Y). Cu workers > 1, fiecare pas este împărțit pe benzi de rânduri
+    actualizate în paralel (operațiile NumPy eliberează GIL-ul), cu o barieră
+    între actualizarea lui H și cea a lui E.
+    """
+
+    def __init__(self, x, y, index=1.0, conductivity=0.0, pml_cells=20, courant=None,
+                 c=1.0, dtype=np.float32, workers=1, tile_rows=None):
+        x, dx = _grid(x)
+        y, dy = _grid(y)
+        if not np.isclose(dx, dy):
+            raise ValueError("FDTD2D cere același pas pe x și y")
+        super().__init__(dx, c, courant, 2, dtype)
+        self.pml_cells = pml_cells
+        self.interior = (slice(pml_cells, pml_cells + len(y)), slice(pml_cells, pml_cells + len(x)))
+        self.x, self.y = x, y
+        gx, gy = _padded(x, dx, pml_cells), _padded(y, dx, pml_cells)
+        ny, nx = len(gy), len(gx)
+
+        X, Y = np.meshgrid(x, y)
+        pad = lambda values: np.pad(values, pml_cells, mode="edge")
+        self.permittivity = pad(_medium(index, (X, Y))) ** 2
+        conductivity = pad(_medium(conductivity, (X, Y))) / self.permittivity
+        sigma_x, sigma_x_half = _pml_profile(nx, pml_cells, dx, c)
+        sigma_y, sigma_y_half = _pml_profile(ny, pml_cells, dx, c)
+        gain = self.dt / (self.permittivity * dx)
+        self._cex = _coefficients(sigma_x[None, :] + conductivity, self.dt, gain, self.dtype)
+        self._cey = _coefficients(sigma_y[:, None] + conductivity, self.dt, gain, self.dtype)
+        # Pentru H σ depinde doar de x sau doar de y: coeficienți 1D, cu broadcasting
+        gain_h = self.dt * c**2 / dx
+        decay, gain_hx = _coefficients(sigma_y_half, self.dt, gain_h, self.dtype)
+        self._chx = decay[:, None], gain_hx[:, None]
+        self._chy = _coefficients(sigma_x_half, self.dt, gain_h, self.dtype)
+
+        self.Ez = np.zeros((ny, nx), dtype=self.dtype)
+        self.Ezx = np.zeros((ny, nx), dtype=self.dtype)
+        self.Ezy = np.zeros((ny, nx), dtype=self.dtype)
+        self.Hx = np.zeros((ny - 1, nx), dtype=self.dtype)
+        self.Hy = np.zeros((ny, nx - 1), dtype=self.dtype)
+
+        # Benzi de rânduri, fiecare cu buffer-ele ei de lucru
+        workers = max(1, int(workers))
+        tile_rows = tile_rows or -(-ny // workers)
+        bounds = list(range(0, ny, tile_rows)) + [ny]
+        self._tiles = [
+            (start, stop, np.empty((stop - start, nx), dtype=self.dtype))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+        ]
+        self._pool = ThreadPoolExecutor(workers) if workers > 1 and len(self._tiles) > 1 else None
+
+    @property
+    def field(self):
+        """Ez pe grila dată (fără PML), forma (ny, nx); vedere în buffer-ul solver-ului"""
+        return self.Ez[self.interior]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def add_source(self, x0, y0, waveform):
+        """Sursă liniară moale în celula cea mai apropiată de (x0, y0)
+
+        waveform(t) este curentul liniar I(t); vezi line_current pentru
+        amplitudinea câmpului la distanța 1.
+        """
+        i = self.pml_cells + int(np.argmin(np.abs(self.x - x0)))
+        j = self.pml_cells + int(np.argmin(np.abs(self.y - y0)))
+        scale = self.dt / (self.permittivity[j, i] * self.dx**2)
+        self.sources.append(((j, i), waveform, scale))
+        return self
+
+    def _add_source(self, index, value):
+        # Curentul intră în ambele componente split, jumătate în fiecare
+        self.Ezx[index] += 0.5 * value
+        self.Ezy[index] += 0.5 * value
+        self.Ez[index] += value
+
+    def _update_h(self, start, stop, scratch):
+        stop_x = min(stop, self.Hx.shape[0])
+        decay, gain = self._chx
+        if stop_x > start:
+            rows = slice(start, stop_x)
+            curl = scratch[:stop_x - start]
+            np.subtract(self.Ez[start + 1:stop_x + 1], self.Ez[rows], out=curl)
+            curl *= gain[rows]
+            self.Hx[rows] *= decay[rows]
+            self.Hx[rows] -= curl
+        decay, gain = self._chy
+        curl = scratch[:, :-1]
+        np.subtract(self.Ez[start:stop, 1:], self.Ez[start:stop, :-1], out=curl)
+        curl *= gain
+        self.Hy[start:stop] *= decay
+        self.Hy[start:stop] += curl
+
+    def _update_e(self, start, stop, scratch):
+        # Doar nodurile interioare; marginea exterioară a PML-ului rămâne 0
+        start, stop = max(start, 1), min(stop, self.Ez.shape[0] - 1)
+        if stop <= start:
+            return
+        rows, inner = slice(start, stop), slice(1, -1)
+        curl = scratch[:stop - start, 1:-1]
+        decay, gain = self._cex
+        np.subtract(self.Hy[rows, 1:], self.Hy[rows, :-1], out=curl)
+        curl *= gain[rows, inner]
+        self.Ezx[rows, inner] *= decay[rows, inner]
+        self.Ezx[rows, inner] += curl
+        decay, gain = self._cey
+        np.subtract(self.Hx[rows, inner], self.Hx[start - 1:stop - 1, inner], out=curl)
+        curl *= gain[rows, inner]
+        self.Ezy[rows, inner] *= decay[rows, inner]
+        self.Ezy[rows, inner] -= curl
+        np.add(self.Ezx[rows], self.Ezy[rows], out=self.Ez[rows])
+
+    def _run_tiles(self, update):
+        if self._pool is None:
+            for tile in self._tiles:
+                update(*tile)
+        else:
+            list(self._pool.map(lambda tile: update(*tile), self._tiles))
+
+    def _step(self):
+        self._run_tiles(self._update_h)
+        self._run_tiles(self._update_e)
+        self._inject(self.time + self.dt)
+
+    def sampler(self, x, y):
+        """Indicii (rând, coloană) ai celulelor celor mai apropiate de punctele (x, y)
+
+        Un cadru `frame` de pe grila dată se eșantionează apoi cu frame[indici].
+        """
+        columns = np.clip(np.rint((np.asarray(x) - self.x[0]) / self.dx), 0, len(self.x) - 1)
+        rows = np.clip(np.rint((np.asarray(y) - self.y[0]) / self.dx), 0, len(self.y) - 1)
+        return rows.astype(int), columns.astype(int)
+
+
+def benchmark(size=2048, steps=1000, workers=1, dtype=np.float32):
+    """Timpul per pas pe o grilă size × size cu o sursă armonică în centru"""
+    axis = np.arange(size, dtype=float)
+    solver = FDTD2D(axis, axis, workers=workers, dtype=dtype)
+    solver.add_source(size / 2, size / 2, continuous(2 * np.pi / 20))
+    start = time.perf_counter()
+    solver.step(steps)
+    elapsed = time.perf_counter() - start
+    solver.close()
+    return dict(size=size, steps=steps, workers=workers, seconds=elapsed,
+                cells_per_second=size**2 * steps / elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pentru rezolvitorul FDTD 2D")
+    parser.add_argument("--size", type=int, default=2048)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    args = parser.parse_args()
+    result = benchmark(args.size, args.steps, args.workers)
+    print(f"{result['size']}² × {result['steps']} pași, {result['workers']} fire: "
+          f"{result['seconds']:.1f} s ({result['cells_per_second'] / 1e6:.0f} Mcelule/s)")
+
+
+if __name__ == "__main__":
+    main()
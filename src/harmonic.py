@@ -0,0 +1,121 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from optics import superposition
+
+# Câmpuri armonice separabile în timp: Ψ(x, t) = A(x) · exp(-iωt). Amplitudinea
+# complexă A(x) (distanțe, k·r, atenuare) se calculează o singură dată per
+# geometrie; un cadru costă apoi o singură înmulțire complexă pe grilă.
+
+
+class HarmonicField:
+    """Câmp Ψ(x, t) = A(x) · exp(-iωt) cu A precalculat"""
+
+    def __init__(self, amplitude, omega):
+        self.amplitude = np.ascontiguousarray(amplitude)
+        self.omega = omega
+        # Părțile reală și imaginară separat, pentru Re(Ψ) fără temporare complexe
+        self._re = np.ascontiguousarray(self.amplitude.real)
+        self._im = np.ascontiguousarray(self.amplitude.imag)
+        self._scratch = None
+
+    @property
+    def shape(self):
+        return self.amplitude.shape
+
+    @property
+    def nbytes(self):
+        return self.amplitude.nbytes + self._re.nbytes + self._im.nbytes
+
+    def complex(self, t, out=None):
+        """Ψ la momentul t; pentru un vector de T momente forma este (T, *shape)"""
+        t = np.asarray(t, dtype=float)
+        phase = np.exp(-1j * self.omega * t).reshape(t.shape + (1,) * self.amplitude.ndim)
+        return np.multiply(self.amplitude, phase, out=out)
+
+    def real(self, t, out=None):
+        """Re(Ψ) = Re(A) cos ωt + Im(A) sin ωt, la un moment t scalar"""
+        if out is None:
+            out = np.empty(self.shape, dtype=self._re.dtype)
+        if self._scratch is None:
+            self._scratch = np.empty_like(self._im)
+        np.multiply(self._re, np.cos(self.omega * t), out=out)
+        np.multiply(self._im, np.sin(self.omega * t), out=self._scratch)
+        out += self._scratch
+        return out
+
+
+class HarmonicFieldCache:
+    """Cache LRU de câmpuri armonice, limitat la max_bytes
+
+    Cheia descrie geometria; orice schimbare de geometrie produce o cheie
+    nouă, deci câmpul vechi nu mai este folosit și iese din cache prin LRU.
+    """
+
+    def __init__(self, max_bytes=256 * 1024**2):
+        self.max_bytes = max_bytes
+        self._fields = OrderedDict()
+        self._bytes = 0
+
+    def get(self, key, build):
+        """Câmpul pentru cheie; `build()` îl calculează dacă lipsește"""
+        if key in self._fields:
+            self._fields.move_to_end(key)
+            return self._fields[key]
+
+        field = build()
+        self._fields[key] = field
+        self._bytes += field.nbytes
+        while self._bytes > self.max_bytes and len(self._fields) > 1:
+            _, old = self._fields.popitem(last=False)
+            self._bytes -= old.nbytes
+        return field
+
+    def clear(self):
+        self._fields.clear()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._fields)
+
+
+FIELD_CACHE = HarmonicFieldCache()
+
+
+def array_key(*arrays):
+    """Amprentă a unor array-uri (formă, tip și conținut), pentru chei de cache"""
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(str((array.shape, array.dtype.str)).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def point_sources(x, y, sources, k, omega, amplitudes=1.0, phases=0.0,
+                  attenuation=None, attenuation_key=None, cache=FIELD_CACHE):
+    """Câmpul armonic al unor surse punctiforme, cu A calculat o singură dată
+
+    `attenuation_key` identifică funcția de atenuare în cheia de cache; fără
+    el (și cu o atenuare dată) câmpul nu este pus în cache.
+    """
+    def build():
+        amplitude = superposition(x, y, sources, k, amplitudes=amplitudes,
+                                  phases=phases, attenuation=attenuation)
+        return HarmonicField(amplitude, omega)
+
+    if attenuation is not None and attenuation_key is None:
+        return build()
+    key = ("point_sources", array_key(x, y, sources, amplitudes, phases), k, omega,
+           attenuation_key)
+    return cache.get(key, build)
+
+
+def plane_wave(x, k, omega, E0=1.0, cache=FIELD_CACHE):
+    """Unda plană E0 sin(ωt - kx) = Re(i E0 e^{ikx} e^{-iωt})"""
+    def build():
+        return HarmonicField(1j * E0 * np.exp(1j * k * np.asarray(x, dtype=float)), omega)
+
+    return cache.get(("plane_wave", array_key(x), k, omega, E0), build)
@@ -1,7 +1,17 @@
 from manim import *
 import numpy as np
 
-class Interference(ThreeDScene):
+from checkpoint import Checkpointed
+from mobjects import LiveSurface
+from physics import interference, interference_harmonic, interference_solver
+
+class Interference(Checkpointed, ThreeDScene):
+    # Parametri fizici suprascriși (vezi physics.interference);
+    # {"solver": "fdtd"} folosește rezolvitorul numeric din fdtd.py
+    params = {}
+    # Fire pentru actualizarea FDTD pe benzi
+    fdtd_workers = 1
+    
     def construct(self):
         self.camera.background_color = "#0a0a0a"
         
@@ -31,9 +41,14 @@ class Interference(ThreeDScene):
         
         self.play(Create(axes), Write(x_label), Write(y_label), Write(z_label))
         
+        # Parametri undă
+        # În modul fdtd simularea rulează mai jos, cadru cu cadru, nu și în physics
+        physics = interference(**self.params, simulate=False)
+        wave = physics["wave"]
+        
         # Poziții surse
-        source1_pos = np.array([-1.5, 0, 0])
-        source2_pos = np.array([1.5, 0, 0])
+        source1_pos = np.append(physics["sources"][0], 0)
+        source2_pos = np.append(physics["sources"][1], 0)
         
         # Surse ca sfere
         source1 = Sphere(radius=0.15, color=YELLOW).move_to(source1_pos)
@@ -44,72 +59,79 @@ class Interference(ThreeDScene):
         
         self.play(Create(source1), Create(source2))
         
-        # Parametri undă
-        wavelength = 1.5
-        k = 2 * np.pi / wavelength
-        omega = 1.0
-        amplitude = 0.3  # Factor de amplitudine redus
-        
-        # Funcție pentru calculul interferenței
-        def interference_wave(u, v, time):
-            x = u
-            y = v
-            
-            # Distanțe de la surse
-            r1 = np.sqrt((x - source1_pos[0])**2 + (y - source1_pos[1])**2)
-            r2 = np.sqrt((x - source2_pos[0])**2 + (y - source2_pos[1])**2)
-            
-            # Unde de la fiecare sursă (cu atenuare și amplitudine redusă)
-            wave1 = amplitude * np.cos(k * r1 - omega * time) / (1 + r1 * 0.3)
-            wave2 = amplitude * np.cos(k * r2 - omega * time) / (1 + r2 * 0.3)
-            
-            # Suprapunere
-            return wave1 + wave2
-        
         # Time tracker
         time_tracker = ValueTracker(0)
         
-        # Suprafață parametrică pentru interferență
-        surface = always_redraw(
-            lambda: Surface(
-                lambda u, v: axes.c2p(u, v, interference_wave(u, v, time_tracker.get_value())),
-                u_range=[-3.5, 3.5],
-                v_range=[-3.5, 3.5],
-                resolution=(40, 40),
-                fill_opacity=0.8,
-                checkerboard_colors=[BLUE_D, BLUE_E],
-                stroke_color=BLUE,
-                stroke_width=0.5
-            )
+        # Suprafață parametrică pentru interferență: rețeaua se construiește o
+        # singură dată, la fiecare cadru se rescriu doar înălțimile
+        extent = physics["extent"]
+        surface = LiveSurface(
+            axes,
+            u_range=[-extent, extent],
+            v_range=[-extent, extent],
+            resolution=(physics["resolution"], physics["resolution"]),
+            fill_opacity=0.8,
+            checkerboard_colors=[BLUE_D, BLUE_E],
+            stroke_color=BLUE,
+            stroke_width=0.5
         )
         
-        self.play(Create(surface), run_time=2)
+        solver = None
+        if physics["solver"] == "fdtd":
+            # Cadrele vin în ordine din generatorul FDTD, după regimul tranzitoriu
+            solver = interference_solver(physics, workers=self.fdtd_workers)
+            solver.run_until(physics["t_start"])
+            start = solver.time
+            frames = solver.frames(every=1 / config.frame_rate)
+            cells = solver.sampler(surface.grid_u, surface.grid_v)
+            current = list(next(frames))
+            
+            def update_surface(mob):
+                while current[0] - start < time_tracker.get_value() - 1e-9:
+                    current[:] = next(frames)
+                mob.set_height_values(current[1][cells])
+            
+            surface.add_updater(update_surface)
+        else:
+            # Amplitudinea complexă se calculează o dată; un cadru = Re(A·e^{-iωt})
+            field = interference_harmonic(surface.grid_u, surface.grid_v, **wave)
+            heights = np.empty(field.shape)
+            surface.add_updater(
+                lambda mob: mob.set_height_values(field.real(time_tracker.get_value(), out=heights))
+            )
         
-        # Rotație camerei în timp ce unda se propagă
-        self.begin_ambient_camera_rotation(rate=0.15)
+        try:
+            surface.update()
         
-        # Animație propagare undă
-        self.play(
-            time_tracker.animate.set_value(8),
-            rate_func=linear,
-            run_time=10
-        )
+            self.play(Create(surface), run_time=2)
+        
+            # Rotație camerei în timp ce unda se propagă
+            self.begin_ambient_camera_rotation(rate=0.15)
         
-        self.stop_ambient_camera_rotation()
+            # Animație propagare undă
+            self.play(
+                time_tracker.animate.set_value(8),
+                rate_func=linear,
+                run_time=10
+            )
         
-        self.wait(2)
+            self.stop_ambient_camera_rotation()
         
-        # Explicație finală
-        explanation = VGroup(
-            Text("Pattern de interferență:", font_size=18, color=YELLOW),
-            Text("Zonele înalte = interferență constructivă", font_size=14, color=WHITE),
-            Text("Zonele joase = interferență destructivă", font_size=14, color=WHITE)
-        ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
+            self.wait(2)
         
-        explanation.to_corner(DL)
-        self.add_fixed_in_frame_mobjects(explanation)
-        self.play(Write(explanation))
+            # Explicație finală
+            explanation = VGroup(
+                Text("Pattern de interferență:", font_size=18, color=YELLOW),
+                Text("Zonele înalte = interferență constructivă", font_size=14, color=WHITE),
+                Text("Zonele joase = interferență destructivă", font_size=14, color=WHITE)
+            ).arrange(DOWN, aligned_edge=LEFT, buff=0.2)
         
-        self.wait(2)
+            explanation.to_corner(DL)
+            self.add_fixed_in_frame_mobjects(explanation)
+            self.play(Write(explanation))
         
-      
\ No newline at end of file
+            self.wait(2)
+        finally:
+            # Cu fdtd_workers > 1 solver-ul ține un pool de fire
+            if solver is not None:
+                solver.close()
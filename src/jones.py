@@ -0,0 +1,256 @@
+import argparse
+from functools import reduce
+from pathlib import Path
+
+import numpy as np
+
+# Calcul Jones (2×2 complex) și Mueller (4×4 real) vectorizat cu NumPy. Toate
+# matricele au forma (..., 2, 2) sau (..., 4, 4): dimensiunile din față sunt
+# configurații (unghiuri, lungimi de undă etc.) și se combină prin
+# broadcasting, deci un lanț evaluat pe 10^6 configurații costă câte un
+# produs matricial batch per element, fără bucle Python peste configurații.
+#
+# Unghiurile sunt în radiani, măsurate de la axa x; defazajele (retardance)
+# sunt în radiani. Stokes: S0 = |Ex|² + |Ey|², S1 = |Ex|² - |Ey|²,
+# S2 = 2 Re(Ex* Ey), S3 = 2 Im(Ex* Ey).
+
+ROOT = Path(__file__).resolve().parent.parent
+PLOT_FILE = ROOT / "plots" / "poincare_static.png"
+
+# Stokes = A · (E ⊗ E*)
+_A = np.array([
+    [1, 0, 0, 1],
+    [1, 0, 0, -1],
+    [0, 1, 1, 0],
+    [0, 1j, -1j, 0],
+])
+_A_INV = np.linalg.inv(_A)
+# M = Re(A (J ⊗ J*) A⁻¹) ca o singură aplicație liniară pe produsele J_ij J*_kl
+_TO_MUELLER = np.einsum(
+    "pik,jlq->ijklpq", _A.reshape(4, 2, 2), _A_INV.reshape(2, 2, 4)
+).reshape(16, 16)
+
+
+def _matrix(a, b, c, d):
+    """Matricea [[a, b], [c, d]] cu forma broadcast(a, b, c, d) + (2, 2)"""
+    a, b, c, d = np.broadcast_arrays(a, b, c, d)
+    out = np.empty(a.shape + (2, 2), dtype=np.result_type(a, b, c, d, np.complex64))
+    out[..., 0, 0] = a
+    out[..., 0, 1] = b
+    out[..., 1, 0] = c
+    out[..., 1, 1] = d
+    return out
+
+
+def compose(a, b):
+    """Produsul batch a · b al unor matrice 2×2
+
+    Scris pe componente: pentru matrice 2×2 este de câteva ori mai rapid decât
+    np.matmul, care iterează câte o matrice mică pe rând.
+    """
+    a, b = np.asarray(a), np.asarray(b)
+    a00, a01, a10, a11 = a[..., 0, 0], a[..., 0, 1], a[..., 1, 0], a[..., 1, 1]
+    b00, b01, b10, b11 = b[..., 0, 0], b[..., 0, 1], b[..., 1, 0], b[..., 1, 1]
+    return _matrix(a00 * b00 + a01 * b10, a00 * b01 + a01 * b11,
+                   a10 * b00 + a11 * b10, a10 * b01 + a11 * b11)
+
+
+def rotator(theta):
+    """Rotator optic: rotește polarizarea cu θ"""
+    c, s = np.cos(theta), np.sin(theta)
+    return _matrix(c, -s, s, c)
+
+
+def rotated(matrix, theta):
+    """Elementul `matrix` cu axele rotite cu θ: R(θ) M R(-θ)"""
+    return compose(compose(rotator(theta), matrix), rotator(np.negative(theta)))
+
+
+def linear_element(theta, tx=1.0, ty=1.0, retardance=0.0):
+    """Element liniar general: R(θ) diag(tx, ty e^{iδ}) R(-θ)
+
+    tx, ty sunt transmisiile de amplitudine pe axa elementului și
+    perpendicular pe ea, δ defazajul axei lente. Polarizorii și lamele de
+    undă sunt cazuri particulare, deci un lanț mixt se construiește într-un
+    singur apel, cu câte o valoare per element.
+    """
+    c, s = np.cos(theta), np.sin(theta)
+    slow = np.asarray(ty) * np.exp(1j * np.asarray(retardance))
+    tx = np.asarray(tx)
+    return _matrix(tx * c**2 + slow * s**2, (tx - slow) * c * s,
+                   (tx - slow) * c * s, tx * s**2 + slow * c**2)
+
+
+def partial_polarizer(theta, tx=1.0, ty=0.0):
+    """Polarizor parțial cu transmisiile de amplitudine tx (pe axă) și ty"""
+    c, s = np.cos(theta), np.sin(theta)
+    tx, ty = np.asarray(tx), np.asarray(ty)
+    return _matrix(tx * c**2 + ty * s**2, (tx - ty) * c * s,
+                   (tx - ty) * c * s, tx * s**2 + ty * c**2)
+
+
+def linear_polarizer(theta):
+    """Polarizor liniar ideal cu axa de transmisie la θ"""
+    return partial_polarizer(theta, 1.0, 0.0)
+
+
+def waveplate(theta, retardance):
+    """Lamă de undă cu axa rapidă la θ și defazajul δ dat (rad)"""
+    c, s = np.cos(theta), np.sin(theta)
+    phase = np.exp(1j * np.asarray(retardance))
+    return _matrix(c**2 + phase * s**2, (1 - phase) * c * s,
+                   (1 - phase) * c * s, s**2 + phase * c**2)
+
+
+def half_wave_plate(theta):
+    return waveplate(theta, np.pi)
+
+
+def quarter_wave_plate(theta):
+    return waveplate(theta, np.pi / 2)
+
+
+def retardance(birefringence, thickness, wavelength):
+    """Defazajul δ = 2π Δn d / λ al unei lame, pe un vector de lungimi de undă"""
+    return 2 * np.pi * np.asarray(birefringence) * thickness / np.asarray(wavelength)
+
+
+def elliptical_state(psi, chi=0.0, intensity=1.0):
+    """Vectorul Jones cu azimutul ψ și elipticitatea χ (χ = ±π/4: circular)"""
+    psi, chi, intensity = np.broadcast_arrays(psi, chi, intensity)
+    amplitude = np.sqrt(intensity)
+    major, minor = amplitude * np.cos(chi), 1j * amplitude * np.sin(chi)
+    c, s = np.cos(psi), np.sin(psi)
+    return np.stack([c * major - s * minor, s * major + c * minor], axis=-1)
+
+
+def linear_state(psi, intensity=1.0):
+    return elliptical_state(psi, 0.0, intensity)
+
+
+def system(*elements):
+    """Matricea totală a elementelor străbătute în ordine: M_N ··· M_2 M_1"""
+    return reduce(lambda total, element: compose(element, total), elements)
+
+
+def apply(matrix, vector):
+    """M · E pe ultimele axe, cu broadcasting pe configurații"""
+    return np.einsum("...ij,...j->...i", matrix, vector)
+
+
+def propagate(elements, vector):
+    """Vectorii Jones după fiecare element, stivuiți pe axa -2: (..., N, 2)"""
+    states = []
+    for element in elements:
+        vector = apply(element, vector)
+        states.append(vector)
+    return np.stack(np.broadcast_arrays(*states), axis=-2)
+
+
+def intensity(vector):
+    return np.sum(np.abs(vector) ** 2, axis=-1)
+
+
+def stokes(vector):
+    """Vectorul Stokes (..., 4) al unui vector Jones (..., 2)"""
+    ex, ey = vector[..., 0], vector[..., 1]
+    cross = np.conj(ex) * ey
+    return np.stack([
+        np.abs(ex) ** 2 + np.abs(ey) ** 2,
+        np.abs(ex) ** 2 - np.abs(ey) ** 2,
+        2 * cross.real,
+        2 * cross.imag,
+    ], axis=-1)
+
+
+def poincare(stokes_vector):
+    """Punctul pe sfera Poincaré (S1, S2, S3) / S0; NaN pentru S0 = 0"""
+    stokes_vector = np.asarray(stokes_vector)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return stokes_vector[..., 1:] / stokes_vector[..., :1]
+
+
+def ellipse(stokes_vector):
+    """Azimutul ψ și elipticitatea χ ale părții polarizate"""
+    s0, s1, s2, s3 = np.moveaxis(np.asarray(stokes_vector), -1, 0)
+    polarized = np.sqrt(s1**2 + s2**2 + s3**2)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        chi = 0.5 * np.arcsin(np.clip(s3 / polarized, -1, 1))
+    return 0.5 * np.arctan2(s2, s1), chi
+
+
+def mueller(jones_matrix):
+    """Matricea Mueller (..., 4, 4) a unui element nedepolarizant"""
+    jones_matrix = np.asarray(jones_matrix)
+    batch = jones_matrix.shape[:-2]
+    flat = jones_matrix.reshape(-1, 4)
+    products = (flat[:, :, None] * np.conj(flat)[:, None, :]).reshape(-1, 16)
+    return np.real(products @ _TO_MUELLER).reshape(batch + (4, 4))
+
+
+def depolarizer(fraction):
+    """Depolarizor parțial: păstrează S0 și reduce partea polarizată cu `fraction`"""
+    fraction = np.asarray(fraction, dtype=float)
+    out = np.zeros(fraction.shape + (4, 4))
+    out[..., 0, 0] = 1
+    for i in (1, 2, 3):
+        out[..., i, i] = 1 - fraction
+    return out
+
+
+def unpolarized(intensity=1.0):
+    """Vectorul Stokes al luminii nepolarizate"""
+    intensity = np.asarray(intensity, dtype=float)
+    out = np.zeros(intensity.shape + (4,))
+    out[..., 0] = intensity
+    return out
+
+
+def apply_mueller(matrix, stokes_vector):
+    return np.einsum("...ij,...j->...i", matrix, stokes_vector)
+
+
+def plot_poincare(path=PLOT_FILE):
+    """Regenerează plots/poincare_static.png"""
+    import matplotlib.pyplot as plt
+
+    states = [
+        (0.0, 0.0, "r", r"$\psi = 0°, \chi = 0°$"),
+        (45.0, 0.0, "g", r"$\psi = 45°, \chi = 0°$"),
+        (90.0, 0.0, "b", r"$\psi = 90°, \chi = 0°$"),
+        (0.0, 22.5, "m", r"$\psi = 0°, \chi = 22.5°$"),
+    ]
+    psi, chi = np.radians([s[0] for s in states]), np.radians([s[1] for s in states])
+    points = poincare(stokes(elliptical_state(psi, chi)))
+
+    u, v = np.meshgrid(np.linspace(0, 2 * np.pi, 60), np.linspace(0, np.pi, 30))
+    plt.style.use("seaborn-v0_8-whitegrid")
+    fig = plt.figure(figsize=(6, 5))
+    ax = fig.add_subplot(projection="3d")
+    ax.plot_surface(np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v),
+                    color="grey", alpha=0.15, edgecolor="k", linewidth=0.3)
+    for (s1, s2, s3), (_, _, color, label) in zip(points, states):
+        ax.scatter(s1, s2, s3, color=color, s=80, label=label, depthshade=False)
+    ax.set_xlabel(r"$S_1$")
+    ax.set_ylabel(r"$S_2$")
+    ax.set_zlabel(r"$S_3$")
+    ax.set_box_aspect((1, 1, 1))
+    ax.set_title("Sfera Poincaré – polarizare")
+    ax.legend(loc="lower left")
+    fig.tight_layout()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=300)
+    plt.close(fig)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerează graficul sferei Poincaré")
+    parser.add_argument("-o", "--output", type=Path, default=PLOT_FILE)
+    args = parser.parse_args()
+    print(plot_poincare(args.output))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,459 @@
+from manim import *
+import numpy as np
+import string
+from collections import OrderedDict
+
+import jones
+import spectral
+
+# Componente Manim refolosibile pentru scenele animate. Spre deosebire de
+# always_redraw, care reconstruiește mobject-ul la fiecare cadru, acestea
+# construiesc geometria o singură dată și actualizează doar array-urile.
+
+
+class LiveSurface(Surface):
+    """Suprafață z = f(u, v) cu topologia construită o singură dată
+
+    Punctele tuturor fețelor sunt vederi într-un singur buffer de forma
+    (fețe, puncte, 3). La fiecare cadru câmpul este evaluat vectorizat pe
+    punctele (u, v) distincte ale rețelei și se rescrie doar componenta z,
+    fără a recrea fețele, culorile sau conturul.
+    """
+
+    def __init__(self, axes, u_range, v_range, resolution=32, **kwargs):
+        super().__init__(
+            lambda u, v: np.array([u, v, 0.0]),
+            u_range=u_range,
+            v_range=v_range,
+            resolution=resolution,
+            **kwargs
+        )
+        uv = np.array([face.points[:, :2] for face in self])
+        unique_uv, inverse = np.unique(uv.reshape(-1, 2), axis=0, return_inverse=True)
+        self.grid_u, self.grid_v = unique_uv[:, 0], unique_uv[:, 1]
+        self._inverse = inverse.reshape(uv.shape[:2])
+
+        # Axele sunt liniare: c2p(u, v, z) = origine + u·ex + v·ey + z·ez
+        origin = axes.c2p(0, 0, 0)
+        ex = axes.c2p(1, 0, 0) - origin
+        ey = axes.c2p(0, 1, 0) - origin
+        self._ez = axes.c2p(0, 0, 1) - origin
+        self._base = origin + uv[..., :1] * ex + uv[..., 1:] * ey
+        self._points = self._base.copy()
+        self._offset = np.empty_like(self._points)
+        self._bind_points()
+
+    def _bind_points(self):
+        for face, points in zip(self, self._points):
+            face.points = points
+
+    def set_heights(self, func):
+        """Evaluează z = func(u, v) pe toată rețeaua și actualizează punctele"""
+        return self.set_height_values(func(self.grid_u, self.grid_v))
+
+    def set_height_values(self, z):
+        """Actualizează punctele din înălțimile z date pe (grid_u, grid_v)"""
+        z = np.asarray(z)[self._inverse]
+        np.multiply(z[..., None], self._ez, out=self._offset)
+        np.add(self._base, self._offset, out=self._points)
+        # Animații ca Create înlocuiesc array-urile fețelor; le legăm din nou
+        if self[0].points.base is not self._points:
+            self._bind_points()
+        return self
+
+
+class LiveCurve(VMobject):
+    """Grafic y = f(x) pe axe, cu eșantioanele x fixe și punctele prealocate
+
+    Ancorele curbei sunt eșantioanele; mânerele Bézier vin din tangentele
+    centrale (spline Catmull-Rom), deci curba trece prin toate punctele, ca la
+    set_points_smoothly, dar fără sistemul tridiagonal. La fiecare cadru se
+    rescriu doar coordonatele y, vectorizat, în același buffer (curbe, 4, 3).
+    """
+
+    def __init__(self, axes, x, **kwargs):
+        super().__init__(**kwargs)
+        self.x = np.asarray(x, dtype=float)
+        # Axele sunt liniare: c2p(x, y) = origine + x·ex + y·ey
+        origin = axes.c2p(0, 0)
+        ex = axes.c2p(1, 0) - origin
+        self._ey = axes.c2p(0, 1) - origin
+        self._base = origin + self.x[:, None] * ex
+        self._anchors = self._base.copy()
+        self._tangents = np.zeros_like(self._anchors)
+        self._curves = np.empty((len(self.x) - 1, 4, 3))
+        self._points = self._curves.reshape(-1, 3)
+        self.set_values(np.zeros(len(self.x)))
+
+    def set_function(self, func):
+        """Evaluează y = func(x) pe toate eșantioanele, într-un singur apel"""
+        return self.set_values(func(self.x))
+
+    def set_values(self, y):
+        """Actualizează curba din valorile y date pe eșantioanele x"""
+        anchors, tangents, curves = self._anchors, self._tangents, self._curves
+        np.multiply(np.asarray(y)[:, None], self._ey, out=anchors)
+        anchors += self._base
+        # Tangente centrale, o treime din ele pe fiecare mâner; la capete, unilaterale
+        np.subtract(anchors[2:], anchors[:-2], out=tangents[1:-1])
+        tangents[1:-1] /= 6
+        np.subtract(anchors[1], anchors[0], out=tangents[0])
+        np.subtract(anchors[-1], anchors[-2], out=tangents[-1])
+        tangents[[0, -1]] /= 3
+        curves[:, 0] = anchors[:-1]
+        np.add(anchors[:-1], tangents[:-1], out=curves[:, 1])
+        np.subtract(anchors[1:], tangents[1:], out=curves[:, 2])
+        curves[:, 3] = anchors[1:]
+        # Animații ca Create înlocuiesc array-ul de puncte; îl legăm din nou
+        if self.points is not self._points:
+            self.points = self._points
+        return self
+
+
+class GlyphSet:
+    """Glifele MathTex ale valorilor numerice, compilate o singură dată per font_size
+
+    Fiecare glif este deplasat astfel încât originea celulei lui (începutul pe
+    linia de bază) să fie în ORIGIN; `advance` este lățimea celulei în TeX.
+    Cifrele au toate aceeași lățime; celelalte caractere sunt măsurate între
+    două cifre, ca să aibă spațierea din TeX.
+    """
+
+    TEX_ESCAPES = {"%": r"\%", "#": r"\#", "&": r"\&", "_": r"\_"}
+
+    def __init__(self, font_size):
+        self.font_size = font_size
+        self.glyphs = {}
+        reference = MathTex("01234567890", font_size=font_size)[0]
+        zero = reference[0]
+        self.baseline = zero.get_bottom()[1]
+        self.advance = (reference[10].get_left()[0] - zero.get_left()[0]) / 10
+        for i, digit in enumerate("0123456789"):
+            cell = zero.get_left()[0] + i * self.advance
+            self._store(digit, VGroup(reference[i].copy()), cell, self.advance)
+
+    def _store(self, char, glyph, cell, advance):
+        glyph.shift([-cell, -self.baseline, 0])
+        self.glyphs[char] = (glyph, advance)
+        return self.glyphs[char]
+
+    def __getitem__(self, char):
+        """(glif, avans); caracterele noi sunt compilate la prima folosire"""
+        if char in self.glyphs:
+            return self.glyphs[char]
+        tex = self.TEX_ESCAPES.get(char, char)
+        between = MathTex(f"0{{{tex}}}0", font_size=self.font_size)[0]
+        first, last = between[0].get_left()[0], between[-1].get_left()[0]
+        glyph = VGroup(*[mob.copy() for mob in between[1:-1]])
+        # Linia de bază a compilării curente este cea a primei cifre
+        glyph.shift([0, self.baseline - between[0].get_bottom()[1], 0])
+        return self._store(char, glyph, first + self.advance, last - first - self.advance)
+
+
+class NumericLabel(VGroup):
+    """Etichetă MathTex cu valori numerice care se schimbă, fără LaTeX per cadru
+
+    Șablonul folosește sintaxa str.format, de ex. r"\\theta = {theta:.0f}°":
+    textul static este compilat o singură dată, iar valorile sunt asamblate
+    din glife din GlyphSet. Etichetele asamblate sunt păstrate într-un cache
+    LRU după textul valorilor, deci o valoare deja afișată nu mai creează
+    niciun mobject. Câmpurile nu pot sta într-un grup TeX ({...}), iar mărimea
+    se dă prin font_size, nu prin scale.
+    """
+
+    _glyph_sets = {}
+
+    def __init__(self, template, font_size=DEFAULT_FONT_SIZE, color=WHITE,
+                 aligned_edge=ORIGIN, cache_size=256, **values):
+        super().__init__()
+        if font_size not in self._glyph_sets:
+            self._glyph_sets[font_size] = GlyphSet(font_size)
+        self.glyphs = self._glyph_sets[font_size]
+        self._color = color
+        self.aligned_edge = aligned_edge
+        self.cache_size = cache_size
+        self._entries = OrderedDict()
+        self._current = None
+
+        # Șablonul compilat o dată, cu "0" în locul fiecărui câmp
+        # (parse întoarce acoladele dublate ca literale separate; le unim la loc)
+        items, pieces, literal_run = [], [], ""
+        for literal, name, spec, _ in string.Formatter().parse(template):
+            literal_run += literal
+            if name is None:
+                continue
+            if literal_run:
+                items.append(("static", len(pieces)))
+                pieces.append(literal_run)
+                literal_run = ""
+            items.append(("field", len(pieces), name, spec or ""))
+            pieces.append("0")
+        if literal_run:
+            items.append(("static", len(pieces)))
+            pieces.append(literal_run)
+        sample = MathTex(*pieces, font_size=font_size)
+        first_field = next((i[1] for i in items if i[0] == "field"), 0)
+        self._origin = np.array([sample.get_left()[0], sample[first_field].get_bottom()[1], 0.0])
+        self._sample_width = sample.get_right()[0] - self._origin[0]
+        self._items = []
+        for item in items:
+            part = sample[item[1]]
+            if item[0] == "static":
+                self._items.append(("static", part.copy().shift(-self._origin)))
+            else:
+                cell = part.get_left()[0] - self._origin[0]
+                self._items.append(("field", cell) + item[2:])
+        self._fields = [item[2:] for item in self._items if item[0] == "field"]
+        self.field_names = [name for name, _ in self._fields]
+
+        self._anchor = VectorizedPoint(ORIGIN)
+        self.add(self._anchor)
+        self.set_value(**values)
+
+    def set_value(self, *args, **kwargs):
+        """Afișează valorile date (poziționale în ordinea câmpurilor sau pe nume)"""
+        values = dict(zip(self.field_names, args), **kwargs)
+        texts = tuple(format(values[name], spec) for name, spec in self._fields)
+        if texts == self._current:
+            return self
+
+        entry = self._entries.get(texts)
+        if entry is None:
+            entry = self._assemble(texts)
+            self._entries[texts] = entry
+            if len(self._entries) > self.cache_size:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(texts)
+
+        # Intrarea e mutată la ancora etichetei, care urmează next_to, shift etc.;
+        # originea ei e un punct din grup, deci se mută și cu eticheta afișată
+        target = self._anchor.get_center() - entry.anchor_offset
+        entry.shift(target - entry.origin_point.get_center())
+        self.submobjects = [self._anchor, entry]
+        self._current = texts
+        return self
+
+    def _assemble(self, texts):
+        parts, delta, values = [], 0.0, iter(texts)
+        for item in self._items:
+            if item[0] == "static":
+                parts.append(item[1].copy().shift(delta * RIGHT))
+                continue
+            start = pen = item[1] + delta
+            for char in next(values):
+                glyph, advance = self.glyphs[char]
+                parts.append(glyph.copy().shift(pen * RIGHT))
+                pen += advance
+            delta += (pen - start) - self.glyphs.advance
+
+        entry = VGroup(*parts).set_color(self._color)
+        width = self._sample_width + delta
+        entry.origin_point = VectorizedPoint(ORIGIN)
+        entry.add(entry.origin_point)
+        entry.anchor_offset = (self.aligned_edge[0] + 1) / 2 * width * RIGHT
+        return entry
+
+
+class OpticalElement(VGroup):
+    """Element optic rotativ (ramă + liniile axei), construit o singură dată
+
+    `set_angle` aplică doar rotația incrementală față de unghiul curent, deci
+    un cadru nu creează niciun mobject. Unghiul (rad) este măsurat față de
+    verticală, în sens trigonometric. Atributele de clasă descriu elementul
+    pentru jones.linear_element: transmisiile pe axă și perpendicular pe ea și
+    defazajul.
+    """
+
+    transmission = (1.0, 1.0)
+    retardance = 0.0
+
+    def __init__(self, position=ORIGIN, angle=0.0, color=ORANGE, height=2.0, width=0.15,
+                 n_lines=5, **kwargs):
+        frame = Rectangle(height=height, width=width, color=color, fill_opacity=0.5)
+        lines = VGroup(*[
+            Line(UP * 0.45 * height, DOWN * 0.45 * height, stroke_width=1, color=color)
+            .shift(RIGHT * width / 3 * i)
+            for i in range(-(n_lines // 2), n_lines // 2 + 1)
+        ])
+        super().__init__(frame, lines, **kwargs)
+        self.frame, self.lines = frame, lines
+        self.move_to(position)
+        self.angle = 0.0
+        self.set_angle(angle)
+
+    def set_angle(self, angle):
+        self.rotate(angle - self.angle, about_point=self.get_center())
+        self.angle = angle
+        return self
+
+
+class Polarizer(OpticalElement):
+    """Polarizor liniar ideal; liniile arată axa de transmisie"""
+
+    transmission = (1.0, 0.0)
+
+
+class WavePlate(OpticalElement):
+    """Lamă de undă; o singură linie, axa rapidă"""
+
+    def __init__(self, position=ORIGIN, angle=0.0, color=TEAL, **kwargs):
+        kwargs.setdefault("n_lines", 1)
+        super().__init__(position, angle, color=color, **kwargs)
+        self.frame.set_fill(opacity=0.25)
+
+
+class HalfWavePlate(WavePlate):
+    retardance = PI
+
+
+class QuarterWavePlate(WavePlate):
+    retardance = PI / 2
+
+
+class PolarizationArrow(DoubleArrow):
+    """Săgeată dublă a câmpului E, rotită și scalată pe loc
+
+    Lungimea corpului este scalată direct în array-ul de puncte, iar vârfurile
+    sunt doar deplasate, deci au mărime constantă. Sub `min_length` săgeata
+    devine invizibilă.
+    """
+
+    def __init__(self, center=ORIGIN, angle=0.0, length=0.8, min_length=0.05, **kwargs):
+        kwargs.setdefault("buff", 0)
+        kwargs.setdefault("stroke_width", 4)
+        kwargs.setdefault("color", GREEN)
+        super().__init__(center + DOWN * length, center + UP * length, **kwargs)
+        self.min_length = min_length
+        self.angle = 0.0
+        self.length = length
+        self.visible = True
+        self.set_state(angle, length)
+
+    def set_state(self, angle, length):
+        """Direcția polarizării (rad față de verticală) și semi-lungimea"""
+        center = self.get_center()
+        if angle != self.angle:
+            self.rotate(angle - self.angle, about_point=center)
+            self.angle = angle
+
+        visible = length >= self.min_length
+        if visible != self.visible:
+            self.set_opacity(1.0 if visible else 0.0)
+            self.visible = visible
+        length = max(length, self.min_length)
+        if length != self.length:
+            factor = length / self.length
+            self.points = center + (self.points - center) * factor
+            for tip in self.get_tips():
+                tip.shift((factor - 1) * (tip.base - center))
+            self.length = length
+        return self
+
+
+class OpticalChain(VGroup):
+    """Lumina transmisă printr-un lanț de elemente optice
+
+    Primul element definește polarizarea de intrare; pentru fiecare element
+    următor chain-ul conține o PolarizationArrow în dreptul lui. La fiecare
+    `update_light` matricele Jones ale tuturor elementelor sunt construite
+    într-un singur apel (jones.linear_element), iar intensitatea și direcția
+    polarizării după fiecare element rămân în `intensity` și `polarization`.
+    """
+
+    def __init__(self, elements, i0=1.0, arrow_length=0.8, **arrow_kwargs):
+        self.elements = list(elements)
+        self.i0 = i0
+        self.arrow_length = arrow_length
+        rest = self.elements[1:]
+        self._tx = np.array([element.transmission[0] for element in rest])
+        self._ty = np.array([element.transmission[1] for element in rest])
+        self._retardance = np.array([element.retardance for element in rest])
+        arrows = [
+            PolarizationArrow(element.get_center(), length=arrow_length, **arrow_kwargs)
+            for element in rest
+        ]
+        super().__init__(*arrows)
+        self.update_light()
+
+    def transmission(self):
+        """(intensitate, azimutul polarizării) după fiecare element de după primul"""
+        angles = np.array([element.angle for element in self.elements[1:]])
+        matrices = jones.linear_element(angles, self._tx, self._ty, self._retardance)
+        source = jones.linear_state(self.elements[0].angle, self.i0)
+        stokes = jones.stokes(jones.propagate(matrices, source))
+        return stokes[..., 0], jones.ellipse(stokes)[0]
+
+    def update_light(self):
+        self.intensity, self.polarization = self.transmission()
+        for arrow, i, angle in zip(self, self.intensity, self.polarization):
+            arrow.set_state(angle, self.arrow_length * i)
+        return self
+
+
+class RayBundle(VMobject):
+    """Un fascicul de segmente de rază desenat ca un singur VMobject
+
+    Fiecare segment este o curbă Bézier dreaptă; segmentele disjuncte devin
+    subpath-uri ale aceluiași mobject, deci mii de raze costă un singur apel
+    de desenare și pot fi actualizate pe loc cu `set_segments`.
+    """
+
+    def __init__(self, starts, ends, **kwargs):
+        kwargs.setdefault("stroke_width", 2)
+        super().__init__(**kwargs)
+        self.set_segments(starts, ends)
+
+    def set_segments(self, starts, ends):
+        """starts, ends: (M, 2) sau (M, 3)"""
+        starts, ends = np.asarray(starts, dtype=float), np.asarray(ends, dtype=float)
+        points = np.zeros((len(starts), 4, 3))
+        for i, weight in enumerate((0, 1 / 3, 2 / 3, 1)):
+            points[:, i, :starts.shape[1]] = (1 - weight) * starts + weight * ends
+        self.points = points.reshape(-1, 3)
+        return self
+
+
+def ray_bundles(starts, ends, power, color=YELLOW, levels=4, min_opacity=0.15, **kwargs):
+    """Segmentele grupate pe `levels` trepte de putere, câte un RayBundle per treaptă
+
+    Opacitatea fiecărui fascicul crește cu puterea (scară logaritmică între
+    puterea minimă și cea maximă), ca razele reflectate slab să rămână vizibile.
+    """
+    power = np.asarray(power, dtype=float)
+    group = VGroup()
+    if not len(power):
+        return group
+    log_power = np.log10(np.maximum(power, 1e-12))
+    low, high = log_power.min(), log_power.max()
+    level = np.zeros(len(power), dtype=int) if high == low else np.minimum(
+        ((log_power - low) / (high - low) * levels).astype(int), levels - 1)
+    for i in range(levels):
+        mask = level == i
+        if mask.any():
+            opacity = min_opacity + (1 - min_opacity) * (i + 1) / levels
+            group.add(RayBundle(starts[mask], ends[mask], color=color,
+                                stroke_opacity=opacity, **kwargs))
+    return group
+
+
+def spectral_ray_bundles(starts, ends, power, wavelength, bands=24, **kwargs):
+    """ray_bundles pe benzi de lungime de undă, fiecare în culoarea ei spectrală
+
+    Razele se împart în cel mult `bands` benzi egale pe intervalul de lungimi
+    de undă; culorile vin dintr-un singur apel spectral.wavelength_to_rgb.
+    """
+    wavelength = np.asarray(wavelength, dtype=float)
+    low, high = wavelength.min(initial=np.inf), wavelength.max(initial=-np.inf)
+    band = np.zeros(len(wavelength), dtype=int) if not high > low else np.minimum(
+        ((wavelength - low) / (high - low) * bands).astype(int), bands - 1)
+    used = np.unique(band)
+    centers = np.array([wavelength[band == i].mean() for i in used])
+    colors = spectral.to_hex(spectral.wavelength_to_rgb(centers))
+    group = VGroup()
+    for i, color in zip(used, colors):
+        mask = band == i
+        group.add(*ray_bundles(starts[mask], ends[mask], np.asarray(power)[mask],
+                               color=color, **kwargs))
+    return group
+
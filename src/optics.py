@@ -0,0 +1,166 @@
+import numpy as np
+
+# Nuclee de optică analitică, vectorizate cu NumPy și fără dependență de Manim.
+# Toate funcțiile acceptă array-uri de orice formă (cu broadcasting), un
+# buffer `out=` opțional și lucrează în float32 sau float64.
+
+H = 6.626e-34   # Constanta lui Planck (J·s)
+C = 3e8         # Viteza luminii (m/s)
+EV = 1.602e-19  # 1 eV în J
+
+
+def _float_dtype(dtype, *arrays):
+    """Tipul real al rezultatului: cel cerut sau cel al intrărilor (min. float32)"""
+    if dtype is not None:
+        return np.dtype(dtype)
+    return np.result_type(np.float32, *arrays)
+
+
+def _complex_dtype(dtype, *arrays):
+    return np.result_type(_float_dtype(dtype, *arrays), np.complex64)
+
+
+def _output(out, shape, dtype):
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.shape != shape:
+        raise ValueError(f"out are forma {out.shape}, se aștepta {shape}")
+    return out
+
+
+def total_internal_reflection(n1, n2, theta1):
+    """Masca de reflexie totală internă: (n1/n2) sin θ1 > 1"""
+    n1, n2, theta1 = np.asarray(n1), np.asarray(n2), np.asarray(theta1)
+    return np.abs(n1 / n2 * np.sin(theta1)) > 1
+
+
+def snell(n1, n2, theta1, out=None, dtype=None):
+    """Unghiul de refracție θ2 (rad) din n1 sin θ1 = n2 sin θ2
+
+    Unde apare reflexie totală internă rezultatul este NaN; masca
+    corespunzătoare se obține cu `total_internal_reflection`.
+    """
+    n1, n2, theta1 = np.asarray(n1), np.asarray(n2), np.asarray(theta1)
+    dtype = _float_dtype(dtype, n1, n2, theta1)
+    out = _output(out, np.broadcast_shapes(n1.shape, n2.shape, theta1.shape), dtype)
+
+    np.sin(theta1, out=out)
+    np.multiply(out, n1, out=out)
+    np.divide(out, n2, out=out)
+    with np.errstate(invalid="ignore"):
+        np.arcsin(out, out=out)
+    return out
+
+
+def fresnel_coefficients(n1, n2, theta1, dtype=None):
+    """Coeficienții Fresnel de amplitudine (rs, rp, ts, tp), complecși
+
+    La reflexie totală internă |rs| = |rp| = 1, iar faza este cea a undei
+    evanescente.
+    """
+    n1, n2, theta1 = np.asarray(n1), np.asarray(n2), np.asarray(theta1)
+    cdtype = _complex_dtype(dtype, n1, n2, theta1)
+
+    cos1 = np.cos(theta1).astype(cdtype)
+    sin2 = (n1 / n2 * np.sin(theta1)).astype(cdtype)
+    cos2 = np.sqrt(1 - sin2 * sin2)
+    # Ramura fizică pentru unda evanescentă: Im(cos θ2) >= 0
+    cos2 = np.where(cos2.imag < 0, -cos2, cos2)
+
+    n1cos1, n2cos2 = n1 * cos1, n2 * cos2
+    n2cos1, n1cos2 = n2 * cos1, n1 * cos2
+    rs = (n1cos1 - n2cos2) / (n1cos1 + n2cos2)
+    rp = (n2cos1 - n1cos2) / (n2cos1 + n1cos2)
+    ts = 2 * n1cos1 / (n1cos1 + n2cos2)
+    tp = 2 * n1cos1 / (n2cos1 + n1cos2)
+    return rs, rp, ts, tp
+
+
+def fresnel_reflectance(n1, n2, theta1, polarization="unpolarized", out=None,
+                        dtype=None):
+    """Reflectanța R în putere pentru polarizarea 's', 'p' sau 'unpolarized'
+
+    Transmitanța este 1 - R; la reflexie totală internă R = 1.
+    """
+    n1, n2, theta1 = np.asarray(n1), np.asarray(n2), np.asarray(theta1)
+    dtype = _float_dtype(dtype, n1, n2, theta1)
+    out = _output(out, np.broadcast_shapes(n1.shape, n2.shape, theta1.shape), dtype)
+
+    rs, rp, _, _ = fresnel_coefficients(n1, n2, theta1, dtype=dtype)
+    Rs, Rp = np.abs(rs)**2, np.abs(rp)**2
+    if polarization == "s":
+        out[...] = Rs
+    elif polarization == "p":
+        out[...] = Rp
+    elif polarization == "unpolarized":
+        np.add(Rs, Rp, out=out, casting="unsafe")
+        out *= 0.5
+    else:
+        raise ValueError(f"polarizare necunoscută: {polarization!r}")
+    return out
+
+
+def malus(theta, i0=1.0, out=None, dtype=None):
+    """Legea lui Malus: I = I0 cos²(θ), θ în radiani"""
+    theta, i0 = np.asarray(theta), np.asarray(i0)
+    dtype = _float_dtype(dtype, theta, i0)
+    out = _output(out, np.broadcast_shapes(theta.shape, i0.shape), dtype)
+
+    np.cos(theta, out=out)
+    np.square(out, out=out)
+    np.multiply(out, i0, out=out)
+    return out
+
+
+def photon_energy(wavelength, unit="eV", out=None, dtype=None):
+    """Energia fotonului E = hc/λ, cu λ în metri; unit = 'eV' sau 'J'"""
+    wavelength = np.asarray(wavelength)
+    dtype = _float_dtype(dtype, wavelength)
+    out = _output(out, wavelength.shape, dtype)
+
+    if unit not in ("eV", "J"):
+        raise ValueError(f"unitate necunoscută: {unit!r}")
+    scale = H * C / EV if unit == "eV" else H * C
+    np.divide(scale, wavelength, out=out)
+    return out
+
+
+def superposition(x, y, sources, k, t=0.0, omega=0.0, amplitudes=1.0,
+                  phases=0.0, attenuation=None, out=None, dtype=None):
+    """Suprapunerea a N surse punctiforme în planul (x, y)
+
+    Ψ = Σ aᵢ · att(rᵢ) · exp(i(k rᵢ + φᵢ - ω t)), cu rᵢ distanța de la sursa
+    i. `sources` are forma (N, 2); `attenuation` este o funcție de r (implicit
+    fără atenuare). Rezultatul este complex, cu forma broadcast(x, y).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    sources = np.asarray(sources, dtype=float).reshape(-1, 2)
+    amplitudes = np.broadcast_to(np.asarray(amplitudes, dtype=float), len(sources))
+    phases = np.broadcast_to(np.asarray(phases, dtype=float), len(sources))
+    dtype = _float_dtype(dtype, x, y)
+    shape = np.broadcast_shapes(x.shape, y.shape)
+    out = _output(out, shape, np.result_type(dtype, np.complex64))
+
+    # Buffere refolosite pentru toate sursele
+    r = np.empty(shape, dtype=dtype)
+    dy = np.empty(shape, dtype=dtype)
+    term = np.empty(shape, dtype=out.dtype)
+    out[...] = 0
+
+    for (sx, sy), a, phi in zip(sources, amplitudes, phases):
+        np.subtract(x, sx, out=r)
+        np.square(r, out=r)
+        np.subtract(y, sy, out=dy)
+        np.square(dy, out=dy)
+        np.add(r, dy, out=r)
+        np.sqrt(r, out=r)
+
+        np.multiply(r, k, out=term, casting="unsafe")
+        term += phi - omega * t
+        term *= 1j
+        np.exp(term, out=term)
+        term *= a
+        if attenuation is not None:
+            term *= attenuation(r)
+        out += term
+    return out
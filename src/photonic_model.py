@@ -1,7 +1,13 @@
 from manim import *
 import numpy as np
 
+from physics import photonic_model
+from spectral import to_hex
+
 class PhotonicModel(Scene):
+    # Parametri fizici suprascriși (vezi physics.photonic_model)
+    params = {}
+    
     def construct(self):
         self.camera.background_color = "#0a0a0a"
         
@@ -15,15 +21,16 @@ class PhotonicModel(Scene):
         ).next_to(title, DOWN, buff=0.3)
         self.play(Write(energy_formula))
         
-        # Constante
-        h = 6.626e-34  # Constanta lui Planck (J·s)
-        c = 3e8         # Viteza luminii (m/s)
+        # Energii foton (eV) pentru toate lungimile de undă deodată
+        physics = photonic_model(**self.params)
         
-        colors_data = [
-            ("Roșu", 650e-9, RED, -2),
-            ("Verde", 550e-9, GREEN, 0),
-            ("Albastru", 450e-9, BLUE, 2)
-        ]
+        # Denumirile și culorile fotonilor vin din lungimile lor de undă
+        # (benzile și tabelul CIE din spectral); fasciculele se împart pe [-2, 2]
+        n_photons = len(physics["wavelength"])
+        y_offsets = np.linspace(-2, 2, n_photons) if n_photons > 1 else [0.0]
+        colors_data = list(zip(
+            physics["names"], physics["wavelength"], to_hex(physics["rgb"]), y_offsets
+        ))
         
         source = Circle(radius=0.3, color=YELLOW, fill_opacity=0.8)
         source.shift(LEFT * 5)
@@ -32,10 +39,7 @@ class PhotonicModel(Scene):
         self.play(Create(source), Write(source_label))
         
         info_group = VGroup()
-        for color_name, wavelength, color, y_offset in colors_data:
-            energy = (h * c) / wavelength  # Energie foton (J)
-            energy_eV = energy / 1.602e-19  # Convertire în eV
-            
+        for (color_name, wavelength, color, y_offset), energy_eV in zip(colors_data, physics["energy_eV"]):
             info_text = VGroup(
                 Text(f"{color_name}:", font_size=20, color=color),
                 MathTex(f"\\lambda = {wavelength*1e9:.0f} \, \\text{{nm}}", font_size=18),
@@ -49,6 +53,32 @@ class PhotonicModel(Scene):
         info_with_box = VGroup(info_box, info_group).to_corner(UR)
         
         self.play(Create(info_box), Write(info_group))
+        
+        # Spectrul vizibil ca imagine: o coloană de pixeli per eșantion
+        spectrum_nm = physics["spectrum_nm"]
+        pixels = np.empty((2, len(spectrum_nm), 4), dtype=np.uint8)
+        pixels[..., :3] = np.rint(physics["spectrum_rgb"] * 255)
+        pixels[..., 3] = 255
+        strip = ImageMobject(pixels)
+        strip.stretch_to_fit_width(8).stretch_to_fit_height(0.3)
+        strip.to_edge(DOWN, buff=0.4).shift(LEFT * 1.5)
+        
+        def strip_x(nm):
+            fraction = (nm - spectrum_nm[0]) / (spectrum_nm[-1] - spectrum_nm[0])
+            return strip.get_left()[0] + fraction * strip.width
+        
+        ends = VGroup(*[
+            MathTex(f"{nm:.0f} \\, \\text{{nm}} \\; ({energy:.2f} \\, \\text{{eV}})", font_size=16)
+            .next_to(strip, DOWN, buff=0.1).set_x(strip_x(nm))
+            for nm, energy in zip(spectrum_nm[[0, -1]], physics["spectrum_energy_eV"][[0, -1]])
+        ])
+        markers = VGroup(*[
+            Triangle(color=color, fill_opacity=1).scale(0.08).rotate(PI)
+            .move_to([strip_x(wavelength * 1e9), strip.get_top()[1] + 0.12, 0])
+            for _, wavelength, color, _ in colors_data
+        ])
+        
+        self.play(FadeIn(strip), Write(ends), FadeIn(markers))
         self.wait(2)
         
         for color_name, wavelength, color, y_offset in colors_data:
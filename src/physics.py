@@ -0,0 +1,408 @@
+import argparse
+import importlib
+import inspect
+import json
+
+import numpy as np
+
+import fdtd
+import harmonic
+import jones
+import raytrace
+import spectral
+from optics import photon_energy, snell, total_internal_reflection
+from wavefield import screen_intensity
+
+# Fizica fiecărei scene, calculabilă fără Manim. Fiecare funcție primește
+# parametrii scenei ca argumente cu valori implicite (cele din animații) și
+# întoarce un dict cu parametrii și rezultatele numerice. Manim este importat
+# doar de `load_scene`, adică numai când scena chiar trebuie randată.
+
+
+def wave_harmonic(x, E0, wavelength, T):
+    """Unda 1D ca HarmonicField pe eșantioanele x (precalculat, din cache)"""
+    return harmonic.plane_wave(x, 2 * np.pi / wavelength, 2 * np.pi / T, E0)
+
+
+def wave_field(x, t, E0, wavelength, T):
+    """E(x,t) = E0 sin[2π(t/T - x/λ)]"""
+    return E0 * np.sin(2 * np.pi * (t / T - np.asarray(x) / wavelength))
+
+
+def wave_propagation(E0=1.0, wavelength=2.0, T=2.0, x_max=10.0, n_samples=200, t=0.0,
+                     solver="analytic", medium_start=6.0, medium_index=1.5, absorption=0.0,
+                     cells_per_wavelength=40, *, simulate=True):
+    """Unda 1D din WavePropagation1D
+
+    solver="fdtd" înlocuiește formula analitică cu rezolvitorul numeric: pentru
+    x ≥ medium_start mediul are indicele medium_index și conductivitatea
+    absorption, deci apar reflexia parțială, lungimea de undă scurtată și
+    atenuarea. E este câmpul la momentul t după regimul tranzitoriu.
+    Cu simulate=False simularea FDTD nu rulează, iar E și t_start lipsesc:
+    scena își construiește solver-ul cu wave_solver și îl avansează cadru cu cadru.
+    """
+    x = np.linspace(0, x_max, n_samples)
+    physics = dict(
+        E0=E0, wavelength=wavelength, T=T,
+        nu=1.0 / T,
+        c=wavelength / T,
+        x=x,
+        solver=solver,
+        medium_start=medium_start, medium_index=medium_index, absorption=absorption,
+        cells_per_wavelength=cells_per_wavelength,
+    )
+    if solver == "fdtd" and simulate:
+        wave = wave_solver(physics)
+        wave.run_until(physics["t_start"] + t)
+        physics["E"] = wave.sample(x)
+    elif solver != "fdtd":
+        physics["E"] = wave_field(x, t, E0, wavelength, T)
+    return physics
+
+
+def wave_solver(physics):
+    """FDTD1D pentru dict-ul din wave_propagation; t_start (adăugat în dict)
+    este momentul după care frontul undei a străbătut tot domeniul"""
+    c, x_max = physics["c"], physics["x"][-1]
+    n_cells = int(np.ceil(x_max / physics["wavelength"] * physics["cells_per_wavelength"]))
+    x = np.linspace(0, x_max, n_cells + 1)
+    medium = x >= physics["medium_start"]
+    wave = fdtd.FDTD1D(
+        x, c=c,
+        index=np.where(medium, physics["medium_index"], 1.0),
+        conductivity=np.where(medium, physics["absorption"], 0.0),
+    )
+    wave.add_source(0.0, fdtd.continuous(2 * np.pi / physics["T"], physics["E0"]))
+    physics["t_start"] = 2 * x_max * max(physics["medium_index"], 1.0) / c + physics["T"]
+    return wave
+
+
+def reflection(theta_i_deg=45.0):
+    """Legea reflexiei din Reflection: θr = θi"""
+    theta_i = np.radians(theta_i_deg)
+    return dict(
+        theta_i_deg=theta_i_deg,
+        theta_r_deg=theta_i_deg,
+        # Direcții în plan: rază incidentă (spre suprafață) și reflectată
+        incident_dir=np.array([np.sin(theta_i), -np.cos(theta_i)]),
+        reflected_dir=np.array([np.sin(theta_i), np.cos(theta_i)]),
+    )
+
+
+def refraction(n1=1.0, n2=1.5, theta1_deg=45.0, wavelength_nm=589.3, n_wavelengths=200):
+    """Legea lui Snell din Refraction, cu dispersia mediului 2
+
+    n2 este un indice constant, un material din spectral.MATERIALS sau o
+    funcție n(λ); raza afișată are lungimea de undă `wavelength_nm`, iar
+    evantaiul spectral acoperă vizibilul cu `n_wavelengths` eșantioane.
+    Scena desenează doar raza refractată: reflexia totală internă (pentru
+    oricare dintre aceste lungimi de undă) ridică ValueError.
+    """
+    check_refraction(n1, n2, theta1_deg, wavelength_nm, n_wavelengths)
+    theta1 = np.radians(theta1_deg)
+    n2_value = float(spectral.refractive_index(n2, wavelength_nm))
+    theta2 = snell(n1, n2_value, theta1)
+    spectrum = spectral.dispersion(n2, spectral.visible(n_wavelengths), theta1, n1)
+    return dict(
+        n1=n1, n2=n2_value, medium=n2, theta1_deg=theta1_deg, wavelength_nm=wavelength_nm,
+        theta1=theta1,
+        theta2=theta2,
+        theta2_deg=np.degrees(theta2),
+        tir=total_internal_reflection(n1, n2_value, theta1),
+        spectrum=spectrum,
+    )
+
+
+def check_refraction(n1, n2, theta1_deg, wavelength_nm, n_wavelengths):
+    """ValueError dacă raza afișată sau evantaiul spectral din Refraction se reflectă total"""
+    wavelengths = np.append(spectral.visible(n_wavelengths), wavelength_nm)
+    n2_min = float(np.min(spectral.refractive_index(n2, wavelengths)))
+    if total_internal_reflection(n1, n2_min, np.radians(theta1_deg)):
+        critical = np.degrees(np.arcsin(n2_min / n1))
+        raise ValueError(f"Refraction: reflexie totală internă pentru n1 = {n1:g}, "
+                         f"θ1 = {theta1_deg:g}° (n2 minim {n2_min:.4f}); "
+                         f"θ1 trebuie să fie sub unghiul critic {critical:.2f}°")
+
+
+def interference_harmonic(u, v, *, sources, wavelength, omega, amplitude, attenuation):
+    """Câmpul din Interference ca HarmonicField pe punctele (u, v), din cache"""
+    return harmonic.point_sources(
+        u, v, sources, 2 * np.pi / wavelength, omega, amplitudes=amplitude,
+        attenuation=lambda r: 1 / (1 + r * attenuation),
+        attenuation_key=("1/(1+a·r)", attenuation)
+    )
+
+
+def interference_wave(u, v, t, **wave):
+    """Suprapunerea undelor atenuate de la sursele din Interference"""
+    return interference_harmonic(u, v, **wave).real(t)
+
+
+def interference(wavelength=1.5, omega=1.0, amplitude=0.3, source_separation=3.0,
+                 attenuation=0.3, extent=3.5, resolution=40, t=0.0,
+                 solver="analytic", medium_y=1.5, medium_index=1.0, absorption=0.0,
+                 cells_per_wavelength=20, *, simulate=True):
+    """Câmpul de interferență 2D din Interference, pe grila suprafeței
+
+    solver="fdtd" calculează câmpul cu FDTD2D (surse liniare cu amplitudinea
+    `amplitude` la distanța 1): pentru y ≥ medium_y mediul are indicele
+    medium_index și conductivitatea absorption. Cu simulate=False simularea
+    nu rulează, iar z și t_start lipsesc (vezi wave_propagation).
+    """
+    sources = np.array([[-source_separation / 2, 0.0], [source_separation / 2, 0.0]])
+    u = np.linspace(-extent, extent, resolution)
+    U, V = np.meshgrid(u, u)
+    wave = dict(sources=sources, wavelength=wavelength, omega=omega,
+                amplitude=amplitude, attenuation=attenuation)
+    physics = dict(
+        wave,
+        source_separation=source_separation, extent=extent, resolution=resolution,
+        k=2 * np.pi / wavelength,
+        wave=wave,
+        u=u,
+        solver=solver,
+        medium_y=medium_y, medium_index=medium_index, absorption=absorption,
+        cells_per_wavelength=cells_per_wavelength,
+    )
+    if solver == "fdtd" and simulate:
+        field = interference_solver(physics)
+        field.run_until(physics["t_start"] + t)
+        physics["z"] = field.field[field.sampler(U, V)].astype(float)
+        field.close()
+    elif solver != "fdtd":
+        physics["z"] = interference_wave(U, V, t, **wave)
+    return physics
+
+
+def interference_solver(physics, workers=1):
+    """FDTD2D pentru dict-ul din interference; t_start (adăugat în dict) este
+    momentul după care unda a ajuns în colțurile grilei"""
+    extent, wavelength, omega = physics["extent"], physics["wavelength"], physics["omega"]
+    c = omega * wavelength / (2 * np.pi)
+    n_cells = int(np.ceil(2 * extent / wavelength * physics["cells_per_wavelength"]))
+    axis = np.linspace(-extent, extent, n_cells + 1)
+    medium = lambda X, Y: Y >= physics["medium_y"]
+    field = fdtd.FDTD2D(
+        axis, axis, c=c, workers=workers,
+        index=lambda X, Y: np.where(medium(X, Y), physics["medium_index"], 1.0),
+        conductivity=lambda X, Y: np.where(medium(X, Y), physics["absorption"], 0.0),
+    )
+    current = fdtd.line_current(physics["amplitude"], omega, c)
+    for x0, y0 in physics["sources"]:
+        field.add_source(x0, y0, fdtd.continuous(omega, current))
+    physics["t_start"] = 2 * np.sqrt(2) * extent * max(physics["medium_index"], 1.0) / c
+    return field
+
+
+def photonic_model(wavelengths_nm=(650.0, 550.0, 450.0), n_spectrum=400):
+    """Energia fotonilor din PhotonicModel și spectrul vizibil colorat"""
+    wavelength = np.atleast_1d(np.asarray(wavelengths_nm, dtype=float)) * 1e-9
+    spectrum_nm = spectral.visible(n_spectrum)
+    return dict(
+        wavelengths_nm=wavelengths_nm,
+        wavelength=wavelength,
+        energy_eV=photon_energy(wavelength),
+        energy_J=photon_energy(wavelength, unit="J"),
+        rgb=spectral.wavelength_to_rgb(wavelength * 1e9),
+        names=spectral.color_name(wavelength * 1e9),
+        spectrum_nm=spectrum_nm,
+        spectrum_energy_eV=photon_energy(spectrum_nm * 1e-9),
+        spectrum_rgb=spectral.wavelength_to_rgb(spectrum_nm),
+    )
+
+
+def polarization(theta_max_deg=90.0, n_samples=91, i0=1.0):
+    """Lumina după polarizatorul 2 din Polarization, pe toată rotația lui
+
+    Calculată cu matrice Jones; intensitatea reproduce legea lui Malus.
+    """
+    theta_deg = np.linspace(0, theta_max_deg, n_samples)
+    field = jones.apply(jones.linear_polarizer(np.radians(theta_deg)), jones.linear_state(0.0, i0))
+    stokes = jones.stokes(field)
+    return dict(
+        theta_max_deg=theta_max_deg, i0=i0,
+        theta_deg=theta_deg,
+        intensity=stokes[:, 0],
+        stokes=stokes,
+    )
+
+
+def double_slit(wavelength=0.5, slit_separation=1.5, slit_width=0.2,
+                source_x=-5.0, source_y=0.5, barrier_x=-2.0, screen_x=3.0,
+                n_screen=80):
+    """Geometria și pattern-ul |Ψ|² pe ecran din DoubleSlit"""
+    k = 2 * np.pi / wavelength
+    geometry = dict(
+        source=(source_x, source_y),
+        k=k,
+        omega=k,
+        barrier_x=barrier_x,
+        slit_ys=(slit_separation / 2, -slit_separation / 2),
+        slit_width=slit_width,
+    )
+    y_screen = np.linspace(-2.5, 2.5, n_screen)
+    intensity = screen_intensity(y_screen, screen_x=screen_x, **geometry)
+    intensity = intensity / np.max(intensity)
+
+    # Maxime constructive (vârfuri locale peste 0.7)
+    inner = intensity[1:-1]
+    maxima = np.flatnonzero((inner > 0.7) & (inner > intensity[:-2]) & (inner > intensity[2:])) + 1
+
+    return dict(
+        wavelength=wavelength, slit_separation=slit_separation, slit_width=slit_width,
+        source_x=source_x, barrier_x=barrier_x, screen_x=screen_x,
+        geometry=geometry,
+        y_screen=y_screen,
+        intensity=intensity,
+        maxima=maxima,
+    )
+
+
+def _rays(system, origins, directions, **options):
+    """Drumurile razelor și contururile corpurilor, pentru scenele din ray_optics"""
+    paths = raytrace.trace(system, origins, directions, **options)
+    return dict(paths, outlines=system.outlines)
+
+
+def prism_rays(n="F2", apex_deg=60.0, side=3.5, incidence_deg=50.0, beam_width=0.3,
+               n_rays=200, wavelength=550.0, n_wavelengths=12, max_depth=6, min_power=0.01):
+    """Fascicul îngust prin prismă: refracție, dispersie, reflexii Fresnel și deviație
+
+    n este un indice constant, un material din spectral.MATERIALS sau o
+    funcție n(λ). Cu n_wavelengths > 1 fasciculul este alb: razele își
+    împart eșantioanele spectrului vizibil, altfel toate au `wavelength`.
+    """
+    system = raytrace.prism(spectral.material(n), center=(0.5, -0.8), side=side,
+                            apex_deg=apex_deg)
+    # Latura stângă (vârf -> bază); raza vine de jos, spre vârf
+    apex, base = system.segments[2].reshape(2, 2)
+    edge = (base - apex) / np.linalg.norm(base - apex)
+    inward = np.array([-edge[1], edge[0]])
+    incidence = np.radians(incidence_deg)
+    direction = np.cos(incidence) * inward - np.sin(incidence) * edge
+    origins, directions = raytrace.beam((apex + base) / 2 - 4 * direction, direction,
+                                        beam_width, n_rays)
+    if n_wavelengths > 1:
+        wavelength = np.resize(spectral.visible(n_wavelengths, 400.0, 700.0), n_rays)
+    return dict(
+        n=n, n_d=float(spectral.refractive_index(n, 587.6)),
+        apex_deg=apex_deg, incidence_deg=incidence_deg,
+        **_rays(system, origins, directions, wavelength=wavelength,
+                max_depth=max_depth, min_power=min_power),
+    )
+
+
+def slab_rays(n=1.5, width=8.0, thickness=1.5, incidence_deg=40.0, beam_width=0.2,
+              n_rays=60, max_depth=8, min_power=0.0005):
+    """Placă cu fețe paralele: deplasarea laterală și reflexiile multiple"""
+    system = raytrace.slab(n, center=(0.0, -1.0), width=width, height=thickness)
+    incidence = np.radians(incidence_deg)
+    direction = np.array([np.sin(incidence), -np.cos(incidence)])
+    entry = np.array([-2.0, -1.0 + thickness / 2])
+    origins, directions = raytrace.beam(entry - 3 * direction, direction, beam_width, n_rays)
+    return dict(
+        n=n, thickness=thickness, incidence_deg=incidence_deg,
+        **_rays(system, origins, directions, max_depth=max_depth, min_power=min_power),
+    )
+
+
+def lens_rays(n=1.5, radius=3.0, aperture=1.5, beam_width=2.6, n_rays=25, max_depth=4,
+              min_power=0.02):
+    """Fascicul paralel focalizat de o lentilă biconvexă"""
+    system = raytrace.biconvex_lens(n, center=(-1.0, -0.5), radius=radius, aperture=aperture)
+    origins, directions = raytrace.beam((-6.0, -0.5), (1.0, 0.0), beam_width, n_rays)
+    # Lentila subțire: 1/f = (n - 1) · 2/R
+    return dict(
+        n=n, radius=radius, focal_length=radius / (2 * (n - 1)),
+        **_rays(system, origins, directions, max_depth=max_depth, min_power=min_power, far=12.0),
+    )
+
+
+# Numele scenei -> (modulul din src/, funcția fizică)
+SCENES = {
+    "WavePropagation1D": ("wave_propagation", wave_propagation),
+    "Reflection": ("reflection", reflection),
+    "Refraction": ("refraction", refraction),
+    "Interference": ("interference", interference),
+    "PhotonicModel": ("photonic_model", photonic_model),
+    "Polarization": ("polarization", polarization),
+    "DoubleSlit": ("double_slit", double_slit),
+    "PrismRays": ("ray_optics", prism_rays),
+    "SlabRays": ("ray_optics", slab_rays),
+    "LensRays": ("ray_optics", lens_rays),
+}
+
+
+# Verificări ale valorilor, pe lângă cele ale numelor din check_params; primesc
+# toți parametrii scenei (impliciții completați)
+VALIDATORS = {
+    "Refraction": check_refraction,
+}
+
+
+def compute(scene_name, **params):
+    """Rezultatele numerice ale unei scene, fără Manim"""
+    return SCENES[scene_name][1](**params)
+
+
+def default_params(scene_name):
+    """Parametrii impliciți ai unei scene"""
+    signature = inspect.signature(SCENES[scene_name][1])
+    # Argumentele doar-cuvânt-cheie (simulate) controlează calculul, nu scena
+    return {name: p.default for name, p in signature.parameters.items()
+            if p.kind is not p.KEYWORD_ONLY}
+
+
+def check_params(scene_name, params):
+    """Ridică ValueError pentru parametrii pe care funcția scenei nu îi are
+    sau pentru valorile respinse de VALIDATORS"""
+    defaults = default_params(scene_name)
+    unknown = set(params) - set(defaults)
+    if unknown:
+        raise ValueError(f"{scene_name}: parametri necunoscuți: {', '.join(sorted(unknown))}")
+    if scene_name in VALIDATORS:
+        VALIDATORS[scene_name](**dict(defaults, **params))
+    return params
+
+
+def load_scene(scene_name, params=None):
+    """Clasa Manim a scenei; abia aici se importă Manim
+
+    Cu `params`, întoarce o subclasă cu acești parametri fizici suprascriși
+    peste cei ai clasei (aceeași nume, deci același fișier video).
+    """
+    module = importlib.import_module(SCENES[scene_name][0])
+    scene = getattr(module, scene_name)
+    if params:
+        check_params(scene_name, params)
+        scene = type(scene_name, (scene,), {"params": dict(scene.params, **params)})
+    return scene
+
+
+def to_json(value):
+    """Convertește rezultatele (array-uri NumPy incluse) în tipuri JSON"""
+    if isinstance(value, dict):
+        return {key: to_json(v) for key, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json(v) for v in value]
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calculează fizica unei scene fără Manim")
+    parser.add_argument("scene", choices=sorted(SCENES))
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="NUME=VALOARE",
+                        help="suprascrie un parametru (valoare JSON), ex. -p n2=1.7")
+    args = parser.parse_args()
+
+    params = {}
+    for item in args.param:
+        name, _, value = item.partition("=")
+        params[name] = json.loads(value)
+    print(json.dumps(to_json(compute(args.scene, **params)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
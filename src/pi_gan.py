@@ -0,0 +1,300 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+from torch import nn
+
+# PI-GAN condiționat pentru pattern-urile de interferență din plots.ipynb.
+# Față de varianta din notebook (z -> Linear(512, IMG²), o singură țintă
+# fringe(λ, d) fixă), generatorul primește (λ, d) și crește imaginea din 4×4
+# prin convoluții transpuse, deci numărul de parametri nu mai crește cu
+# IMG², iar un singur model acoperă tot intervalul de parametri.
+#
+# Țintele fringe() se calculează o singură dată pe o grilă (λ, d), în
+# FringeBank: în memorie sau într-un .npy mapat (data/fringes/<cheie>.npy),
+# refolosit între rulări. Tot acolo se păstrează poziția așteptată a
+# vârfului spectral al fiecărei ținte. Franjele mai dese decât pasul
+# pixelilor se suprapun spectral (aliasing) și vârful nu mai crește cu d;
+# banca limitează deci d la max_separation(λ_min, size), iar D_RANGE este
+# doar limita superioară cerută (la 128 px și 400 nm, d ≤ 10.2 µm).
+#
+# Pierderea fizică verifică frecvența franjelor: spectrul de putere de-a
+# lungul lui y (perpendicular pe franje), mediat pe coloane, dă prin
+# soft-argmax poziția vârfului, comparată cu cea a țintei pentru aceiași
+# (λ, d). Spre deosebire de penalizarea varianței spectrale din notebook,
+# aceasta depinde de d și este diferențiabilă.
+#
+#   python pi_gan.py --steps 2000 --size 128
+#   python pi_gan.py --size 256 --bank-mmap       # ținte mapate din data/fringes/
+
+ROOT = Path(__file__).resolve().parent.parent
+BANK_DIR = ROOT / "data" / "fringes"
+MODEL_FILE = ROOT / "models" / "pi_gan" / "generator.pt"
+PLOT_FILE = ROOT / "plots" / "pi_gan.png"
+# Intervalele condițiilor (m); ținta din notebook este λ = 500 nm, d = 20 µm,
+# dar d se reduce în FringeBank la max_separation pentru latura imaginii
+LAMBDA_RANGE = (400e-9, 700e-9)
+D_RANGE = (2e-6, 20e-6)
+
+
+def fringe(lam, d, size=128, L=1e-3):
+    """|Ψ1 + Ψ2|² pentru două surse punctiforme la y = ±d/2, pe un pătrat de latură L"""
+    x = np.linspace(-L / 2, L / 2, size)
+    xx, yy = np.meshgrid(x, x)
+    k = 2 * np.pi / lam
+    r1 = np.sqrt((yy - d / 2) ** 2 + xx**2)
+    r2 = np.sqrt((yy + d / 2) ** 2 + xx**2)
+    psi = np.exp(1j * k * r1) + np.exp(1j * k * r2)
+    return np.abs(psi) ** 2
+
+
+def normalized_fringe(lam, d, size=128, L=1e-3):
+    """fringe() normalizat la maxim, float32"""
+    target = fringe(lam, d, size, L)
+    return (target / target.max()).astype(np.float32)
+
+
+def max_separation(lam, size=128):
+    """Cel mai mare d pentru care franjele lui fringe() rămân sub Nyquist
+
+    La marginea imaginii (x = L/2, y ≈ 0) frecvența franjelor de-a lungul
+    lui y este d/(λ·L/2), iar Nyquist este (size - 1)/(2L); L se simplifică.
+    Limita cere 80% din Nyquist la margine: spre centru franjele sunt mai
+    dese, iar peste ea vârful spectral nu mai crește cu d.
+    """
+    return lam * (size - 1) / 5
+
+
+def spectral_peak(images, k_min=3, temperature=0.25):
+    """Poziția vârfului spectral de-a lungul lui y, în [0, 1] (fracție din Nyquist)
+
+    images: (B, 1, H, W). Spectrul de putere pe coloane, mediat, fără
+    componentele sub k_min (media și anvelopa); soft-argmax pe
+    p^(1/temperature), deci rezultatul nu depinde de scara imaginii.
+    """
+    x = images[:, 0]
+    x = x - x.mean(dim=1, keepdim=True)
+    power = torch.fft.rfft(x, dim=1).abs().square().mean(dim=2)[:, k_min:]
+    weights = torch.softmax(torch.log(power + 1e-12) / temperature, dim=1)
+    bins = torch.arange(k_min, k_min + power.shape[1], dtype=images.dtype, device=images.device)
+    return (weights * bins).sum(dim=1) / (images.shape[2] // 2)
+
+
+def physics_loss(images, expected_peak, **kwargs):
+    """Abaterea pătratică a vârfului spectral față de cel așteptat pentru (λ, d)"""
+    return (spectral_peak(images, **kwargs) - expected_peak).square().mean()
+
+
+class FringeBank:
+    """Ținte fringe() precalculate pe o grilă n_lambda × n_d
+
+    targets are forma (n_lambda, n_d, size, size); cu mmap=True este un .npy
+    mapat în memorie, calculat o singură dată per configurație. peaks are
+    forma (n_lambda, n_d): spectral_peak al fiecărei ținte, crescător în d.
+    Capătul superior al lui d_range se reduce la max_separation(λ_min, size);
+    ValueError dacă tot intervalul este peste această limită.
+    """
+
+    def __init__(self, size=128, n_lambda=16, n_d=16, lambda_range=LAMBDA_RANGE, d_range=D_RANGE,
+                 L=1e-3, mmap=False, directory=BANK_DIR):
+        limit = max_separation(lambda_range[0], size)
+        if d_range[0] >= limit:
+            raise ValueError(f"d ≥ {d_range[0]:.3g} m produce aliasing la {size} px și "
+                             f"λ = {lambda_range[0]:.3g} m (limita este {limit:.3g} m)")
+        d_range = (d_range[0], min(d_range[1], limit))
+        self.size = size
+        self.wavelengths = np.linspace(*lambda_range, n_lambda)
+        self.separations = np.linspace(*d_range, n_d)
+        self.lambda_range, self.d_range = lambda_range, d_range
+        shape = (n_lambda, n_d, size, size)
+        path = None
+        if mmap:
+            config = dict(size=size, n_lambda=n_lambda, n_d=n_d, lambda_range=lambda_range,
+                          d_range=d_range, L=L)
+            key = hashlib.sha256(json.dumps(config).encode()).hexdigest()[:16]
+            path = Path(directory) / f"{key}.npy"
+        if path is not None and path.exists() and path.with_suffix(".peaks.npy").exists():
+            self.targets = np.load(path, mmap_mode="r")
+            self.peaks = np.load(path.with_suffix(".peaks.npy"))
+            return
+
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp.npy")
+            targets = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=shape)
+        else:
+            targets = np.empty(shape, dtype=np.float32)
+        peaks = np.empty(shape[:2], dtype=np.float32)
+        for i, lam in enumerate(self.wavelengths):
+            for j, d in enumerate(self.separations):
+                targets[i, j] = normalized_fringe(lam, d, size, L)
+            # Vârfurile pe rânduri întregi de λ, ca tensor (n_d, 1, H, W)
+            peaks[i] = spectral_peak(torch.from_numpy(np.asarray(targets[i]))[:, None]).numpy()
+        if path is not None:
+            targets.flush()
+            del targets
+            os.replace(tmp, path)
+            np.save(path.with_suffix(".peaks.npy"), peaks)
+            targets = np.load(path, mmap_mode="r")
+        self.targets, self.peaks = targets, peaks
+
+    def conditions(self, i, j):
+        """(λ, d) normalizate în [-1, 1], ca tensor (B, 2)"""
+        lam = (self.wavelengths[i] - self.lambda_range[0]) / (self.lambda_range[1] - self.lambda_range[0])
+        d = (self.separations[j] - self.d_range[0]) / (self.d_range[1] - self.d_range[0])
+        return torch.from_numpy(np.stack([lam, d], axis=1) * 2 - 1).float()
+
+    def sample(self, batch, rng):
+        """Un lot aleator de noduri: (condiții (B, 2), ținte (B, 1, H, W), vârfuri (B,))"""
+        i = rng.integers(len(self.wavelengths), size=batch)
+        j = rng.integers(len(self.separations), size=batch)
+        targets = torch.from_numpy(np.stack([self.targets[a, b] for a, b in zip(i, j)]))[:, None]
+        return self.conditions(i, j), targets, torch.from_numpy(self.peaks[i, j])
+
+
+class Generator(nn.Module):
+    """(z, λ, d) -> imagine size×size prin convoluții transpuse pornind de la 4×4"""
+
+    def __init__(self, size=128, z_dim=32, channels=128, min_channels=4):
+        super().__init__()
+        n_up = int(np.log2(size // 4))
+        if 4 * 2**n_up != size:
+            raise ValueError(f"size trebuie să fie 4·2^k, nu {size}")
+        self.z_dim, self.channels = z_dim, channels
+        self.project = nn.Sequential(nn.Linear(z_dim + 2, channels * 16), nn.ReLU(True))
+        layers, width = [], channels
+        for _ in range(n_up):
+            out = max(width // 2, min_channels)
+            layers += [nn.ConvTranspose2d(width, out, 4, 2, 1, bias=False),
+                       nn.BatchNorm2d(out), nn.ReLU(True)]
+            width = out
+        self.up = nn.Sequential(*layers)
+        # 1×1: o convoluție 3×3 cu un singur canal de ieșire domină pasul la rezoluție mare
+        self.out = nn.Sequential(nn.Conv2d(width, 1, 1), nn.Sigmoid())
+
+    def forward(self, z, conditions):
+        h = self.project(torch.cat([z, conditions], dim=1)).view(-1, self.channels, 4, 4)
+        return self.out(self.up(h))
+
+
+class Discriminator(nn.Module):
+    """Convoluții cu pas 2 până la 4×4, cu (λ, d) ca două canale constante la intrare"""
+
+    def __init__(self, size=128, min_channels=16, max_channels=128):
+        super().__init__()
+        layers, width = [], 3
+        for k in range(int(np.log2(size // 4))):
+            out = min(min_channels * 2**k, max_channels)
+            layers += [nn.Conv2d(width, out, 4, 2, 1), nn.LeakyReLU(0.2, True)]
+            width = out
+        self.net = nn.Sequential(*layers, nn.AdaptiveAvgPool2d(1), nn.Flatten(), nn.Linear(width, 1))
+
+    def forward(self, images, conditions):
+        maps = conditions[:, :, None, None].expand(-1, -1, *images.shape[2:])
+        return self.net(torch.cat([images, maps], dim=1))
+
+
+def train(steps=2000, size=128, batch=32, z_dim=32, lambda_phys=5.0, lr=2e-4, bank=None,
+          seed=0, log_every=100, output=MODEL_FILE):
+    """Antrenează generatorul condiționat; întoarce (G, bank)"""
+    torch.manual_seed(seed)
+    rng = np.random.default_rng(seed)
+    bank = bank or FringeBank(size)
+    G, D = Generator(size, z_dim), Discriminator(size)
+    opt_G = torch.optim.Adam(G.parameters(), lr=lr, betas=(0.5, 0.999))
+    opt_D = torch.optim.Adam(D.parameters(), lr=lr, betas=(0.5, 0.999))
+    bce = nn.BCEWithLogitsLoss()
+    real_labels, fake_labels = torch.ones(batch, 1), torch.zeros(batch, 1)
+    print(f"G: {sum(p.numel() for p in G.parameters()):,} parametri, "
+          f"D: {sum(p.numel() for p in D.parameters()):,} parametri")
+
+    start = time.perf_counter()
+    for step in range(1, steps + 1):
+        # ---- Discriminator ----
+        conditions, targets, peaks = bank.sample(batch, rng)
+        fake = G(torch.randn(batch, z_dim), conditions)
+        loss_D = bce(D(targets, conditions), real_labels) + bce(D(fake.detach(), conditions), fake_labels)
+        opt_D.zero_grad(set_to_none=True)
+        loss_D.backward()
+        opt_D.step()
+
+        # ---- Generator ----
+        adv_loss = bce(D(fake, conditions), real_labels)
+        phys = physics_loss(fake, peaks)
+        loss_G = adv_loss + lambda_phys * phys
+        opt_G.zero_grad(set_to_none=True)
+        loss_G.backward()
+        opt_G.step()
+
+        if step % log_every == 0:
+            seconds = (time.perf_counter() - start) / log_every
+            print(f"Pas {step:5d} | D-loss {loss_D.item():.3f} | G-loss {loss_G.item():.3f} "
+                  f"| phys {phys.item():.2e} | {seconds * 1e3:.0f} ms/pas", flush=True)
+            start = time.perf_counter()
+
+    if output is not None:
+        output = Path(output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        torch.save(dict(model=G.state_dict(), size=size, z_dim=z_dim,
+                        lambda_range=bank.lambda_range, d_range=bank.d_range), output)
+    return G.eval(), bank
+
+
+def plot_pi_gan(G, bank, path=PLOT_FILE, z_dim=32):
+    """Regenerează plots/pi_gan.png: generat față de țintă, la câteva (λ, d)"""
+    import matplotlib.pyplot as plt
+
+    i = np.array([0, len(bank.wavelengths) // 2, len(bank.wavelengths) - 1])
+    j = np.array([len(bank.separations) - 1, len(bank.separations) // 2, 0])
+    with torch.no_grad():
+        generated = G(torch.randn(len(i), z_dim), bank.conditions(i, j))[:, 0].numpy()
+    fig, axes = plt.subplots(2, len(i), figsize=(2.2 * len(i), 4.6))
+    for column, (a, b) in enumerate(zip(i, j)):
+        title = f"λ={bank.wavelengths[a] * 1e9:.0f} nm, d={bank.separations[b] * 1e6:.0f} µm"
+        for row, image in enumerate((generated[column], bank.targets[a, b])):
+            axes[row, column].imshow(image, cmap="magma", origin="lower")
+            axes[row, column].axis("off")
+        axes[0, column].set_title(title, fontsize=7)
+    axes[0, 0].text(-0.1, 0.5, "PI-GAN", transform=axes[0, 0].transAxes, rotation=90,
+                    ha="right", va="center")
+    axes[1, 0].text(-0.1, 0.5, "fringe()", transform=axes[1, 0].transAxes, rotation=90,
+                    ha="right", va="center")
+    fig.tight_layout()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=300, bbox_inches="tight")
+    plt.close(fig)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Antrenează PI-GAN-ul condiționat pe (λ, d)")
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--size", type=int, default=128, help="latura imaginii (4·2^k)")
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--lambda-phys", type=float, default=5.0)
+    parser.add_argument("--grid", type=int, nargs=2, default=(16, 16), metavar=("N_LAMBDA", "N_D"),
+                        help="nodurile băncii de ținte")
+    parser.add_argument("--bank-mmap", action="store_true",
+                        help=f"ținte într-un .npy mapat, păstrat în {BANK_DIR}")
+    parser.add_argument("--threads", type=int, default=None, help="fire intra-op PyTorch")
+    parser.add_argument("--no-plot", action="store_true")
+    args = parser.parse_args()
+
+    torch.set_num_threads(args.threads or os.cpu_count() or 1)
+    start = time.perf_counter()
+    bank = FringeBank(args.size, *args.grid, mmap=args.bank_mmap)
+    print(f"Banca de ținte: {bank.targets.shape}, d ≤ {bank.d_range[1] * 1e6:.1f} µm, "
+          f"în {time.perf_counter() - start:.1f} s")
+    G, bank = train(args.steps, args.size, args.batch, lambda_phys=args.lambda_phys, bank=bank)
+    if not args.no_plot:
+        print(plot_pi_gan(G, bank))
+
+
+if __name__ == "__main__":
+    main()
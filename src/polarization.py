@@ -1,7 +1,13 @@
 from manim import *
 import numpy as np
 
+from mobjects import NumericLabel, OpticalChain, Polarizer
+from physics import polarization
+
 class Polarization(Scene):
+    # Parametri fizici suprascriși (vezi physics.polarization)
+    params = {}
+    
     def construct(self):
         self.camera.background_color = "#0a0a0a"
         
@@ -43,23 +49,12 @@ class Polarization(Scene):
         self.wait(1)
         
         # Polarizator 1 (vertical)
-        polarizer1 = Rectangle(
-            height=2, width=0.15,
-            color=BLUE,
-            fill_opacity=0.5
-        ).shift(LEFT * 2.5)
-        
-        polarizer1_lines = VGroup(*[
-            Line(UP * 0.9, DOWN * 0.9, stroke_width=1, color=BLUE)
-            .shift(LEFT * 2.5 + RIGHT * 0.05 * i)
-            for i in range(-2, 3)
-        ])
+        polarizer1 = Polarizer(LEFT * 2.5, color=BLUE)
         
         polarizer1_label = Text("Polarizator\n(0°)", font_size=14, color=BLUE).next_to(polarizer1, DOWN, buff=0.3)
         
         self.play(
             Create(polarizer1),
-            Create(polarizer1_lines),
             Write(polarizer1_label)
         )
         self.wait(0.5)
@@ -91,75 +86,54 @@ class Polarization(Scene):
         # Polarizator 2 (la unghi θ)
         theta_tracker = ValueTracker(0)
         
-        polarizer2 = always_redraw(
-            lambda: Rectangle(
-                height=2, width=0.15,
-                color=ORANGE,
-                fill_opacity=0.5
-            ).rotate(theta_tracker.get_value() * DEGREES).shift(RIGHT * 0.5)
-        )
+        # Polarizatorul 2 este rotit incremental, fără a fi reconstruit
+        polarizer2 = Polarizer(RIGHT * 0.5, color=ORANGE)
+        polarizer2.add_updater(lambda m: m.set_angle(theta_tracker.get_value() * DEGREES))
         
-        polarizer2_lines = always_redraw(
-            lambda: VGroup(*[
-                Line(UP * 0.9, DOWN * 0.9, stroke_width=1, color=ORANGE)
-                .rotate(theta_tracker.get_value() * DEGREES)
-                .shift(RIGHT * 0.5 + 0.05 * i * np.array([
-                    np.cos(theta_tracker.get_value() * DEGREES + PI/2),
-                    np.sin(theta_tracker.get_value() * DEGREES + PI/2),
-                    0
-                ]))
-                for i in range(-2, 3)
-            ])
-        )
-        
-        angle_display = always_redraw(
-            lambda: MathTex(
-                f"\\theta = {theta_tracker.get_value():.0f}°",
-                font_size=24,
-                color=ORANGE
-            ).next_to(polarizer2, DOWN, buff=0.5)
-        )
+        # Etichetele numerice sunt asamblate din glife compilate o singură dată
+        angle_display = NumericLabel(
+            r"\theta = {theta:.0f}°",
+            font_size=24,
+            color=ORANGE,
+            theta=theta_tracker.get_value()
+        ).next_to(polarizer2, DOWN, buff=0.5)
+        angle_display.add_updater(lambda m: m.set_value(theta=theta_tracker.get_value()))
         
         self.play(
             Create(polarizer2),
-            Create(polarizer2_lines),
             Write(angle_display)
         )
         
+        # Lumină ieșită (proporțională cu intensitatea), calculată cu matrice
+        # Jones pentru tot lanțul, o singură dată per cadru
+        output_arrows = OpticalChain([polarizer1, polarizer2])
+        output_arrows.add_updater(lambda m: m.update_light())
+        
         # Intensitate ieșire
-        intensity_display = always_redraw(
-            lambda: MathTex(
-                f"I = I_0 \\cos^2({theta_tracker.get_value():.0f}°) = {np.cos(theta_tracker.get_value() * DEGREES)**2:.2f} I_0",
-                font_size=20,
-                color=GREEN
-            ).to_corner(DR)
+        intensity_display = NumericLabel(
+            r"I = I_0 \cos^2({theta:.0f}°) = {intensity:.2f} I_0",
+            font_size=20,
+            color=GREEN,
+            aligned_edge=RIGHT,
+            theta=0,
+            intensity=1.0
+        ).to_corner(DR)
+        intensity_display.add_updater(
+            lambda m: m.set_value(
+                theta=theta_tracker.get_value(),
+                intensity=output_arrows.intensity[-1]
+            )
         )
         self.play(Write(intensity_display))
         
-        # Lumină ieșită (proporțională cu intensitatea)
-        output_arrows = always_redraw(
-            lambda: VGroup(
-                Arrow(
-                    start=RIGHT * 0.5,
-                    end=RIGHT * 0.5 + UP * 0.8 * np.cos(theta_tracker.get_value() * DEGREES)**2,
-                    color=GREEN,
-                    stroke_width=4,
-                    buff=0.1
-                ) if np.cos(theta_tracker.get_value() * DEGREES)**2 > 0.05 else VMobject(),
-                Arrow(
-                    start=RIGHT * 0.5,
-                    end=RIGHT * 0.5 + DOWN * 0.8 * np.cos(theta_tracker.get_value() * DEGREES)**2,
-                    color=GREEN,
-                    stroke_width=4,
-                    buff=0.1
-                ) if np.cos(theta_tracker.get_value() * DEGREES)**2 > 0.05 else VMobject()
-            )
-        )
         self.add(output_arrows)
+        # Eticheta se actualizează după lanț, deci citește intensitatea cadrului curent
+        self.bring_to_front(intensity_display)
         
         # Rotație polarizator
+        physics = polarization(**self.params)
         self.play(
-            theta_tracker.animate.set_value(90),
+            theta_tracker.animate.set_value(physics["theta_max_deg"]),
             run_time=4,
             rate_func=linear
         )
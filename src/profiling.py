@@ -0,0 +1,209 @@
+import argparse
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from pathlib import Path
+
+# Instrumentare opțională a ciclului de viață al scenelor Manim. Înregistrează
+# durata fiecărei faze (setup/construct/tear_down), a fiecărui self.play, a
+# fiecărui apel de updater, a desenării și a codării cadrelor, plus numărul de
+# mobject-uri create și de compilări LaTeX. Rezultatul este un fișier Chrome
+# trace (chrome://tracing, ui.perfetto.dev, speedscope pentru flame graph).
+#
+#   python profiling.py trace.json -- -ql double_slit.py DoubleSlit
+#   python render_all.py -q l --profile traces/
+
+
+def updater_name(mobject, function):
+    """Numele unui updater în rapoarte: <clasa mobject-ului>:<funcția>"""
+    name = getattr(function, "__qualname__", repr(function))
+    return f"{type(mobject).__name__}:{name.replace('.<locals>', '')}"
+
+
+def wrap_updaters(add_updater, wrap):
+    """Înlocuitor pentru Mobject.add_updater care învelește fiecare updater
+
+    wrap(funcție, nume) întoarce updater-ul învelit; cu functools.wraps
+    semnătura rămâne vizibilă, deci Manim trimite în continuare dt. Prinde și
+    updaterele din always_redraw. Folosit de Profiler și de benchmarks/.
+    """
+    @functools.wraps(add_updater)
+    def wrapper(mobject, update_function, *args, **kwargs):
+        wrapped = wrap(update_function, updater_name(mobject, update_function))
+        return add_updater(mobject, wrapped, *args, **kwargs)
+    return wrapper
+
+
+class Profiler:
+    """Colectează evenimente Chrome trace și contoare"""
+
+    def __init__(self):
+        self.events = []
+        self.counts = Counter()
+        self.pid = os.getpid()
+        self._lock = threading.Lock()
+        self._patches = []
+
+    def _now(self):
+        return time.perf_counter_ns() // 1000
+
+    @contextmanager
+    def span(self, name, category, **args):
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._add({
+                "name": name, "cat": category, "ph": "X",
+                "ts": start, "dur": self._now() - start,
+                "pid": self.pid, "tid": threading.get_ident(),
+                "args": args,
+            })
+
+    def counter(self, name, values):
+        self._add({
+            "name": name, "ph": "C", "ts": self._now(),
+            "pid": self.pid, "tid": threading.get_ident(), "args": dict(values),
+        })
+
+    def _add(self, event):
+        with self._lock:
+            self.events.append(event)
+
+    def wrap(self, function, name, category):
+        """Funcția învelită într-un span; semnătura rămâne vizibilă (dt pentru updatere)"""
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with self.span(name, category):
+                return function(*args, **kwargs)
+        return wrapper
+
+    def patch(self, owner, attribute, make_wrapper):
+        original = getattr(owner, attribute)
+        setattr(owner, attribute, make_wrapper(original))
+        self._patches.append((owner, attribute, original))
+
+    def count_calls(self, owner, attribute, key):
+        def make_wrapper(original):
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                self.counts[key] += 1
+                with self.span(key, "tex"):
+                    return original(*args, **kwargs)
+            return wrapper
+        self.patch(owner, attribute, make_wrapper)
+
+    def install(self):
+        """Instalează hook-urile pe clasele Manim"""
+        from manim import Mobject, Scene, SVGMobject, Text
+        from manim.renderer.cairo_renderer import CairoRenderer
+        from manim.scene.scene_file_writer import SceneFileWriter
+        from manim.utils import tex_file_writing
+
+        profiler = self
+
+        def render(original):
+            @functools.wraps(original)
+            def wrapper(scene, *args, **kwargs):
+                for phase in ("setup", "construct", "tear_down"):
+                    setattr(scene, phase, profiler.wrap(getattr(scene, phase), phase, "phase"))
+                with profiler.span(f"render {type(scene).__name__}", "phase"):
+                    return original(scene, *args, **kwargs)
+            return wrapper
+
+        def play(original):
+            @functools.wraps(original)
+            def wrapper(scene, *args, **kwargs):
+                names = ", ".join(type(anim).__name__ for anim in args) or "play"
+                with profiler.span(names, "play"):
+                    result = original(scene, *args, **kwargs)
+                profiler.counter("mobjects", {"created": sum(
+                    n for key, n in profiler.counts.items() if key.startswith("mobject:"))})
+                profiler.counter("latex", {"compiles": profiler.counts["latex_compile"]})
+                return result
+            return wrapper
+
+        def add_updater(original):
+            return wrap_updaters(original, lambda function, name: profiler.wrap(function, name, "updater"))
+
+        def mobject_init(original):
+            @functools.wraps(original)
+            def wrapper(mobject, *args, **kwargs):
+                profiler.counts[f"mobject:{type(mobject).__name__}"] += 1
+                return original(mobject, *args, **kwargs)
+            return wrapper
+
+        def spanned(name, category):
+            return lambda original: self.wrap(original, name, category)
+
+        self.patch(Scene, "render", render)
+        self.patch(Scene, "play", play)
+        self.patch(Mobject, "add_updater", add_updater)
+        self.patch(Mobject, "__init__", mobject_init)
+        # update_frame acoperă și camerele derivate (ThreeDCamera etc.)
+        self.patch(CairoRenderer, "update_frame", spanned("draw", "render"))
+        self.patch(SceneFileWriter, "write_frame", spanned("encode frame", "encode"))
+        self.patch(SceneFileWriter, "combine_to_movie", spanned("combine movie", "encode"))
+        self.count_calls(tex_file_writing, "compile_tex", "latex_compile")
+        self.count_calls(SVGMobject, "generate_mobject", "svg_parse")
+        self.count_calls(Text, "_text2svg", "text_render")
+        return self
+
+    def uninstall(self):
+        for owner, attribute, original in reversed(self._patches):
+            setattr(owner, attribute, original)
+        self._patches.clear()
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": dict(self.counts),
+        }))
+        return path
+
+
+@contextmanager
+def profile(path):
+    """Profilează tot ce rulează în bloc și scrie trace-ul la ieșire"""
+    profiler = Profiler().install()
+    try:
+        yield profiler
+    finally:
+        profiler.uninstall()
+        profiler.save(path)
+
+
+def enable(path):
+    """Activează profilarea pentru tot procesul; trace-ul se scrie la ieșire"""
+    profiler = Profiler().install()
+    atexit.register(profiler.save, path)
+    return profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Rulează manim cu profilare și scrie un Chrome trace",
+        usage="%(prog)s TRACE.json -- [argumente manim]",
+    )
+    parser.add_argument("trace", type=Path)
+    parser.add_argument("manim_args", nargs=argparse.REMAINDER)
+    args = parser.parse_args()
+    manim_args = args.manim_args[1:] if args.manim_args[:1] == ["--"] else args.manim_args
+
+    enable(args.trace)
+    from manim.__main__ import main as manim_main
+    sys.argv = ["manim", "render", *manim_args]
+    manim_main()
+
+
+if __name__ == "__main__":
+    main()
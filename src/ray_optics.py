@@ -0,0 +1,94 @@
+from manim import *
+import numpy as np
+
+from mobjects import ray_bundles, spectral_ray_bundles
+from physics import lens_rays, prism_rays, slab_rays
+
+class RayOpticsScene(Scene):
+    """Scenă comună: corpurile optice și fasciculele trasate de raytrace
+
+    Fiecare generație de raze (după 0, 1, 2... interfețe) este desenată ca
+    un grup de RayBundle, grupate pe trepte de putere; lumina albă (mai multe
+    lungimi de undă) este colorată pe benzi spectrale.
+    """
+
+    title = ""
+    formula = ""
+    physics_function = None
+    # Parametri fizici suprascriși (vezi physics.<funcția scenei>)
+    params = {}
+    body_color = BLUE
+    ray_color = YELLOW
+
+    def to_points(self, xy):
+        xy = np.asarray(xy)
+        return np.column_stack([xy, np.zeros(len(xy))])
+
+    def construct(self):
+        self.camera.background_color = "#0a0a0a"
+
+        title = Text(self.title, font_size=36, color=YELLOW).to_edge(UP)
+        self.play(Write(title))
+        if self.formula:
+            formula = MathTex(self.formula, font_size=28).next_to(title, DOWN, buff=0.3)
+            self.play(Write(formula))
+
+        physics = self.physics_function(**self.params)
+        bodies = VGroup(*[
+            Polygon(*self.to_points(outline[:-1]), color=self.body_color,
+                    fill_opacity=0.2, stroke_width=2)
+            for outline in physics["outlines"]
+        ])
+        self.play(Create(bodies))
+        self.annotate(physics, bodies)
+
+        # Generațiile de raze, în ordinea în care lumina le parcurge
+        starts, ends = self.to_points(physics["start"]), self.to_points(physics["end"])
+        white = np.ptp(physics["wavelength"]) > 0
+        for depth in range(int(physics["depth"].max()) + 1):
+            mask = physics["depth"] == depth
+            if white:
+                bundles = spectral_ray_bundles(starts[mask], ends[mask], physics["power"][mask],
+                                               physics["wavelength"][mask], stroke_width=1.5)
+            else:
+                bundles = ray_bundles(starts[mask], ends[mask], physics["power"][mask],
+                                      color=self.ray_color, stroke_width=1.5)
+            self.play(Create(bundles), run_time=1, rate_func=linear)
+        self.wait(2)
+
+    def annotate(self, physics, bodies):
+        """Etichete specifice scenei"""
+
+
+class PrismRays(RayOpticsScene):
+    title = "Dispersia printr-o Prismă"
+    formula = r"n_1 \sin\theta_1 = n(\lambda) \sin\theta_2"
+    physics_function = staticmethod(prism_rays)
+
+    def annotate(self, physics, bodies):
+        label = MathTex(rf"n_d = {physics['n_d']:.3f}", font_size=24, color=self.body_color)
+        self.play(Write(label.next_to(bodies, DOWN, buff=0.3)))
+
+
+class SlabRays(RayOpticsScene):
+    title = "Placă cu Fețe Paralele"
+    formula = r"R = \frac{R_s + R_p}{2}, \quad T = 1 - R"
+    physics_function = staticmethod(slab_rays)
+    body_color = GREEN
+
+    def annotate(self, physics, bodies):
+        label = MathTex(rf"n = {physics['n']}", font_size=24, color=self.body_color)
+        self.play(Write(label.next_to(bodies, RIGHT, buff=0.3)))
+
+
+class LensRays(RayOpticsScene):
+    title = "Lentilă Convergentă"
+    formula = r"\frac{1}{f} = (n - 1)\left(\frac{1}{R_1} - \frac{1}{R_2}\right)"
+    physics_function = staticmethod(lens_rays)
+
+    def annotate(self, physics, bodies):
+        axis = DashedLine(LEFT * 6.5 + DOWN * 0.5, RIGHT * 6.5 + DOWN * 0.5,
+                          color=GRAY, stroke_width=1)
+        focus = Dot(RIGHT * (physics["focal_length"] - 1.0) + DOWN * 0.5, color=RED)
+        focus_label = MathTex("F", font_size=24, color=RED).next_to(focus, DOWN, buff=0.15)
+        self.play(Create(axis), FadeIn(focus), Write(focus_label))
@@ -0,0 +1,299 @@
+import numpy as np
+
+from optics import fresnel_reflectance
+from spectral import refractive_index
+
+# Trasare de raze 2D vectorizată, fără Manim. Sistemul optic este o mulțime de
+# segmente (arcele sunt poligonizate), fiecare cu mediul din stânga și din
+# dreapta lui (față de sensul p0 -> p1). Un mediu este un indice de refracție
+# constant, o funcție n(λ) cu λ în nm sau un nume din spectral.MATERIALS
+# (spectral.refractive_index). Toate razele unei generații sunt
+# propagate împreună: intersecțiile trec printr-un BVH peste segmente, iar
+# Snell, reflexia totală internă și împărțirea Fresnel sunt operații pe array-uri.
+
+EPS = 1e-9
+
+
+def _cross(a, b):
+    return a[..., 0] * b[..., 1] - a[..., 1] * b[..., 0]
+
+
+class BVH:
+    """Ierarhie de dreptunghiuri încadratoare peste segmente
+
+    Nodurile sunt stocate în array-uri; traversarea este făcută pe lățime
+    pentru toate razele deodată, cu perechi (rază, nod) ca frontieră, deci o
+    rază testează O(log M) noduri în loc de toate cele M segmente.
+    """
+
+    def __init__(self, segments, leaf_size=4):
+        segments = np.asarray(segments, dtype=float).reshape(-1, 4)
+        lo = np.minimum(segments[:, :2], segments[:, 2:])
+        hi = np.maximum(segments[:, :2], segments[:, 2:])
+        centers = (lo + hi) / 2
+
+        self.lo, self.hi, self.children, self.start, self.count = [], [], [], [], []
+        order = []
+        pending = [(np.arange(len(segments)), None, 0)]
+        while pending:
+            indices, parent, side = pending.pop()
+            node = len(self.lo)
+            if parent is not None:
+                self.children[parent][side] = node
+            self.lo.append(lo[indices].min(axis=0))
+            self.hi.append(hi[indices].max(axis=0))
+            self.children.append([-1, -1])
+            if len(indices) <= leaf_size:
+                self.start.append(len(order))
+                self.count.append(len(indices))
+                order.extend(indices)
+                continue
+            self.start.append(0)
+            self.count.append(0)
+            # Împărțire la mediană pe axa cea mai lungă a centrelor
+            axis = np.argmax(np.ptp(centers[indices], axis=0))
+            indices = indices[np.argsort(centers[indices, axis], kind="stable")]
+            half = len(indices) // 2
+            pending.append((indices[half:], node, 1))
+            pending.append((indices[:half], node, 0))
+
+        self.lo, self.hi = np.array(self.lo), np.array(self.hi)
+        self.children = np.array(self.children)
+        self.start, self.count = np.array(self.start), np.array(self.count)
+        self.order = np.array(order, dtype=int)
+
+    def candidates(self, origins, directions):
+        """Perechile (rază, segment) ale căror dreptunghiuri sunt atinse de rază"""
+        with np.errstate(divide="ignore"):
+            inverse = 1 / directions
+        rays = np.arange(len(origins))
+        nodes = np.zeros(len(origins), dtype=int)
+        found_rays, found_segments = [], []
+        while len(rays):
+            o, inv = origins[rays], inverse[rays]
+            with np.errstate(invalid="ignore"):
+                t1 = (self.lo[nodes] - o) * inv
+                t2 = (self.hi[nodes] - o) * inv
+            t_near = np.fmin(t1, t2).max(axis=1)
+            t_far = np.fmax(t1, t2).min(axis=1)
+            hit = t_far >= np.maximum(t_near, 0)
+            rays, nodes = rays[hit], nodes[hit]
+
+            leaf = self.children[nodes, 0] < 0
+            counts = self.count[nodes[leaf]]
+            leaf_rays = np.repeat(rays[leaf], counts)
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            found_rays.append(leaf_rays)
+            found_segments.append(self.order[np.repeat(self.start[nodes[leaf]], counts) + offsets])
+
+            rays = np.repeat(rays[~leaf], 2)
+            nodes = self.children[nodes[~leaf]].ravel()
+        return np.concatenate(found_rays), np.concatenate(found_segments)
+
+
+class OpticalSystem:
+    """Interfețele unei scene 2D, cu mediile de o parte și de alta"""
+
+    def __init__(self, ambient=1.0):
+        self.ambient = ambient
+        self.media = [ambient]
+        self._segments, self._left, self._right = [], [], []
+        self.outlines = []
+        self._bvh = None
+
+    def _medium_id(self, medium):
+        for i, known in enumerate(self.media):
+            if known is medium or (not callable(known) and not callable(medium) and known == medium):
+                return i
+        self.media.append(medium)
+        return len(self.media) - 1
+
+    def add_segment(self, p0, p1, left, right=None):
+        """Interfață între `left` (la stânga lui p0 -> p1) și `right` (implicit aerul)"""
+        self._segments.append((*p0, *p1))
+        self._left.append(self._medium_id(left))
+        self._right.append(self._medium_id(self.ambient if right is None else right))
+        self._bvh = None
+        return self
+
+    def add_polyline(self, points, left, right=None, closed=False):
+        points = np.asarray(points, dtype=float)
+        ends = np.roll(points, -1, axis=0) if closed else points[1:]
+        for p0, p1 in zip(points, ends):
+            self.add_segment(p0, p1, left, right)
+        self.outlines.append(np.vstack([points, points[:1]]) if closed else points)
+        return self
+
+    def add_polygon(self, points, medium, outside=None):
+        """Corp închis din mediul `medium`; vârfurile sunt reordonate trigonometric"""
+        points = np.asarray(points, dtype=float)
+        area = _cross(points, np.roll(points, -1, axis=0)).sum()
+        if area < 0:
+            points = points[::-1]
+        # Parcurs trigonometric, interiorul este la stânga fiecărei laturi
+        return self.add_polyline(points, medium, outside, closed=True)
+
+    @property
+    def segments(self):
+        return np.array(self._segments, dtype=float).reshape(-1, 4)
+
+    @property
+    def bvh(self):
+        if self._bvh is None:
+            self._bvh = BVH(self.segments)
+        return self._bvh
+
+    def indices(self, medium_ids, wavelength):
+        """n pentru fiecare rază, din id-ul mediului și lungimea ei de undă"""
+        out = np.empty(len(medium_ids))
+        for i, medium in enumerate(self.media):
+            mask = medium_ids == i
+            if mask.any():
+                out[mask] = refractive_index(medium, wavelength[mask])
+        return out
+
+    def intersect(self, origins, directions, exclude=None):
+        """Cea mai apropiată intersecție: (segment, t); -1 și inf dacă raza iese"""
+        segments = self.segments
+        rays, candidates = self.bvh.candidates(origins, directions)
+        p, e = segments[candidates, :2], segments[candidates, 2:] - segments[candidates, :2]
+        d, q = directions[rays], p - origins[rays]
+        denom = _cross(d, e)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = _cross(q, e) / denom
+            s = _cross(q, d) / denom
+        valid = (np.abs(denom) > EPS) & (t > EPS) & (s >= 0) & (s <= 1)
+        if exclude is not None:
+            valid &= candidates != exclude[rays]
+
+        rays, candidates, t = rays[valid], candidates[valid], t[valid]
+        order = np.lexsort((t, rays))
+        rays, candidates, t = rays[order], candidates[order], t[order]
+        first = np.unique(rays, return_index=True)[1]
+
+        hit_segment = np.full(len(origins), -1)
+        hit_t = np.full(len(origins), np.inf)
+        hit_segment[rays[first]] = candidates[first]
+        hit_t[rays[first]] = t[first]
+        return hit_segment, hit_t
+
+
+def trace(system, origins, directions, wavelength=550.0, power=1.0, max_depth=8,
+          min_power=1e-3, fresnel=True, far=20.0):
+    """Propagă un lot de raze prin sistem
+
+    La fiecare interfață o rază se împarte într-una reflectată (puterea R,
+    Fresnel nepolarizat) și una refractată (1 - R); la reflexie totală
+    internă rămâne doar cea reflectată. Cu `fresnel=False` razele doar se
+    refractă (sau se reflectă total). Razele sub `min_power` sunt abandonate.
+
+    Întoarce segmentele drumurilor: start, end (M, 2), power, wavelength,
+    depth (M,); razele care ies din sistem sunt prelungite cu `far`.
+    """
+    origins = np.array(origins, dtype=float).reshape(-1, 2)
+    n = len(origins)
+    directions = np.broadcast_to(np.asarray(directions, dtype=float), (n, 2))
+    directions = directions / np.linalg.norm(directions, axis=1, keepdims=True)
+    wavelength = np.broadcast_to(np.asarray(wavelength, dtype=float), (n,)).copy()
+    power = np.broadcast_to(np.asarray(power, dtype=float), (n,)).copy()
+    last = np.full(n, -1)
+
+    segments = system.segments
+    edges = segments[:, 2:] - segments[:, :2]
+    normals = np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+    normals /= np.linalg.norm(normals, axis=1, keepdims=True)
+    left, right = np.array(system._left), np.array(system._right)
+
+    paths = {key: [] for key in ("start", "end", "power", "wavelength", "depth")}
+    for depth in range(max_depth + 1):
+        if not len(origins):
+            break
+        hit, t = system.intersect(origins, directions, exclude=last)
+        ends = origins + directions * np.minimum(t, far)[:, None]
+        for key, value in (("start", origins), ("end", ends), ("power", power),
+                           ("wavelength", wavelength), ("depth", np.full(len(origins), depth))):
+            paths[key].append(value)
+
+        inside = (hit >= 0) & (depth < max_depth)
+        hit, d, p = hit[inside], directions[inside], ends[inside]
+        wl, pw = wavelength[inside], power[inside]
+
+        # Normala orientată spre raza incidentă și mediile de pe cele două fețe
+        normal = normals[hit]
+        from_left = np.einsum("ij,ij->i", d, normal) < 0
+        normal = np.where(from_left[:, None], normal, -normal)
+        n1 = system.indices(np.where(from_left, left[hit], right[hit]), wl)
+        n2 = system.indices(np.where(from_left, right[hit], left[hit]), wl)
+        cos_i = np.clip(-np.einsum("ij,ij->i", d, normal), 0, 1)
+
+        eta = n1 / n2
+        k = 1 - eta**2 * (1 - cos_i**2)
+        tir = k < 0
+        reflected = d + 2 * cos_i[:, None] * normal
+        refracted = eta[:, None] * d + (eta * cos_i - np.sqrt(np.maximum(k, 0)))[:, None] * normal
+
+        if fresnel:
+            r = fresnel_reflectance(n1, n2, np.arccos(cos_i))
+        else:
+            r = tir.astype(float)
+        reflect = r * pw >= min_power
+        transmit = ~tir & ((1 - r) * pw >= min_power)
+
+        origins = np.concatenate([p[reflect], p[transmit]])
+        directions = np.concatenate([reflected[reflect], refracted[transmit]])
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+        wavelength = np.concatenate([wl[reflect], wl[transmit]])
+        power = np.concatenate([(r * pw)[reflect], ((1 - r) * pw)[transmit]])
+        last = np.concatenate([hit[reflect], hit[transmit]])
+
+    return {key: np.concatenate(values) if values else np.empty(0) for key, values in paths.items()}
+
+
+def beam(center, direction, width, n_rays):
+    """Fascicul paralel: n_rays origini pe un segment perpendicular pe direcție"""
+    direction = np.asarray(direction, dtype=float)
+    direction = direction / np.linalg.norm(direction)
+    across = np.array([-direction[1], direction[0]])
+    offsets = np.linspace(-width / 2, width / 2, n_rays)
+    return np.asarray(center, dtype=float) + offsets[:, None] * across, np.tile(direction, (n_rays, 1))
+
+
+def fan(origin, angle_range, n_rays):
+    """Evantai de raze dintr-un punct, cu unghiurile (rad) în intervalul dat"""
+    angles = np.linspace(*angle_range, n_rays)
+    directions = np.stack([np.cos(angles), np.sin(angles)], axis=1)
+    return np.tile(np.asarray(origin, dtype=float), (n_rays, 1)), directions
+
+
+def arc_points(center, radius, start, end, n_segments=64):
+    angles = np.linspace(start, end, n_segments + 1)
+    return np.asarray(center, dtype=float) + radius * np.stack([np.cos(angles), np.sin(angles)], axis=1)
+
+
+def prism(medium, center=(0.0, 0.0), side=3.0, apex_deg=60.0, ambient=1.0):
+    """Prismă isoscelă cu vârful în sus și unghiul apex_deg la vârf"""
+    half = np.radians(apex_deg) / 2
+    height = side * np.cos(half)
+    base = side * np.sin(half)
+    cx, cy = center
+    points = [(cx - base, cy - height / 3), (cx + base, cy - height / 3), (cx, cy + 2 * height / 3)]
+    return OpticalSystem(ambient).add_polygon(points, medium)
+
+
+def slab(medium, center=(0.0, 0.0), width=4.0, height=1.5, angle_deg=0.0, ambient=1.0):
+    """Placă dreptunghiulară, rotită cu angle_deg"""
+    corners = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)]) * (width / 2, height / 2)
+    angle = np.radians(angle_deg)
+    rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]])
+    return OpticalSystem(ambient).add_polygon(corners @ rotation.T + center, medium)
+
+
+def biconvex_lens(medium, center=(0.0, 0.0), radius=3.0, aperture=2.0, n_segments=48,
+                  ambient=1.0):
+    """Lentilă biconvexă simetrică: două arce de rază `radius`, înălțimea 2·aperture"""
+    alpha = np.arcsin(aperture / radius)
+    sag = radius - np.sqrt(radius**2 - aperture**2)
+    cx, cy = center
+    right = arc_points((cx + sag - radius, cy), radius, -alpha, alpha, n_segments)
+    left = arc_points((cx - sag + radius, cy), radius, np.pi - alpha, np.pi + alpha, n_segments)
+    return OpticalSystem(ambient).add_polygon(np.vstack([right, left[1:-1]]), medium)
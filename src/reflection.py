@@ -1,7 +1,12 @@
 from manim import *
 import numpy as np
 
+from physics import reflection
+
 class Reflection(Scene):
+    # Parametri fizici suprascriși (vezi physics.reflection)
+    params = {}
+    
     def construct(self):
         self.camera.background_color = '#0a0a0a'
         
@@ -31,10 +36,15 @@ class Reflection(Scene):
         incident_point = Dot(ORIGIN + DOWN * 1, color=RED, radius=0.08)
         
         # Raze - cu direcții corecte
-        incident_start = LEFT * 2.5 + UP * 1.5
+        physics = reflection(**self.params)
+        ray_length = 2.5 * np.sqrt(2)
+        incident_dir = np.append(physics["incident_dir"], 0)
+        reflected_dir = np.append(physics["reflected_dir"], 0)
+        
         incident_end = ORIGIN + DOWN * 1
+        incident_start = incident_end - ray_length * incident_dir
         
-        reflected_end = RIGHT * 2.5 + UP * 1.5
+        reflected_end = incident_end + ray_length * reflected_dir
         
         incident_ray = Arrow(
             start=incident_start,
@@ -1,7 +1,13 @@
 from manim import *
 import numpy as np
 
+from physics import refraction
+from mobjects import spectral_ray_bundles
+
 class Refraction(Scene):
+    # Parametri fizici suprascriși (vezi physics.refraction)
+    params = {}
+    
     def construct(self):
         self.camera.background_color = "#0a0a0a"
         
@@ -32,8 +38,16 @@ class Refraction(Scene):
             stroke_color=GREEN, stroke_width=2
         ).shift(DOWN * 1.5)
         
-        medium1_label = Text("Aer (n₁ = 1.0)", font_size=18, color=BLUE).move_to(UP * 2.3 + LEFT * 4)
-        medium2_label = Text("Sticlă (n₂ = 1.5)", font_size=18, color=GREEN).move_to(DOWN * 2.3 + LEFT * 4)
+        # Parametri
+        physics = refraction(**self.params)
+        n1, n2 = physics["n1"], physics["n2"]
+        theta1_deg = physics["theta1_deg"]
+        theta1 = physics["theta1"]
+        theta2 = physics["theta2"]
+        spectrum = physics["spectrum"]
+        
+        medium1_label = Text(f"Aer (n₁ = {n1:g})", font_size=18, color=BLUE).move_to(UP * 2.3 + LEFT * 4)
+        medium2_label = Text(f"Sticlă (n₂ = {n2:.4g})", font_size=18, color=GREEN).move_to(DOWN * 2.3 + LEFT * 4)
         
         self.play(
             Create(medium1), Create(medium2),
@@ -47,12 +61,6 @@ class Refraction(Scene):
         normal = DashedLine(UP * 2.2, DOWN * 2.2, color=GRAY, stroke_width=2)
         self.play(Create(normal))
         
-        # Parametri
-        n1, n2 = 1.0, 1.5
-        theta1_deg = 45
-        theta1 = theta1_deg * DEGREES
-        theta2 = np.arcsin((n1 / n2) * np.sin(theta1))
-        
         # Punct de refracție
         refraction_point = Dot(ORIGIN, color=RED, radius=0.08)
         
@@ -103,8 +111,8 @@ class Refraction(Scene):
             color=ORANGE
         )
         
-        angle1_label = MathTex(r"\theta_1 = 45°", font_size=20, color=YELLOW).next_to(angle1, LEFT, buff=0.3)
-        angle2_label = MathTex(f"\\theta_2 = {np.degrees(theta2):.1f}°", font_size=20, color=ORANGE).next_to(angle2, RIGHT, buff=0.3)
+        angle1_label = MathTex(f"\\theta_1 = {theta1_deg:.0f}°", font_size=20, color=YELLOW).next_to(angle1, LEFT, buff=0.3)
+        angle2_label = MathTex(f"\\theta_2 = {physics['theta2_deg']:.1f}°", font_size=20, color=ORANGE).next_to(angle2, RIGHT, buff=0.3)
         
         self.play(Create(angle1), Create(angle2))
         self.play(Write(angle1_label), Write(angle2_label))
@@ -112,8 +120,31 @@ class Refraction(Scene):
         # Info
         n_text = VGroup(
             MathTex(f"n_1 = {n1}", font_size=24, color=BLUE),
-            MathTex(f"n_2 = {n2}", font_size=24, color=GREEN)
+            MathTex(f"n_2 = {n2:.4g}", font_size=24, color=GREEN)
         ).arrange(DOWN, aligned_edge=LEFT).to_corner(UR)
         
         self.play(Write(n_text))
+        
+        # Dispersia: evantaiul razelor refractate pe tot spectrul vizibil,
+        # câte un RayBundle pe bandă de culoare
+        spectral_length = 3.0
+        ends = spectral_length * np.column_stack([
+            np.sin(spectrum["theta2"]), -np.cos(spectrum["theta2"])
+        ])
+        fan = spectral_ray_bundles(
+            np.zeros_like(ends), ends, np.ones(len(ends)), spectrum["wavelength"],
+            stroke_width=1.5
+        )
+        
+        spread = np.degrees(spectrum["theta2"][[0, -1]])
+        spread_text = MathTex(
+            rf"\theta_2 = {spread[0]:.2f}° \ldots {spread[-1]:.2f}°",
+            font_size=20, color=WHITE
+        ).next_to(n_text, DOWN, aligned_edge=LEFT)
+        spread_caption = Text(
+            f"{spectrum['wavelength'][0]:.0f}–{spectrum['wavelength'][-1]:.0f} nm",
+            font_size=14, color=GRAY
+        ).next_to(spread_text, DOWN, aligned_edge=LEFT, buff=0.1)
+        
+        self.play(Create(fan), Write(spread_text), Write(spread_caption), run_time=1.5)
         
\ No newline at end of file
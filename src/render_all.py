@@ -0,0 +1,178 @@
+import argparse
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from physics import SCENES, default_params, load_scene
+from render_cache import DEFAULT_MAX_BYTES, RenderCache, cache_key
+
+# Randează toate scenele în paralel, câte un proces per scenă. Fiecare
+# worker are propriile directoare media/tex/texts, ca să nu se calce pe
+# `media_dir`-ul comun din manim.cfg; la final videoclipurile sunt mutate
+# în media_output/videos. Scenele neschimbate sunt luate din RenderCache, iar
+# animațiile neschimbate din scenele modificate refolosesc fișierele parțiale.
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG_FILE = ROOT / "manim.cfg"
+OUTPUT_DIR = ROOT / "media_output" / "videos"
+WORK_DIR = ROOT / "media_output" / "workers"
+
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def worker_config(worker_dir, quality, partial_dir=None):
+    """Setările Manim ale unui worker, cu directoare separate"""
+    settings = {
+        "quality": QUALITIES[quality],
+        "media_dir": str(worker_dir),
+        "video_dir": str(worker_dir / "videos"),
+        "images_dir": str(worker_dir / "images"),
+        "tex_dir": str(worker_dir / "tex"),
+        "text_dir": str(worker_dir / "texts"),
+        "log_dir": str(worker_dir / "logs"),
+        "partial_movie_dir": str(worker_dir / "partial_movie_files"),
+    }
+    if partial_dir is not None:
+        # Cache-ul Manim per animație, păstrat între rulări
+        settings.update(
+            partial_movie_dir=str(partial_dir),
+            disable_caching=False,
+            flush_cache=False,
+        )
+    return settings
+
+
+def render_scene(scene_name, quality="h", work_dir=WORK_DIR, output_dir=OUTPUT_DIR,
+                 partial_dir=None, profile_dir=None, params=None, output_name=None):
+    """Randează o scenă într-un director propriu; întoarce (nume, secunde, fișier)
+
+    `params` suprascrie parametrii fizici ai scenei; `output_name` înlocuiește
+    numele videoclipului (variantele aceleiași scene au altfel același nume).
+    """
+    start = time.perf_counter()
+
+    from manim import config, tempconfig
+
+    worker_dir = Path(work_dir) / scene_name
+    config.digest_file(CONFIG_FILE)
+    with tempconfig(worker_config(worker_dir, quality, partial_dir)):
+        if profile_dir is not None:
+            from profiling import profile
+            with profile(Path(profile_dir) / f"{scene_name}.trace.json"):
+                scene = load_scene(scene_name, params)()
+                scene.render()
+        else:
+            scene = load_scene(scene_name, params)()
+            scene.render()
+        movie = Path(scene.renderer.file_writer.movie_file_path)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output = output_dir / (output_name or movie.name)
+    shutil.move(str(movie), output)
+    return scene_name, time.perf_counter() - start, output
+
+
+def render_all(scene_names, quality="h", jobs=None, work_dir=WORK_DIR, output_dir=OUTPUT_DIR,
+               cache=None, profile_dir=None, params=None):
+    """Randează scenele pe un pool de procese; întoarce {nume: (secunde, fișier)}
+
+    `params` ({scenă: {parametru: valoare}}) suprascrie parametrii fizici.
+    """
+    params = params or {}
+    results = {}
+    keys = {}
+    pending = []
+    for name in scene_names:
+        if cache is None:
+            pending.append(name)
+            continue
+        start = time.perf_counter()
+        keys[name] = cache_key(name, quality, params.get(name))
+        output = Path(output_dir) / f"{name}.mp4"
+        if cache.get(keys[name], output):
+            results[name] = (time.perf_counter() - start, output)
+            print(f"{name:<20} {results[name][0]:8.1f} s  {output} (din cache)", flush=True)
+        else:
+            pending.append(name)
+
+    if not pending:
+        return results
+
+    jobs = jobs or min(len(pending), os.cpu_count() or 1)
+    # spawn: fiecare worker importă Manim curat, cu propria configurație globală
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                render_scene, name, quality, work_dir, output_dir,
+                cache.partial_dir(name, quality) if cache is not None else None,
+                profile_dir, params.get(name),
+            )
+            for name in pending
+        ]
+        for future in as_completed(futures):
+            name, seconds, output = future.result()
+            if cache is not None:
+                cache.put(keys[name], output, name, quality)
+            results[name] = (seconds, output)
+            print(f"{name:<20} {seconds:8.1f} s  {output}", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Randează scenele Manim în paralel")
+    parser.add_argument("scenes", nargs="*", metavar="SCENE",
+                        help=f"scenele de randat (implicit toate): {', '.join(SCENES)}")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h",
+                        help="calitatea: l, m, h, p, k (implicit h)")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="număr de procese (implicit numărul de nuclee)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="randează totul de la zero, fără cache")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 1024**2,
+                        help="dimensiunea maximă a cache-ului pe disc, în MB")
+    parser.add_argument("--profile", type=Path, default=None, metavar="DIR",
+                        help="scrie câte un Chrome trace per scenă în DIR (fără cache)")
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="NUME=VALOARE",
+                        help="parametru fizic (valoare JSON) aplicat scenelor care îl au")
+    args = parser.parse_args()
+    unknown = set(args.scenes) - set(SCENES)
+    if unknown:
+        parser.error(f"scene necunoscute: {', '.join(sorted(unknown))}")
+
+    scene_names = args.scenes or list(SCENES)
+    overrides = {}
+    for item in args.param:
+        name, _, value = item.partition("=")
+        overrides[name] = json.loads(value)
+    params = {
+        scene: {name: value for name, value in overrides.items() if name in default_params(scene)}
+        for scene in scene_names
+    }
+    start = time.perf_counter()
+    # O scenă luată din cache nu rulează deloc, deci profilarea randează tot
+    use_cache = not (args.no_cache or args.profile)
+    cache = RenderCache(max_bytes=int(args.cache_size * 1024**2)) if use_cache else None
+    results = render_all(scene_names, args.quality, args.jobs, cache=cache,
+                         profile_dir=args.profile, params=params)
+    wall = time.perf_counter() - start
+
+    total = sum(seconds for seconds, _ in results.values())
+    slowest = max(results, key=lambda name: results[name][0])
+    print(f"\nTimp total: {wall:.1f} s (suma scenelor {total:.1f} s, "
+          f"cea mai lentă {slowest} {results[slowest][0]:.1f} s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+import ast
+import hashlib
+import json
+import os
+import shutil
+import time
+from importlib import metadata
+from pathlib import Path
+
+from physics import SCENES, default_params, to_json
+
+# Cache adresat prin conținut pentru randări. Cheia unei scene combină hash-ul
+# sursei (fișierul scenei plus modulele locale importate), parametrii fizici,
+# calitatea și versiunea Manim. Pe disc:
+#
+#   objects/<cheie>.mp4        videoclipul final al scenei
+#   partials/<scenă>-<calit.>/ fișierele parțiale ale Manim, refolosite per animație
+#   index.json                 dimensiuni și ultima folosire, pentru evicție LRU
+
+SRC_DIR = Path(__file__).resolve().parent
+CACHE_DIR = SRC_DIR.parent / "media_output" / "render_cache"
+DEFAULT_MAX_BYTES = 2 * 1024**3
+
+
+def local_imports(path):
+    """Modulele din src/ importate direct de un fișier"""
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and node.level == 0:
+            names.add(node.module.split(".")[0])
+    return sorted(name for name in names if (SRC_DIR / f"{name}.py").exists())
+
+
+def source_hash(scene_name):
+    """Hash-ul sursei scenei și al tuturor modulelor locale de care depinde"""
+    digest = hashlib.sha256()
+    pending, seen = [SCENES[scene_name][0]], set()
+    while pending:
+        module = pending.pop()
+        if module in seen:
+            continue
+        seen.add(module)
+        path = SRC_DIR / f"{module}.py"
+        pending.extend(local_imports(path))
+
+    for module in sorted(seen):
+        digest.update(module.encode())
+        digest.update((SRC_DIR / f"{module}.py").read_bytes())
+    return digest.hexdigest()
+
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def cache_key(scene_name, quality, params=None):
+    """Cheia de cache a unei randări"""
+    all_params = dict(default_params(scene_name), **(params or {}))
+    payload = {
+        "scene": scene_name,
+        "source": source_hash(scene_name),
+        "params": to_json(all_params),
+        "quality": quality,
+        "manim": manim_version(),
+    }
+    blob = json.dumps(payload, sort_keys=True).encode()
+    return hashlib.sha256(blob).hexdigest()
+
+
+def tree_size(path):
+    path = Path(path)
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+class RenderCache:
+    """Cache pe disc cu limită de dimensiune și evicție LRU
+
+    Indexul este citit și scris doar de procesul principal al
+    orchestratorului; worker-ii primesc doar directorul de parțiale.
+    """
+
+    def __init__(self, root=CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.index_path = self.root / "index.json"
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        (self.root / "partials").mkdir(parents=True, exist_ok=True)
+        self.index = self._load_index()
+
+    def _load_index(self):
+        if self.index_path.exists():
+            return json.loads(self.index_path.read_text())
+        return {}
+
+    def _save_index(self):
+        tmp = self.index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.index, indent=1))
+        os.replace(tmp, self.index_path)
+
+    def _entry_path(self, name):
+        return self.root / self.index[name]["path"]
+
+    def object_path(self, key):
+        return self.root / "objects" / f"{key}.mp4"
+
+    def partial_dir(self, scene_name, quality):
+        """Directorul de fișiere parțiale al unei scene (refolosit între rulări)"""
+        return self.root / "partials" / f"{scene_name}-{quality}"
+
+    def get(self, key, destination):
+        """Copiază videoclipul din cache în destinație; False dacă lipsește"""
+        path = self.object_path(key)
+        if key not in self.index or not path.exists():
+            return False
+        Path(destination).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(path, destination)
+        self._touch(key)
+        self._save_index()
+        return True
+
+    def put(self, key, video, scene_name, quality):
+        """Salvează videoclipul unei randări și actualizează parțialele scenei"""
+        path = self.object_path(key)
+        shutil.copyfile(video, path)
+        self.index[key] = {"path": str(path.relative_to(self.root)), "size": path.stat().st_size}
+        self._touch(key)
+
+        # Videoclipul și parțialele abia înregistrate nu sunt candidate la evicție
+        protect = {key}
+        partials = self.partial_dir(scene_name, quality)
+        if partials.exists():
+            name = f"partials:{scene_name}-{quality}"
+            self.index[name] = {"path": str(partials.relative_to(self.root)), "size": tree_size(partials)}
+            self._touch(name)
+            protect.add(name)
+
+        self.evict(protect=protect)
+        self._save_index()
+
+    def _touch(self, name):
+        self.index[name]["last_used"] = time.time()
+
+    def total_bytes(self):
+        return sum(entry["size"] for entry in self.index.values())
+
+    def evict(self, protect=()):
+        """Șterge intrările folosite cel mai demult până sub max_bytes"""
+        for name in sorted(self.index, key=lambda n: self.index[n]["last_used"]):
+            if self.total_bytes() <= self.max_bytes:
+                break
+            if name in protect:
+                continue
+            path = self._entry_path(name)
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.exists():
+                path.unlink()
+            del self.index[name]
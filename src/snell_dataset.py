@@ -0,0 +1,147 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+from optics import snell
+
+# Setul de date Snell (n1, n2, θ1 -> θ2) pentru modelele din plots.ipynb,
+# generat pe bucăți și scris pe coloane în fișiere .npy, fără pandas și fără
+# CSV. Fiecare bucată are propriul generator, derivat cu SeedSequence.spawn
+# din sămânța setului, deci rezultatul depinde doar de (seed, chunk_rows) și
+# nu de numărul de procese. O bucată conține exact chunk_rows rânduri valide:
+# eșantioanele cu reflexie totală internă sunt respinse și se trag altele,
+# deci distribuția este cea din notebook (uniformă pe regiunea validă), dar
+# dimensiunea setului este exact cea cerută.
+#
+#   data/snell/
+#       meta.json                     rânduri, coloane, tip, sămânță, intervale
+#       n1.npy n2.npy theta1.npy theta2.npy
+#
+# Coloanele se deschid cu np.load(mmap_mode="r"): citirea nu copiază nimic,
+# iar un set de 10^8 rânduri nu trebuie să încapă în memorie. meta.json se
+# scrie ultimul, deci un set fără el este incomplet.
+#
+#   python snell_dataset.py 100000000 -j 8
+#   python snell_dataset.py 1000000 -o ../data/snell_small --seed 7
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = ROOT / "data" / "snell"
+COLUMNS = ("n1", "n2", "theta1", "theta2")
+# Intervalele uniforme din notebook; θ în grade
+RANGES = {"n1": (1.0, 1.5), "n2": (1.3, 2.0), "theta1": (0.0, 80.0)}
+CHUNK_ROWS = 1 << 20
+
+
+def sample_chunk(seed, n_rows, ranges=RANGES, out=None, dtype=np.float32):
+    """Exact n_rows rânduri valide din generatorul `seed`; {coloană: array}
+
+    Cu `out` ({coloană: array de n_rows}) rândurile se scriu direct acolo,
+    de exemplu într-o felie dintr-un .npy mapat în memorie.
+    """
+    rng = np.random.default_rng(seed)
+    if out is None:
+        out = {name: np.empty(n_rows, dtype=dtype) for name in COLUMNS}
+    filled, acceptance = 0, 1.0
+    while filled < n_rows:
+        need = n_rows - filled
+        # Se trage puțin peste cât e nevoie, după rata de acceptare observată
+        draw = int(need / acceptance * 1.05) + 64
+        n1 = rng.uniform(*ranges["n1"], draw)
+        n2 = rng.uniform(*ranges["n2"], draw)
+        theta1 = rng.uniform(*ranges["theta1"], draw)
+        theta2 = np.degrees(snell(n1, n2, np.radians(theta1)))
+        valid = np.flatnonzero(~np.isnan(theta2))
+        acceptance = max(len(valid) / draw, 1e-3)
+        valid = valid[:need]
+        for name, values in zip(COLUMNS, (n1, n2, theta1, theta2)):
+            out[name][filled:filled + len(valid)] = values[valid]
+        filled += len(valid)
+    return out
+
+
+def _write_chunk(path, seed, start, stop, ranges):
+    """Umple rândurile [start, stop) ale coloanelor deja create; rulează într-un worker"""
+    columns = {name: np.load(path / f"{name}.npy", mmap_mode="r+") for name in COLUMNS}
+    sample_chunk(seed, stop - start, ranges, out={name: column[start:stop]
+                                                  for name, column in columns.items()})
+    for column in columns.values():
+        column.flush()
+    return stop - start
+
+
+def generate(n_rows, path=DATA_DIR, seed=42, chunk_rows=CHUNK_ROWS, jobs=None,
+             ranges=RANGES, dtype=np.float32):
+    """Generează setul de n_rows rânduri în `path`, pe bucăți, în paralel; întoarce path"""
+    if n_rows < 1 or chunk_rows < 1:
+        raise ValueError(f"n_rows și chunk_rows trebuie să fie ≥ 1, nu {n_rows} și {chunk_rows}")
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    meta_path = path / "meta.json"
+    meta_path.unlink(missing_ok=True)
+    for name in COLUMNS:
+        column = np.lib.format.open_memmap(path / f"{name}.npy", mode="w+",
+                                           dtype=dtype, shape=(n_rows,))
+        del column
+
+    starts = range(0, n_rows, chunk_rows)
+    seeds = np.random.SeedSequence(seed).spawn(len(starts))
+    tasks = [(path, s, start, min(start + chunk_rows, n_rows), ranges)
+             for s, start in zip(seeds, starts)]
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(tasks)))
+    if jobs == 1:
+        for task in tasks:
+            _write_chunk(*task)
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            list(pool.map(_write_chunk, *zip(*tasks)))
+
+    meta = dict(rows=n_rows, columns=list(COLUMNS), dtype=np.dtype(dtype).name, seed=seed,
+                chunk_rows=chunk_rows, ranges={name: list(r) for name, r in ranges.items()})
+    tmp = meta_path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(meta, indent=1))
+    os.replace(tmp, meta_path)
+    return path
+
+
+def metadata(path=DATA_DIR):
+    """meta.json al unui set complet; FileNotFoundError dacă setul lipsește sau e incomplet"""
+    meta_path = Path(path) / "meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(f"set Snell incomplet sau inexistent: {path}")
+    return json.loads(meta_path.read_text())
+
+
+def load(path=DATA_DIR, columns=COLUMNS, mmap_mode="r"):
+    """Coloanele setului ca array-uri mapate în memorie (fără copiere); {coloană: array}"""
+    path = Path(path)
+    metadata(path)
+    return {name: np.load(path / f"{name}.npy", mmap_mode=mmap_mode) for name in columns}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generează setul de date Snell pe coloane .npy")
+    parser.add_argument("rows", type=int, help="numărul de rânduri valide")
+    parser.add_argument("-o", "--output", type=Path, default=DATA_DIR)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="număr de procese (implicit numărul de nuclee)")
+    parser.add_argument("--float64", action="store_true", help="coloane float64 (implicit float32)")
+    args = parser.parse_args()
+    if args.rows < 1:
+        parser.error("rows trebuie să fie ≥ 1")
+
+    start = time.perf_counter()
+    path = generate(args.rows, args.output, args.seed, args.chunk_rows, args.jobs,
+                    dtype=np.float64 if args.float64 else np.float32)
+    seconds = time.perf_counter() - start
+    print(f"{args.rows} rânduri în {seconds:.1f} s ({args.rows / seconds:,.0f} rânduri/s) -> {path}")
+
+
+if __name__ == "__main__":
+    main()
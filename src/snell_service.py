@@ -0,0 +1,406 @@
+import argparse
+import http.client
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import numpy as np
+
+from optics import snell, total_internal_reflection
+
+# Serviciu local de inferență pentru surogatul Snell (θ2 din n1, n2, θ1), doar
+# pe localhost și doar cu biblioteca standard plus NumPy. Cererile simultane
+# de câte o interogare sunt strânse de MicroBatcher în loturi: primul rând
+# dintr-un lot așteaptă cel mult max_delay, apoi întregul lot trece printr-un
+# singur forward vectorizat. Modelul antrenat (snell_trainer.py) se exportă
+# într-un .npz cu greutățile și normalizarea, deci serviciul nu are nevoie de
+# PyTorch.
+#
+#   POST /predict   {"n1": 1.0, "n2": 1.5, "theta1": 45}   -> {"theta2": ...}
+#                   {"n1": [...], "n2": [...], "theta1": [...]} (un lot întreg)
+#                   θ2 este null la reflexie totală internă (ambele căi);
+#                   câmpuri lipsă, nenumerice sau liste inegale -> 400
+#   GET  /stats     latențe p50/p99 (ms), cereri/s, dimensiunea medie a lotului
+#
+#   python snell_service.py export ../models/snell/best.pt
+#   python snell_service.py serve --port 8765
+#   python snell_service.py bench --requests 5000 --concurrency 32
+
+ROOT = Path(__file__).resolve().parent.parent
+SURROGATE_FILE = ROOT / "models" / "snell" / "surrogate.npz"
+ACTIVATIONS = {
+    "tanh": np.tanh,
+    "relu": lambda x: np.maximum(x, 0, out=x),
+    "identity": lambda x: x,
+}
+
+
+class Surrogate:
+    """MLP exportat, evaluat cu NumPy: θ2 = net((x - x_mean) / x_std) · y_std + y_mean"""
+
+    def __init__(self, weights, biases, activation="tanh", x_mean=0.0, x_std=1.0,
+                 y_mean=0.0, y_std=1.0):
+        self.weights = [np.asarray(w, dtype=np.float32) for w in weights]
+        self.biases = [np.asarray(b, dtype=np.float32) for b in biases]
+        self.activation = activation
+        self.x_mean, self.x_std = np.float32(x_mean), np.float32(x_std)
+        self.y_mean, self.y_std = np.float32(y_mean), np.float32(y_std)
+
+    @classmethod
+    def from_torch(cls, model):
+        """Din SnellPINN (snell_trainer.py)"""
+        linear = [layer for layer in model.net if hasattr(layer, "weight")]
+        return cls([layer.weight.detach().numpy().T for layer in linear],
+                   [layer.bias.detach().numpy() for layer in linear], "tanh",
+                   *(getattr(model, name).numpy() for name in ("x_mean", "x_std", "y_mean", "y_std")))
+
+    @classmethod
+    def from_sklearn(cls, model):
+        """Din MLPRegressor-ul din notebook (antrenat pe intrări brute)"""
+        return cls(model.coefs_, model.intercepts_, model.activation)
+
+    @classmethod
+    def load(cls, path=SURROGATE_FILE):
+        data = np.load(path)
+        n_layers = int(data["n_layers"])
+        return cls([data[f"w{i}"] for i in range(n_layers)], [data[f"b{i}"] for i in range(n_layers)],
+                   str(data["activation"]), data["x_mean"], data["x_std"], data["y_mean"], data["y_std"])
+
+    def save(self, path=SURROGATE_FILE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        layers = {f"w{i}": w for i, w in enumerate(self.weights)}
+        layers.update({f"b{i}": b for i, b in enumerate(self.biases)})
+        np.savez(path, n_layers=len(self.weights), activation=self.activation,
+                 x_mean=self.x_mean, x_std=self.x_std, y_mean=self.y_mean, y_std=self.y_std,
+                 **layers)
+        return path
+
+    def __call__(self, x):
+        """x: (B, 3) cu (n1, n2, θ1 în grade) -> θ2 (B,) în grade
+
+        Modelul a văzut doar rânduri fără reflexie totală internă; pentru
+        acestea θ2 este NaN, ca în calea analitică.
+        """
+        x = np.asarray(x, dtype=np.float32)
+        h = (x - self.x_mean) / self.x_std
+        activation = ACTIVATIONS[self.activation]
+        for i, (w, b) in enumerate(zip(self.weights, self.biases)):
+            h = h @ w
+            h += b
+            if i < len(self.weights) - 1:
+                h = activation(h)
+        theta2 = (h * self.y_std + self.y_mean)[:, 0]
+        theta2[total_internal_reflection(x[:, 0], x[:, 1], np.radians(x[:, 2]))] = np.nan
+        return theta2
+
+
+def analytic(x):
+    """Calea analitică din Refraction: θ2 = arcsin(n1 sin θ1 / n2), în grade (NaN la reflexie totală)"""
+    x = np.asarray(x, dtype=float)
+    return np.degrees(snell(x[:, 0], x[:, 1], np.radians(x[:, 2])))
+
+
+class MicroBatcher:
+    """Strânge interogările simultane în loturi pentru un singur apel `predict`
+
+    Un fir dedicat ia prima cerere din coadă, mai adaugă până la max_batch
+    cereri sosite în cel mult max_delay secunde și rulează predict pe lot.
+    Coada are cel mult max_queue cereri; peste, submit ridică queue.Full.
+    close() oprește firul după ce termină lotul curent.
+    """
+
+    def __init__(self, predict, max_batch=256, max_delay=0.002, max_queue=10000, window=100000):
+        self.predict = predict
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._queue = queue.Queue(max_queue)
+        self._latencies = deque(maxlen=window)
+        self._batch_sizes = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self._started = time.perf_counter()
+        self._count = 0
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, row, timeout=1.0):
+        """θ2 pentru un singur rând (n1, n2, θ1); blochează până la rezultat
+
+        Ridică queue.Full dacă coada rămâne plină și TimeoutError dacă
+        rezultatul nu sosește în `timeout` secunde.
+        """
+        slot = [threading.Event(), None, time.perf_counter()]
+        self._queue.put((row, slot), timeout=timeout)
+        if not slot[0].wait(timeout):
+            raise TimeoutError(f"niciun rezultat în {timeout} s")
+        if isinstance(slot[1], BaseException):
+            raise slot[1]
+        return slot[1]
+
+    def close(self, timeout=None):
+        """Oprește firul de lucru; cererile deja din coadă primesc rezultatul"""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            deadline = time.perf_counter() + self.max_delay
+            while batch[-1] is not None and len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0
+                                 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            # None (pus de close) încheie bucla după lotul curent
+            stopping = batch[-1] is None
+            if stopping:
+                batch.pop()
+            if not batch:
+                continue
+            # O excepție nu trebuie să oprească firul: ar bloca toate cererile următoare
+            try:
+                rows = np.array([row for row, _ in batch], dtype=np.float32)
+                results = self.predict(rows).tolist()
+            except Exception as error:
+                results = [error] * len(batch)
+            now = time.perf_counter()
+            with self._lock:
+                for (_, slot), result in zip(batch, results):
+                    slot[1] = result
+                    self._latencies.append(now - slot[2])
+                    slot[0].set()
+                self._batch_sizes.append(len(batch))
+                self._count += len(batch)
+
+    def stats(self):
+        """Latențele p50/p99 (ms), cererile pe secundă de la pornire și lotul mediu"""
+        with self._lock:
+            latencies = np.array(self._latencies)
+            batch_sizes = np.array(self._batch_sizes)
+            count = self._count
+        if not len(latencies):
+            return dict(requests=0)
+        return dict(
+            requests=count,
+            p50_ms=float(np.percentile(latencies, 50) * 1e3),
+            p99_ms=float(np.percentile(latencies, 99) * 1e3),
+            requests_per_s=count / (time.perf_counter() - self._started),
+            mean_batch=float(batch_sizes.mean()),
+        )
+
+
+def parse_query(query):
+    """Corpul unei cereri /predict -> (rânduri (B, 3) float32, True pentru un lot)
+
+    Câmpurile n1, n2, theta1 sunt fie toate numere, fie toate liste nevide
+    de numere de aceeași lungime; altfel ValueError.
+    """
+    if not isinstance(query, dict):
+        raise ValueError("corpul trebuie să fie un obiect JSON")
+    fields = [query[name] for name in ("n1", "n2", "theta1")]
+    is_batch = isinstance(fields[0], list)
+    columns = [field if is_batch else [field] for field in fields]
+    if not all(isinstance(column, list) for column in columns):
+        raise ValueError("n1, n2, theta1 trebuie să fie toate numere sau toate liste")
+    if len({len(column) for column in columns}) != 1 or not columns[0]:
+        raise ValueError("listele n1, n2, theta1 trebuie să fie nevide și de aceeași lungime")
+    for column in columns:
+        for value in column:
+            # bool este subclasă a lui int, dar nu este o valoare validă aici
+            if isinstance(value, bool) or not isinstance(value, (int, float)) or not np.isfinite(value):
+                raise ValueError(f"valoare nenumerică: {value!r}")
+    return np.array(columns, dtype=np.float32).T, is_batch
+
+
+def _finite_or_none(values):
+    """NaN (reflexie totală la calea analitică) -> None, adică null în JSON"""
+    return [value if np.isfinite(value) else None for value in values]
+
+
+def make_handler(batcher):
+    """Clasa handler-ului HTTP legată de un MicroBatcher"""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Antetul și corpul răspunsului pleacă în scrieri separate; fără
+        # TCP_NODELAY, Nagle plus ACK-ul întârziat adaugă ~40 ms per cerere
+        disable_nagle_algorithm = True
+
+        def _reply(self, code, body):
+            data = json.dumps(body, allow_nan=False).encode()
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == "/stats":
+                self._reply(200, batcher.stats())
+            elif self.path == "/health":
+                self._reply(200, {"status": "ok"})
+            else:
+                self._reply(404, {"error": "necunoscut"})
+
+        def do_POST(self):
+            if self.path != "/predict":
+                return self._reply(404, {"error": "necunoscut"})
+            try:
+                query = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                rows, is_batch = parse_query(query)
+            except (KeyError, TypeError, ValueError) as error:
+                return self._reply(400, {"error": f"cerere invalidă: {error}"})
+            try:
+                if is_batch:
+                    # Un lot trimis direct nu trece prin coadă
+                    theta2 = _finite_or_none(batcher.predict(rows).tolist())
+                else:
+                    theta2 = _finite_or_none([batcher.submit(rows[0].tolist())])[0]
+            except queue.Full:
+                return self._reply(503, {"error": "coadă plină"})
+            except TimeoutError as error:
+                return self._reply(504, {"error": str(error)})
+            except Exception as error:
+                return self._reply(500, {"error": f"{type(error).__name__}: {error}"})
+            self._reply(200, {"theta2": theta2})
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def serve(predict, host="127.0.0.1", port=8765, **batcher_options):
+    """Serverul HTTP (nepornit) și batcher-ul lui; server.serve_forever() îl pornește"""
+    batcher = MicroBatcher(predict, **batcher_options)
+    server = ThreadingHTTPServer((host, port), make_handler(batcher))
+    server.daemon_threads = True
+    return server, batcher
+
+
+def _client_load(host, port, rows, concurrency):
+    """Trimite câte o cerere per rând, din `concurrency` fire; latențele în secunde"""
+    local = threading.local()
+
+    def query(row):
+        if not hasattr(local, "connection"):
+            local.connection = http.client.HTTPConnection(host, port)
+        body = json.dumps(dict(zip(("n1", "n2", "theta1"), row))).encode()
+        start = time.perf_counter()
+        local.connection.request("POST", "/predict", body, {"Content-Type": "application/json"})
+        response = local.connection.getresponse()
+        response.read()
+        return time.perf_counter() - start
+
+    with ThreadPoolExecutor(concurrency) as pool:
+        return np.array(list(pool.map(query, rows.tolist())))
+
+
+def benchmark(predict, n_requests=2000, concurrency=32, port=0, **batcher_options):
+    """Latențe și debit: serviciul micro-batch față de calea analitică arcsin
+
+    Rândurile sunt din intervalele setului Snell. Întoarce un dict cu
+    rezultatele pentru fiecare variantă.
+    """
+    from snell_dataset import RANGES, sample_chunk
+
+    columns = sample_chunk(0, n_requests, RANGES)
+    rows = np.stack([columns["n1"], columns["n2"], columns["theta1"]], axis=1)
+    results = {}
+
+    # Calea din Refraction: un apel snell scalar per interogare
+    start = time.perf_counter()
+    latencies = []
+    for n1, n2, theta1 in rows.tolist():
+        t0 = time.perf_counter()
+        np.degrees(snell(n1, n2, np.radians(theta1)))
+        latencies.append(time.perf_counter() - t0)
+    results["analitic, câte unul"] = (np.array(latencies), time.perf_counter() - start)
+
+    for name, function in (("surogat, lot întreg", predict), ("analitic, lot întreg", analytic)):
+        start = time.perf_counter()
+        function(rows)
+        seconds = time.perf_counter() - start
+        results[name] = (np.array([seconds]), seconds)
+
+    for name, function in (("serviciu surogat", predict), ("serviciu analitic", analytic)):
+        server, batcher = serve(function, port=port, **batcher_options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            host, actual_port = server.server_address
+            _client_load(host, actual_port, rows[:min(100, len(rows))], concurrency)  # încălzire
+            start = time.perf_counter()
+            latencies = _client_load(host, actual_port, rows, concurrency)
+            results[name] = (latencies, time.perf_counter() - start, batcher.stats()["mean_batch"])
+        finally:
+            server.shutdown()
+            server.server_close()
+            batcher.close()
+
+    report = {}
+    for name, (latencies, seconds, *batch) in results.items():
+        report[name] = dict(
+            p50_ms=float(np.percentile(latencies, 50) * 1e3),
+            p99_ms=float(np.percentile(latencies, 99) * 1e3),
+            queries_per_s=n_requests / seconds,
+        )
+        if batch:
+            report[name]["mean_batch"] = batch[0]
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serviciu local de inferență pentru surogatul Snell")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    export = commands.add_parser("export", help="checkpoint snell_trainer -> .npz")
+    export.add_argument("checkpoint", type=Path)
+    export.add_argument("-o", "--output", type=Path, default=SURROGATE_FILE)
+
+    for name in ("serve", "bench"):
+        command = commands.add_parser(name)
+        command.add_argument("--model", type=Path, default=SURROGATE_FILE)
+        command.add_argument("--analytic", action="store_true",
+                             help="servește calea analitică în locul surogatului")
+        command.add_argument("--max-batch", type=int, default=256)
+        command.add_argument("--max-delay-ms", type=float, default=2.0)
+    commands.choices["serve"].add_argument("--port", type=int, default=8765)
+    commands.choices["bench"].add_argument("--requests", type=int, default=2000)
+    commands.choices["bench"].add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    if args.command == "export":
+        from snell_trainer import load_model
+        print(Surrogate.from_torch(load_model(args.checkpoint)).save(args.output))
+        return
+
+    predict = analytic if args.analytic else Surrogate.load(args.model)
+    options = dict(max_batch=args.max_batch, max_delay=args.max_delay_ms / 1e3)
+    if args.command == "serve":
+        server, batcher = serve(predict, port=args.port, **options)
+        print(f"http://127.0.0.1:{args.port}/predict")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            server.server_close()
+            batcher.close()
+        return
+
+    report = benchmark(predict, args.requests, args.concurrency, **options)
+    for name, row in report.items():
+        batch = f"  lot mediu {row['mean_batch']:.1f}" if "mean_batch" in row else ""
+        print(f"{name:<22} p50 {row['p50_ms']:8.3f} ms  p99 {row['p99_ms']:8.3f} ms  "
+              f"{row['queries_per_s']:12,.0f} interogări/s{batch}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+import argparse
+import math
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+from torch import nn
+from torch.utils.data import DataLoader, Dataset
+
+import snell_dataset
+
+# Antrenarea pe CPU a PINN-ului Snell din plots.ipynb pe seturi mari, generate
+# cu snell_dataset.py. Loturile sunt felii contigue din coloanele .npy mapate
+# în memorie: rândurile setului sunt deja eșantioane independente, deci o
+# felie este un lot aleator, iar amestecarea se face doar pe ordinea feliilor
+# (altă permutare în fiecare epocă). Feliile sunt citite de procesele
+# DataLoader-ului, iar pasul de antrenare folosește toate nucleele prin
+# firele intra-op ale PyTorch.
+#
+# Pierderea fizică nu refolosește punctele de antrenare: la fiecare pas se
+# trag puncte de colocație (n1, n2, θ1) noi, fără etichete, sub unghiul
+# critic, și se penalizează n1 sin θ1 - n2 sin θ2.
+#
+# În directorul modelului:
+#   last.pt    modelul, optimizatorul, generatorul punctelor de colocație și
+#              poziția în epocă (pentru reluare)
+#   best.pt    modelul cu cea mai mică pierdere de validare
+#
+#   python snell_trainer.py --epochs 20 --batch-size 8192 --workers 4
+#   python snell_trainer.py --resume              # continuă din last.pt
+
+ROOT = Path(__file__).resolve().parent.parent
+MODEL_DIR = ROOT / "models" / "snell"
+
+
+class SnellPINN(nn.Module):
+    """θ2 (grade) din (n1, n2, θ1 în grade), cu normalizarea inclusă în model
+
+    Mediile și abaterile intrărilor și ieșirii sunt buffere, deci se salvează
+    în checkpoint împreună cu greutățile și modelul primește valori brute.
+    """
+
+    def __init__(self, hidden=(32, 32)):
+        super().__init__()
+        layers, width = [], 3
+        for size in hidden:
+            layers += [nn.Linear(width, size), nn.Tanh()]
+            width = size
+        self.net = nn.Sequential(*layers, nn.Linear(width, 1))
+        self.hidden = tuple(hidden)
+        self.register_buffer("x_mean", torch.zeros(3))
+        self.register_buffer("x_std", torch.ones(3))
+        self.register_buffer("y_mean", torch.zeros(1))
+        self.register_buffer("y_std", torch.ones(1))
+
+    def set_normalization(self, x, y):
+        """Statisticile de normalizare dintr-un eșantion (x: (N, 3), y: (N, 1))"""
+        self.x_mean.copy_(x.mean(0))
+        self.x_std.copy_(x.std(0))
+        self.y_mean.copy_(y.mean(0))
+        self.y_std.copy_(y.std(0))
+
+    def forward(self, x):
+        return self.net((x - self.x_mean) / self.x_std) * self.y_std + self.y_mean
+
+    def physics_loss(self, x):
+        """Reziduul legii lui Snell, n1 sin θ1 - n2 sin θ2, pe puncte fără etichete"""
+        n1, n2, theta1 = x.unbind(1)
+        theta2 = self(x).squeeze(1)
+        residual = n1 * torch.sin(torch.deg2rad(theta1)) - n2 * torch.sin(torch.deg2rad(theta2))
+        return residual.square().mean()
+
+
+class SnellBatches(Dataset):
+    """Loturi de `batch_size` rânduri consecutive din rândurile [start, stop)
+
+    Elementul i este lotul i, ca tensori (x (B, 3), y (B, 1)); ultimul lot
+    incomplet este inclus doar cu keep_last. Coloanele se deschid leneș, în
+    fiecare proces, ca să nu fie copiate la pornirea worker-ilor.
+    """
+
+    def __init__(self, path, batch_size, start=0, stop=None, keep_last=False):
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.start = start
+        self.stop = snell_dataset.metadata(path)["rows"] if stop is None else stop
+        rows = self.stop - self.start
+        self.n_batches = math.ceil(rows / batch_size) if keep_last else rows // batch_size
+        self._columns = None
+
+    def __len__(self):
+        return self.n_batches
+
+    def __getitem__(self, i):
+        if self._columns is None:
+            self._columns = snell_dataset.load(self.path)
+        lo = self.start + i * self.batch_size
+        hi = min(lo + self.batch_size, self.stop)
+        columns = self._columns
+        x = np.stack([columns["n1"][lo:hi], columns["n2"][lo:hi], columns["theta1"][lo:hi]], axis=1)
+        y = np.array(columns["theta2"][lo:hi])[:, None]
+        return torch.from_numpy(x).float(), torch.from_numpy(y).float()
+
+
+def collocation_points(n, ranges, generator):
+    """n puncte (n1, n2, θ1) uniforme, cu θ1 sub unghiul critic (fără reflexie totală)"""
+    u = torch.rand(n, 3, generator=generator)
+    n1 = ranges["n1"][0] + u[:, 0] * (ranges["n1"][1] - ranges["n1"][0])
+    n2 = ranges["n2"][0] + u[:, 1] * (ranges["n2"][1] - ranges["n2"][0])
+    critical = torch.rad2deg(torch.asin(torch.clamp(n2 / n1, max=1.0)))
+    low, high = ranges["theta1"]
+    theta1 = low + u[:, 2] * (torch.clamp(critical, max=high) - low)
+    return torch.stack([n1, n2, theta1], dim=1)
+
+
+def _save(path, state):
+    """torch.save atomic: un checkpoint întrerupt nu îl înlocuiește pe cel bun"""
+    tmp = path.with_suffix(".tmp")
+    torch.save(state, tmp)
+    os.replace(tmp, path)
+
+
+def load_model(path=MODEL_DIR / "best.pt"):
+    """Modelul dintr-un checkpoint (best.pt sau last.pt), în modul eval"""
+    state = torch.load(path, map_location="cpu", weights_only=False)
+    model = SnellPINN(state["config"]["hidden"])
+    model.load_state_dict(state["model"])
+    return model.eval()
+
+
+def evaluate(model, loader):
+    """MSE (grade²) pe un set de validare nevid"""
+    total, count = 0.0, 0
+    model.eval()
+    with torch.no_grad():
+        for x, y in loader:
+            total += nn.functional.mse_loss(model(x), y, reduction="sum").item()
+            count += len(y)
+    model.train()
+    if not count:
+        raise ValueError("setul de validare este gol")
+    return total / count
+
+
+def train(data=snell_dataset.DATA_DIR, output=MODEL_DIR, epochs=10, batch_size=4096,
+          collocation=4096, lambda_phys=0.1, lr=1e-3, hidden=(32, 32), val_fraction=0.01,
+          max_val_rows=1_000_000, patience=3, min_delta=0.0, workers=None, threads=None,
+          checkpoint_every=1000, log_every=100, max_steps=None, seed=0, resume=False):
+    """Antrenează SnellPINN pe setul din `data`; întoarce modelul cel mai bun
+
+    Validarea folosește ultimele val_fraction din rânduri (cel puțin unul,
+    cel mult max_val_rows). Oprirea timpurie are loc după `patience` epoci
+    fără o scădere a pierderii de validare mai mare decât min_delta. Cu
+    val_fraction=0 nu există validare: se antrenează toate epocile, iar
+    best.pt este modelul de la finalul ultimei epoci.
+    """
+    config = dict(epochs=epochs, batch_size=batch_size, collocation=collocation,
+                  lambda_phys=lambda_phys, lr=lr, hidden=list(hidden), seed=seed)
+    output = Path(output)
+    output.mkdir(parents=True, exist_ok=True)
+    cpus = os.cpu_count() or 1
+    torch.set_num_threads(threads or cpus)
+    workers = min(4, cpus) if workers is None else workers
+
+    meta = snell_dataset.metadata(data)
+    rows = meta["rows"]
+    # Un set de validare gol ar da pierderea 0 și ar opri antrenarea după prima epocă
+    val_rows = min(max(int(rows * val_fraction), 1), max_val_rows) if val_fraction > 0 else 0
+    train_rows = rows - val_rows
+    train_set = SnellBatches(data, batch_size, 0, train_rows)
+    val_loader = DataLoader(SnellBatches(data, 65536, train_rows, rows, keep_last=True),
+                            batch_size=None, num_workers=0) if val_rows else None
+    if not len(train_set):
+        raise ValueError(f"setul are {train_rows} rânduri de antrenare, mai puțin de un lot")
+
+    # Aceeași sămânță, aceeași inițializare (la reluare greutățile vin din last.pt)
+    torch.manual_seed(seed)
+    model = SnellPINN(hidden)
+    optimizer = torch.optim.Adam(model.parameters(), lr=lr)
+    generator = torch.Generator().manual_seed(seed)
+    state = dict(epoch=0, batch=0, step=0, best=math.inf, bad_epochs=0)
+    last_path, best_path = output / "last.pt", output / "best.pt"
+    if resume and last_path.exists():
+        checkpoint = torch.load(last_path, map_location="cpu", weights_only=False)
+        if checkpoint["config"] != config:
+            raise ValueError(f"{last_path} a fost antrenat cu altă configurație: {checkpoint['config']}")
+        model.load_state_dict(checkpoint["model"])
+        optimizer.load_state_dict(checkpoint["optimizer"])
+        # Aceleași puncte de colocație ca într-o rulare neîntreruptă
+        generator.set_state(checkpoint["generator"])
+        state = checkpoint["state"]
+        print(f"Reluare din {last_path}: epoca {state['epoch']}, lotul {state['batch']}")
+    else:
+        # Normalizarea din primul milion de rânduri de antrenare
+        sample = SnellBatches(data, min(train_rows, 1_000_000), 0, train_rows)[0]
+        model.set_normalization(*sample)
+
+    def checkpoint():
+        _save(last_path, dict(model=model.state_dict(), optimizer=optimizer.state_dict(),
+                              generator=generator.get_state(), state=state, config=config,
+                              meta=meta))
+
+    ranges = meta["ranges"]
+    mse = nn.MSELoss()
+    while state["epoch"] < epochs:
+        # Aceeași permutare a loturilor la reluare, fără loturile deja folosite
+        order = np.random.default_rng([seed, state["epoch"]]).permutation(len(train_set))
+        loader = DataLoader(train_set, batch_size=None, sampler=order[state["batch"]:].tolist(),
+                            num_workers=workers, persistent_workers=False,
+                            prefetch_factor=4 if workers else None)
+        window_start, window_samples = time.perf_counter(), 0
+        for x, y in loader:
+            data_loss = mse(model(x), y)
+            phys_loss = model.physics_loss(collocation_points(collocation, ranges, generator))
+            loss = data_loss + lambda_phys * phys_loss
+            optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            optimizer.step()
+
+            state["step"] += 1
+            state["batch"] += 1
+            window_samples += len(y)
+            if state["step"] % log_every == 0:
+                seconds = time.perf_counter() - window_start
+                print(f"Ep {state['epoch']:3d} | pas {state['step']:7d} | data-loss {data_loss.item():.4f} "
+                      f"| phys-loss {phys_loss.item():.2e} | {window_samples / seconds:,.0f} eșantioane/s",
+                      flush=True)
+                window_start, window_samples = time.perf_counter(), 0
+            if state["step"] % checkpoint_every == 0:
+                checkpoint()
+            if max_steps is not None and state["step"] >= max_steps:
+                break
+        else:
+            if val_loader is None:
+                val_loss, improved = math.nan, True
+            else:
+                val_loss = evaluate(model, val_loader)
+                improved = val_loss < state["best"] - min_delta
+                print(f"Ep {state['epoch']:3d} | val-loss {val_loss:.5f}{' *' if improved else ''}",
+                      flush=True)
+            state.update(epoch=state["epoch"] + 1, batch=0)
+            if improved:
+                state.update(best=val_loss, bad_epochs=0)
+                _save(best_path, dict(model=model.state_dict(), config=config, meta=meta,
+                                      val_loss=val_loss, epoch=state["epoch"]))
+            else:
+                state["bad_epochs"] += 1
+            checkpoint()
+            if state["bad_epochs"] >= patience:
+                print(f"Oprire timpurie: {patience} epoci fără îmbunătățire")
+                break
+            continue
+        # max_steps atins în mijlocul epocii
+        checkpoint()
+        break
+
+    return load_model(best_path) if best_path.exists() else model.eval()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Antrenează PINN-ul Snell pe CPU")
+    parser.add_argument("--data", type=Path, default=snell_dataset.DATA_DIR)
+    parser.add_argument("-o", "--output", type=Path, default=MODEL_DIR)
+    parser.add_argument("--epochs", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=4096)
+    parser.add_argument("--collocation", type=int, default=4096,
+                        help="puncte de colocație fizică per pas")
+    parser.add_argument("--lambda-phys", type=float, default=0.1)
+    parser.add_argument("--lr", type=float, default=1e-3)
+    parser.add_argument("--patience", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=None, help="procese DataLoader")
+    parser.add_argument("--threads", type=int, default=None, help="fire intra-op PyTorch")
+    parser.add_argument("--max-steps", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--resume", action="store_true", help="continuă din last.pt")
+    args = parser.parse_args()
+
+    model = train(args.data, args.output, args.epochs, args.batch_size, args.collocation,
+                  args.lambda_phys, args.lr, patience=args.patience, workers=args.workers,
+                  threads=args.threads, max_steps=args.max_steps, seed=args.seed,
+                  resume=args.resume)
+    print(f"Model: {args.output / 'best.pt'} ({sum(p.numel() for p in model.parameters())} parametri)")
+
+
+if __name__ == "__main__":
+    main()
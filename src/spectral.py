@@ -0,0 +1,190 @@
+import numpy as np
+
+from optics import photon_energy, snell
+
+# Randare spectrală, fără Manim: modele de dispersie n(λ) (Sellmeier, Cauchy)
+# și conversia lungimilor de undă în culori sRGB printr-un tabel CIE 1931
+# precalculat. Lungimile de undă sunt în nm; toate funcțiile lucrează pe
+# array-uri, deci sute de eșantioane spectrale costă câte un apel NumPy.
+
+
+class Sellmeier:
+    """n²(λ) = 1 + Σ Bᵢ λ² / (λ² - Cᵢ), cu λ în µm și Cᵢ în µm²"""
+
+    def __init__(self, b, c):
+        self.b = np.asarray(b, dtype=float)
+        self.c = np.asarray(c, dtype=float)
+
+    def __call__(self, wavelength):
+        lam2 = (np.asarray(wavelength, dtype=float)[..., None] * 1e-3) ** 2
+        return np.sqrt(1 + np.sum(self.b * lam2 / (lam2 - self.c), axis=-1))
+
+
+class Cauchy:
+    """n(λ) = A + B / λ² + C / λ⁴, cu λ în µm"""
+
+    def __init__(self, a, b=0.0, c=0.0):
+        self.a, self.b, self.c = a, b, c
+
+    def __call__(self, wavelength):
+        lam2 = (np.asarray(wavelength, dtype=float) * 1e-3) ** 2
+        return self.a + self.b / lam2 + self.c / lam2**2
+
+
+MATERIALS = {
+    "BK7": Sellmeier([1.03961212, 0.231792344, 1.01046945],
+                     [0.00600069867, 0.0200179144, 103.560653]),
+    "F2": Sellmeier([1.34533359, 0.209073176, 0.937357162],
+                    [0.00997743871, 0.0470450767, 111.886764]),
+    "silice": Sellmeier([0.6961663, 0.4079426, 0.8974794],
+                        [0.0684043**2, 0.1162414**2, 9.896161**2]),
+    "apă": Cauchy(1.3242, 0.003046),
+}
+
+
+def material(medium):
+    """Modelul n(λ) pentru un nume din MATERIALS; valorile și funcțiile trec neschimbate"""
+    if isinstance(medium, str):
+        try:
+            return MATERIALS[medium]
+        except KeyError:
+            raise ValueError(f"material necunoscut: {medium!r}") from None
+    return medium
+
+
+def refractive_index(medium, wavelength):
+    """n(λ) pentru un material, o funcție sau un indice constant"""
+    medium = material(medium)
+    wavelength = np.asarray(wavelength, dtype=float)
+    if callable(medium):
+        return np.broadcast_to(np.asarray(medium(wavelength), dtype=float), wavelength.shape)
+    return np.full(wavelength.shape, float(medium))
+
+
+def _lobe(wavelength, mu, sigma_low, sigma_high):
+    sigma = np.where(wavelength < mu, sigma_low, sigma_high)
+    return np.exp(-0.5 * ((wavelength - mu) / sigma) ** 2)
+
+
+def cie_fit(wavelength):
+    """Funcțiile colorimetrice CIE 1931 (2°), aproximarea analitică Wyman-Sloan-Shirley"""
+    lam = np.asarray(wavelength, dtype=float)
+    x = (1.056 * _lobe(lam, 599.8, 37.9, 31.0) + 0.362 * _lobe(lam, 442.0, 16.0, 26.7)
+         - 0.065 * _lobe(lam, 501.1, 20.4, 26.2))
+    y = 0.821 * _lobe(lam, 568.8, 46.9, 40.5) + 0.286 * _lobe(lam, 530.9, 16.3, 31.1)
+    z = 1.217 * _lobe(lam, 437.0, 11.8, 36.0) + 0.681 * _lobe(lam, 459.0, 26.0, 13.8)
+    return np.stack([x, y, z], axis=-1)
+
+
+def _cie_table(wavelengths):
+    """cie_fit pe `wavelengths`, cu capetele corectate
+
+    Aproximarea își pierde forma la capete (x̄ prea îngust sub 420 și peste
+    650 nm), unde cromaticitatea locusului spectral este practic constantă:
+    acolo tabelul păstrează raportul x̄:ȳ:z̄ de la capăt și urmează lobul dominant.
+    """
+    table = cie_fit(wavelengths)
+    for edge, outside, lobe in ((420.0, wavelengths < 420.0, 2), (650.0, wavelengths > 650.0, 1)):
+        ratio = table[wavelengths == edge][0]
+        table[outside] = table[outside, lobe:lobe + 1] * ratio / ratio[lobe]
+    return table
+
+
+# Tabelul CIE precalculat, din nm în nm; între noduri se interpolează liniar
+CIE_WAVELENGTHS = np.arange(360.0, 831.0)
+CIE_TABLE = _cie_table(CIE_WAVELENGTHS)
+
+# XYZ -> sRGB liniar (D65)
+XYZ_TO_SRGB = np.array([
+    [3.2406, -1.5372, -0.4986],
+    [-0.9689, 1.8758, 0.0415],
+    [0.0557, -0.2040, 1.0570],
+])
+
+
+def cie_xyz(wavelength):
+    """x̄, ȳ, z̄ pentru fiecare lungime de undă, din tabel; zero în afara lui"""
+    lam = np.asarray(wavelength, dtype=float)
+    return np.stack([
+        np.interp(lam, CIE_WAVELENGTHS, CIE_TABLE[:, i], left=0.0, right=0.0)
+        for i in range(3)
+    ], axis=-1)
+
+
+def srgb_gamma(linear):
+    """Codarea gamma sRGB a valorilor liniare din [0, 1]"""
+    linear = np.clip(linear, 0.0, 1.0)
+    return np.where(linear <= 0.0031308, 12.92 * linear, 1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+def xyz_to_srgb(xyz):
+    """Culoarea sRGB (gamma, [0, 1]) a unor valori XYZ; ieșirile din gamut sunt tăiate"""
+    return srgb_gamma(np.asarray(xyz) @ XYZ_TO_SRGB.T)
+
+
+def wavelength_to_rgb(wavelength):
+    """Culoarea de afișare a luminii monocromatice
+
+    Culorile spectrale sunt în afara gamutului sRGB: componentele negative se
+    taie, culoarea se normalizează la componenta maximă și se atenuează liniar
+    spre capetele spectrului vizibil (sub 420 și peste 700 nm).
+    """
+    xyz = cie_xyz(wavelength)
+    linear = np.maximum(xyz @ XYZ_TO_SRGB.T, 0.0)
+    peak = linear.max(axis=-1, keepdims=True)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        linear = np.where(peak > 0, linear / peak, 0.0)
+    brightness = np.interp(wavelength, [380.0, 420.0, 700.0, 780.0], [0.3, 1.0, 1.0, 0.3],
+                           left=0.0, right=0.0)[..., None]
+    return srgb_gamma(linear * brightness)
+
+
+def spectrum_to_rgb(wavelength, power):
+    """Culoarea amestecului: Σ putere · (x̄, ȳ, z̄), normalizat la Y = 1"""
+    xyz = np.tensordot(np.asarray(power, dtype=float), cie_xyz(wavelength), axes=1)
+    return xyz_to_srgb(xyz / max(xyz[..., 1].max(), 1e-12))
+
+
+# Denumirile culorilor spectrale: limita inferioară a fiecărei benzi (nm)
+COLOR_NAMES = (
+    (0.0, "Ultraviolet"),
+    (380.0, "Violet"),
+    (450.0, "Albastru"),
+    (485.0, "Cyan"),
+    (500.0, "Verde"),
+    (565.0, "Galben"),
+    (590.0, "Portocaliu"),
+    (625.0, "Roșu"),
+    (750.0, "Infraroșu"),
+)
+
+
+def color_name(wavelength):
+    """Denumirea culorii luminii monocromatice, pentru fiecare λ (nm)"""
+    edges = np.array([edge for edge, _ in COLOR_NAMES])
+    bands = np.searchsorted(edges, np.atleast_1d(wavelength), side="right") - 1
+    return [COLOR_NAMES[band][1] for band in bands.ravel()]
+
+
+def to_hex(rgb):
+    """Culorile (..., 3) din [0, 1] ca șiruri "#rrggbb" (pentru Manim)"""
+    values = np.rint(np.clip(rgb, 0, 1) * 255).astype(int).reshape(-1, 3)
+    return [f"#{r:02x}{g:02x}{b:02x}" for r, g, b in values]
+
+
+def dispersion(medium, wavelength, theta1, n1=1.0):
+    """n(λ), unghiurile de refracție și energiile fotonilor, într-o singură trecere"""
+    wavelength = np.asarray(wavelength, dtype=float)
+    n2 = refractive_index(medium, wavelength)
+    return dict(
+        wavelength=wavelength,
+        n=n2,
+        theta2=snell(n1, n2, theta1),
+        energy_eV=photon_energy(wavelength * 1e-9),
+        rgb=wavelength_to_rgb(wavelength),
+    )
+
+
+def visible(n_samples=400, start=380.0, stop=750.0):
+    """Eșantioane uniforme în spectrul vizibil (nm)"""
+    return np.linspace(start, stop, n_samples)
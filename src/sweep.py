@@ -0,0 +1,215 @@
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from physics import SCENES, check_params, compute, to_json
+from render_all import QUALITIES, WORK_DIR, render_scene
+from render_cache import DEFAULT_MAX_BYTES, RenderCache, cache_key
+
+# Variante ale scenelor pe o grilă de parametri, calculate sau randate în
+# paralel. Specificația este un fișier JSON:
+#
+#   {"scene": "Refraction", "mode": "render", "quality": "l",
+#    "grid": {"n2": [1.33, 1.5, "BK7"], "theta1_deg": [20, 45, 70]},
+#    "list": [{"n2": 2.4, "theta1_deg": 10}],
+#    "fixed": {"n1": 1.0}}
+#
+# sau {"sweeps": [...]} cu mai multe astfel de intrări. Grila dă produsul
+# cartezian al valorilor, lista variante explicite; `fixed` se aplică tuturor.
+# Variantele identice (aceeași cheie de cache) rulează o singură dată.
+#
+#   mode="compute"  physics.compute, rezultate JSON în results/<cheie>.json
+#   mode="render"   Manim, videoclipuri <scenă>-<cheie>.mp4, prin RenderCache
+#
+# index.json din directorul sweep-ului leagă parametrii fiecărei variante de
+# fișierul produs și este rescris după fiecare variantă terminată, deci o
+# rulare întreruptă se reia de unde a rămas: ce există deja nu se mai calculează.
+#
+#   python sweep.py sweeps/refraction.json -j 8
+#   python sweep.py -s Refraction -g n2='[1.33, 1.5, 1.7]' -g theta1_deg='[20, 45, 70]'
+
+ROOT = Path(__file__).resolve().parent.parent
+SWEEP_DIR = ROOT / "media_output" / "sweeps"
+MODES = ("compute", "render")
+
+
+def expand(spec):
+    """Variantele (scenă, mod, calitate, parametri) ale unei specificații"""
+    variants = []
+    for sweep in spec.get("sweeps", [spec]):
+        scene = sweep["scene"]
+        if scene not in SCENES:
+            raise ValueError(f"scenă necunoscută: {scene!r}")
+        mode = sweep.get("mode", "compute")
+        if mode not in MODES:
+            raise ValueError(f"mod necunoscut: {mode!r} (compute sau render)")
+        quality = sweep.get("quality", "l")
+        if quality not in QUALITIES:
+            raise ValueError(f"calitate necunoscută: {quality!r}")
+        fixed = sweep.get("fixed", {})
+        grid = sweep.get("grid", {})
+        # Fără grilă, doar lista; fără niciuna, o singură variantă cu `fixed`
+        combinations = []
+        if grid or "list" not in sweep:
+            combinations = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+        for params in combinations + list(sweep.get("list", [])):
+            params = check_params(scene, dict(fixed, **params))
+            variants.append((scene, mode, quality, params))
+    return variants
+
+
+def variant_key(scene_name, mode, quality, params):
+    """Cheia de cache a variantei; calculele nu depind de calitate"""
+    return cache_key(scene_name, quality if mode == "render" else "compute", params)
+
+
+def compute_variant(scene_name, params, path):
+    """Calculează fizica unei variante și o scrie în `path`; întoarce secundele"""
+    start = time.perf_counter()
+    result = to_json(compute(scene_name, **params))
+    _write_json(path, result)
+    return time.perf_counter() - start
+
+
+def _write_json(path, value):
+    """Scriere atomică: un cititor nu vede niciodată un fișier pe jumătate"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(value, indent=1, ensure_ascii=False))
+    os.replace(tmp, path)
+
+
+def run_sweep(spec, output_dir, jobs=None, cache=None, work_dir=WORK_DIR):
+    """Rulează toate variantele pe un pool de procese; întoarce intrările din index
+
+    Fiecare intrare are scena, modul, parametrii, cheia, fișierul produs
+    (relativ la output_dir), durata și starea: "done", "cached" sau "error"
+    (cu mesajul excepției; celelalte variante continuă).
+    """
+    output_dir = Path(output_dir)
+    index_path = output_dir / "index.json"
+    entries = {}
+    pending = []
+    for scene, mode, quality, params in expand(spec):
+        key = variant_key(scene, mode, quality, params)
+        if key in entries:
+            continue
+        if mode == "render":
+            output = Path("videos") / f"{scene}-{key[:12]}.mp4"
+        else:
+            output = Path("results") / f"{key}.json"
+        entry = dict(scene=scene, mode=mode, quality=quality, params=to_json(params),
+                     key=key, output=str(output), seconds=0.0, status="pending")
+        entries[key] = entry
+        path = output_dir / output
+        if path.exists() or (mode == "render" and cache is not None and cache.get(key, path)):
+            entry["status"] = "cached"
+        else:
+            pending.append(entry)
+
+    def save():
+        _write_json(index_path, {"spec": spec, "variants": list(entries.values())})
+
+    save()
+    print(f"{len(entries)} variante, {len(entries) - len(pending)} deja calculate", flush=True)
+    if not pending:
+        return list(entries.values())
+
+    jobs = jobs or min(len(pending), os.cpu_count() or 1)
+    # spawn, ca în render_all: fiecare worker importă Manim curat
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context) as pool:
+        futures = {}
+        for entry in pending:
+            path = output_dir / entry["output"]
+            if entry["mode"] == "render":
+                # Director de lucru propriu per variantă: variantele aceleiași
+                # scene au același nume de clasă și aceleași fișiere Manim
+                future = pool.submit(
+                    render_scene, entry["scene"], entry["quality"],
+                    Path(work_dir) / entry["key"][:12], path.parent,
+                    None, None, entry["params"], path.name,
+                )
+            else:
+                future = pool.submit(compute_variant, entry["scene"], entry["params"], path)
+            futures[future] = entry
+
+        for done, future in enumerate(as_completed(futures), 1):
+            entry = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                entry.update(status="error", error=f"{type(error).__name__}: {error}")
+            else:
+                entry["status"] = "done"
+                if entry["mode"] == "render":
+                    _, entry["seconds"], output = result
+                    if cache is not None:
+                        cache.put(entry["key"], output, entry["scene"], entry["quality"])
+                else:
+                    entry["seconds"] = result
+            save()
+            print(f"[{done}/{len(pending)}] {entry['scene']:<18} {entry['seconds']:7.1f} s  "
+                  f"{entry['status']:<6} {json.dumps(entry['params'], ensure_ascii=False)}",
+                  flush=True)
+    return list(entries.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rulează variante ale scenelor pe o grilă de parametri")
+    parser.add_argument("spec", nargs="?", type=Path, help="fișierul JSON al sweep-ului")
+    parser.add_argument("--scene", "-s", choices=list(SCENES), help="scena (fără fișier de specificație)")
+    parser.add_argument("--grid", "-g", action="append", default=[], metavar="NUME=LISTĂ",
+                        help="valorile unui parametru, ca listă JSON")
+    parser.add_argument("--param", "-p", action="append", default=[], metavar="NUME=VALOARE",
+                        help="parametru fix (valoare JSON)")
+    parser.add_argument("--mode", "-m", choices=MODES, default="compute")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="l")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="număr de procese (implicit numărul de nuclee)")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help=f"directorul sweep-ului (implicit în {SWEEP_DIR})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="nu folosi RenderCache pentru modul render")
+    parser.add_argument("--cache-size", type=float, default=DEFAULT_MAX_BYTES / 1024**2,
+                        help="dimensiunea maximă a cache-ului pe disc, în MB")
+    args = parser.parse_args()
+
+    if args.spec is not None:
+        spec = json.loads(args.spec.read_text(encoding="utf-8"))
+        name = args.spec.stem
+    elif args.scene is not None:
+        def parse(items):
+            pairs = (item.partition("=") for item in items)
+            return {key: json.loads(value) for key, _, value in pairs}
+
+        spec = {"scene": args.scene, "mode": args.mode, "quality": args.quality,
+                "grid": parse(args.grid), "fixed": parse(args.param)}
+        name = args.scene
+    else:
+        parser.error("dați un fișier de specificație sau --scene")
+
+    try:
+        expand(spec)
+    except (KeyError, ValueError) as error:
+        parser.error(str(error))
+
+    output_dir = args.output or SWEEP_DIR / name
+    cache = None if args.no_cache else RenderCache(max_bytes=int(args.cache_size * 1024**2))
+    start = time.perf_counter()
+    entries = run_sweep(spec, output_dir, args.jobs, cache)
+    failed = [entry for entry in entries if entry["status"] == "error"]
+    print(f"\n{len(entries)} variante în {time.perf_counter() - start:.1f} s, "
+          f"{len(failed)} eșuate; index: {output_dir / 'index.json'}")
+    for entry in failed:
+        print(f"  {entry['scene']} {json.dumps(entry['params'], ensure_ascii=False)}: {entry['error']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,14 @@
 from manim import *
 import numpy as np
 
+from mobjects import LiveCurve, NumericLabel
+from physics import wave_harmonic, wave_propagation, wave_solver
+
 class WavePropagation1D(Scene):
+    # Parametri fizici suprascriși (vezi physics.wave_propagation);
+    # {"solver": "fdtd"} folosește rezolvitorul numeric din fdtd.py
+    params = {}
+    
     # Constructia scenei
     def construct(self):
         self.camera.background_color = '#0a0a0a'
@@ -19,11 +26,13 @@ class WavePropagation1D(Scene):
         self.wait(2)
         
         # Parametri undă
-        E0 = 1.0
-        wavelength = 2.0
-        T = 2.0
-        nu = 1.0 / T
-        c = wavelength / T
+        # În modul fdtd simularea rulează mai jos, cadru cu cadru, nu și în physics
+        physics = wave_propagation(**self.params, simulate=False)
+        E0 = physics["E0"]
+        wavelength = physics["wavelength"]
+        T = physics["T"]
+        nu = physics["nu"]
+        c = physics["c"]
         
         # Parametri afișați
         params_group = VGroup(
@@ -57,45 +66,67 @@ class WavePropagation1D(Scene):
         self.wait(2)
 
         t_tracker = ValueTracker(0)
-        time_display = always_redraw(
-            lambda: MathTex(
-                f"t = {t_tracker.get_value():.2f} \, \\text{{s}}",
-                font_size=28,
-                color=YELLOW
-            ).next_to(axes, DOWN, buff=0.3)
-        )
+        time_display = NumericLabel(
+            r"t = {t:.2f} \, \text{{s}}",
+            font_size=28,
+            color=YELLOW,
+            t=0
+        ).next_to(axes, DOWN, buff=0.3)
+        time_display.add_updater(lambda m: m.set_value(t=t_tracker.get_value()))
         self.add(time_display)
         
-        def wave_function(x, t):
-            return E0 * np.sin(2 * np.pi * (t / T - x / wavelength))
+        x_samples = physics["x"]
+        if physics["solver"] == "fdtd":
+            # Mediul din dreapta, vizibil doar în soluția numerică
+            medium = Rectangle(
+                width=axes.c2p(x_samples[-1], 0)[0] - axes.c2p(physics["medium_start"], 0)[0],
+                height=axes.y_length,
+                fill_color=GREEN, fill_opacity=0.15, stroke_width=0
+            ).align_to(axes.c2p(physics["medium_start"], 0), LEFT).set_y(axes.get_center()[1])
+            medium_label = MathTex(rf"n = {physics['medium_index']:.2f}", font_size=22, color=GREEN)
+            medium_label.next_to(medium, UP, buff=0.1)
+            self.play(FadeIn(medium), Write(medium_label))
+            
+            # Cadrele vin în ordine din generatorul FDTD, după regimul tranzitoriu
+            solver = wave_solver(physics)
+            solver.run_until(physics["t_start"])
+            start = solver.time
+            frames = solver.frames(every=1 / config.frame_rate)
+            frame_time, frame = next(frames)
+            
+            def wave_values(t):
+                nonlocal frame_time, frame
+                while frame_time - start < t - 1e-9:
+                    frame_time, frame = next(frames)
+                return np.interp(x_samples, solver.x, frame)
+        else:
+            # Unda precalculată pe eșantioanele x; un cadru = Re(A·e^{-iωt})
+            wave = wave_harmonic(x_samples, E0, wavelength, T)
+            values = np.empty(len(x_samples))
+            wave_values = lambda t: wave.real(t, out=values)
         
-        wave_graph = always_redraw(
-            lambda: axes.plot(
-                lambda x: wave_function(x, t_tracker.get_value()),
-                color=BLUE,
-                stroke_width=4
-            )
-        )
+        # Curba se construiește o singură dată; la fiecare cadru se rescriu
+        # doar ordonatele, dintr-un singur apel vectorizat pe toate eșantioanele
+        wave_graph = LiveCurve(axes, x_samples, color=BLUE, stroke_width=4)
+        wave_graph.add_updater(lambda mob: mob.set_values(wave_values(t_tracker.get_value())))
+        wave_graph.update()
         
         self.play(Create(wave_graph))
         
-        speed_vector = always_redraw(
-            lambda: Arrow(
-                start=axes.c2p(2, 1.2),
-                end=axes.c2p(3, 1.2),
-                color=RED,
-                buff=0,
-                stroke_width=3
-            )
+        # Viteza nu depinde de timp: săgeata și eticheta sunt statice
+        speed_vector = Arrow(
+            start=axes.c2p(2, 1.2),
+            end=axes.c2p(3, 1.2),
+            color=RED,
+            buff=0,
+            stroke_width=3
         )
         
-        speed_label = always_redraw(
-            lambda: MathTex(
-                f"v = {c:.1f} \, \\text{{m/s}}",
-                font_size=20,
-                color=RED
-            ).next_to(speed_vector, UP, buff=0.1)
-        )
+        speed_label = MathTex(
+            rf"v = {c:.1f} \, \text{{m/s}}",
+            font_size=20,
+            color=RED
+        ).next_to(speed_vector, UP, buff=0.1)
 
         self.play(Create(speed_vector), Write(speed_label))
         
@@ -0,0 +1,183 @@
+import numpy as np
+
+from diffraction import slit_screen_intensity
+from harmonic import HarmonicField
+from optics import superposition
+
+# Motor de câmp de undă pentru DoubleSlit: totul este calculat în bloc, cu
+# NumPy, înainte de randare. Scena doar indexează array-urile la fiecare cadru.
+
+
+def slit_mask(X, Y, barrier_x, slit_ys, slit_width, thickness=0.2):
+    """Mască 0/1: bariera blochează unda în afara fantelor"""
+    X = np.asarray(X)
+    Y = np.asarray(Y)
+    barrier_region = np.abs(X - barrier_x) < thickness / 2
+    open_region = np.zeros(np.broadcast(X, Y).shape, dtype=bool)
+    for slit_y in slit_ys:
+        open_region |= np.abs(Y - slit_y) < slit_width / 2
+    return np.where(barrier_region & ~open_region, 0.0, 1.0)
+
+
+def quantum_field(X, Y, *, source, k, omega, barrier_x, slit_ys, slit_width,
+                  phase_offset=0):
+    """Ψ mascat ca HarmonicField: unda sferică și masca nu depind de timp"""
+    spatial = superposition(X, Y, [source], k, phases=phase_offset,
+                            attenuation=lambda r: 1 / np.sqrt(r + 1))
+    spatial *= slit_mask(X, Y, barrier_x, slit_ys, slit_width)
+    return HarmonicField(spatial, omega)
+
+
+def quantum_wave_function(X, Y, t, **geometry):
+    """Funcție de undă cuantică în spațiu 2D, mascată de barieră
+
+    `t` poate fi scalar sau vector; pentru un vector de T momente rezultatul
+    are forma (T, *X.shape).
+    """
+    return quantum_field(X, Y, **geometry).complex(t)
+
+
+def wavefield_frames(X, Y, times, **geometry):
+    """Ψ mascat pentru toate cadrele, formă (frames, ny, nx)"""
+    return quantum_wave_function(X, Y, np.asarray(times, dtype=float), **geometry)
+
+
+def particle_trajectories(n_particles, n_frames, dt, *, source, k, barrier_x,
+                          screen_x, slit_ys, slit_width, speed=1.5,
+                          speed_after=1.2, spread=1.5, seed=42, **_):
+    """Traiectoriile fotonilor, formă (frames, particles, 2)
+
+    Regulile sunt cele din vechiul updater al scenei, aplicate vectorizat pe
+    toate particulele deodată: propagare până la barieră, trecere doar prin
+    fante, deviație după barieră după faza k(r1 - r2) și reset la sursă la
+    atingerea ecranului. Particulele oprite de barieră sunt absorbite și
+    reemise din sursă.
+    """
+    rng = np.random.default_rng(seed)
+    slit1_y, slit2_y = slit_ys[0], slit_ys[-1]
+    source = np.asarray(source, dtype=float)
+
+    # Emisie: un fascicul care acoperă ambele fante, cu întârzieri eșalonate
+    # pentru un flux continuu de fotoni
+    offsets = np.linspace(-spread, spread, n_particles)
+    cycle = (screen_x - source[0]) / speed
+    delays = rng.permutation(np.linspace(0, cycle, n_particles, endpoint=False))
+
+    start = np.empty((n_particles, 2))
+    start[:, 0] = source[0]
+    start[:, 1] = source[1] + offsets
+
+    pos = start.copy()
+    trajectories = np.empty((n_frames, n_particles, 2))
+
+    for frame in range(n_frames):
+        trajectories[frame] = pos
+        x, y = pos[:, 0], pos[:, 1]
+
+        active = frame * dt >= delays
+        moving = active & (x < screen_x - 0.2)
+        before = moving & (x < barrier_x - 0.2)
+        at_barrier = moving & ~before & (np.abs(x - barrier_x) < 0.3)
+        after = moving & ~before & ~at_barrier
+
+        in_slit = ((np.abs(y - slit1_y) < slit_width / 2)
+                   | (np.abs(y - slit2_y) < slit_width / 2))
+
+        # Adăugăm deviație bazată pe interferență (calculată înainte de shift)
+        r1 = np.sqrt((x - barrier_x)**2 + (y - slit1_y)**2)
+        r2 = np.sqrt((x - barrier_x)**2 + (y - slit2_y)**2)
+        deviation = 0.3 * np.sin(k * (r1 - r2)) * dt
+
+        x += np.where(before | (at_barrier & in_slit), speed * dt, 0.0)
+        x += np.where(after, speed_after * dt, 0.0)
+        y += np.where(after, deviation, 0.0)
+
+        # Reset: fotoni ajunși la ecran sau absorbiți de barieră
+        reset = (active & ~moving) | (at_barrier & ~in_slit)
+        pos[reset] = start[reset]
+
+    return trajectories
+
+
+def screen_intensity(y_screen, *, k, barrier_x, screen_x, slit_ys, slit_width=0.0, **_):
+    """Densitatea de probabilitate |Ψ|² pe ecran (nenormalizată)
+
+    Fantele sunt iluminate în fază. Cu slit_width > 0 au lățime finită și
+    câmpul lor este propagat până la ecran prin spectrul unghiular
+    (diffraction.py); cu slit_width = 0 sunt surse punctiforme.
+    """
+    y = np.asarray(y_screen, dtype=float)
+    if slit_width > 0:
+        return slit_screen_intensity(
+            y, wavelength=2 * np.pi / k, distance=screen_x - barrier_x,
+            centers=slit_ys, width=slit_width,
+        )
+
+    slits = [(barrier_x, slit_y) for slit_y in slit_ys]
+
+    # Superpoziție cuantică a undelor din fiecare fantă
+    psi_total = superposition(screen_x, y, slits, k, attenuation=lambda r: 1 / np.sqrt(r))
+    return np.abs(psi_total)**2
+
+
+def sample_hits(n_hits, y_screen, intensity, rng):
+    """Extrage n_hits poziții y din distribuția |Ψ|² prin CDF inversă
+
+    Densitatea este considerată constantă pe fiecare interval din y_screen.
+    """
+    y_screen = np.asarray(y_screen, dtype=float)
+    pdf = 0.5 * (intensity[1:] + intensity[:-1]) * np.diff(y_screen)
+    cdf = np.concatenate(([0.0], np.cumsum(pdf)))
+    cdf /= cdf[-1]
+
+    u = rng.random(n_hits)
+    idx = np.clip(np.searchsorted(cdf, u, side="right") - 1, 0, len(pdf) - 1)
+    frac = (u - cdf[idx]) / np.maximum(cdf[idx + 1] - cdf[idx], 1e-300)
+    return y_screen[idx] + frac * (y_screen[idx + 1] - y_screen[idx])
+
+
+def hit_histogram_frames(n_hits, n_frames, y_screen, intensity, bins=200,
+                         chunk_size=1 << 20, seed=42):
+    """Histograma cumulativă a impactelor pe ecran, formă (frames, bins)
+
+    Impactele sunt generate pe bucăți de cel mult chunk_size și adunate în
+    bin-uri fixe, deci memoria nu depinde de n_hits. Cadrul i conține primele
+    n_hits * (i + 1) / n_frames impacte.
+    """
+    rng = np.random.default_rng(seed)
+    y_min, y_max = y_screen[0], y_screen[-1]
+    scale = bins / (y_max - y_min)
+
+    counts = np.zeros(bins, dtype=np.int64)
+    frames = np.empty((n_frames, bins), dtype=np.int64)
+    targets = np.linspace(0, n_hits, n_frames + 1).astype(np.int64)[1:]
+
+    done = 0
+    for frame, target in enumerate(targets):
+        while done < target:
+            n = min(chunk_size, target - done)
+            hits = sample_hits(n, y_screen, intensity, rng)
+            idx = np.minimum(((hits - y_min) * scale).astype(np.intp), bins - 1)
+            counts += np.bincount(idx, minlength=bins)
+            done += n
+        frames[frame] = counts
+    return frames
+
+
+def hits_raster(counts, width=64, color=(255, 255, 0), out=None):
+    """Histograma ca imagine RGBA (bins, width, 4), rândul 0 = sus
+
+    Primele coloane sunt ecranul (luminozitate ∝ număr de impacte), restul
+    sunt bare orizontale de lungime proporțională cu numărul de impacte.
+    """
+    if out is None:
+        out = np.zeros((len(counts), width, 4), dtype=np.uint8)
+        out[..., :3] = color
+    level = counts[::-1] / max(counts.max(), 1)
+
+    columns = np.arange(width) / width
+    screen_cols = max(width // 16, 1)
+    alpha = np.where(columns < level[:, None], 180, 0)
+    alpha[:, :screen_cols] = level[:, None] * 255
+    out[..., 3] = alpha
+    return out
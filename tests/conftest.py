@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modulele din src/ se importă direct, ca în benchmarks/ și în scene
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+import diffraction
+
+
+def test_single_slit_minima_at_fraunhofer_zeros():
+    wavelength, width, distance = 500e-9, 10e-6, 1.0
+    n, dx = 1 << 14, width / 64
+    aperture = diffraction.slits(diffraction.coordinates(n, dx), 0.0, width)
+    (screen,), intensity = diffraction.fraunhofer(aperture, dx, wavelength, distance)
+    # Lățimea eșantionată: fanta acoperă un număr întreg de celule
+    width = aperture.sum() * dx
+    step = screen[1] - screen[0]
+    for m in (-3, -2, -1, 1, 2, 3):
+        zero = m * wavelength * distance / width
+        near = np.abs(screen - zero) < 0.2 * abs(zero)
+        assert abs(screen[near][np.argmin(intensity[near])] - zero) <= step
+        assert intensity[near].min() < 1e-3
+    sinc2 = np.sinc(width * screen / (wavelength * distance)) ** 2
+    np.testing.assert_allclose(intensity, sinc2, atol=0.02)
+
+
+def test_two_slits_match_rayleigh_sommerfeld():
+    # Geometria din DoubleSlit: fante la ±0.75, lățime 0.2, ecranul la z = 5
+    wavelength, distance, width, centers = 0.5, 5.0, 0.2, (0.75, -0.75)
+    y_screen = np.linspace(-2.5, 2.5, 81)
+    intensity = diffraction.slit_screen_intensity(
+        y_screen, wavelength=wavelength, distance=distance, centers=centers, width=width)
+
+    # Suma directă (2D, kr ≫ 1): U(y) ∝ Σ z / r^{3/2} e^{ikr} pe punctele fantelor
+    y_slit = np.concatenate([np.linspace(c - width / 2, c + width / 2, 400) for c in centers])
+    r = np.hypot(distance, y_screen[:, None] - y_slit[None])
+    direct = np.abs((distance / r**1.5 * np.exp(2j * np.pi / wavelength * r)).sum(axis=1)) ** 2
+    np.testing.assert_allclose(intensity / intensity.max(), direct / direct.max(), atol=0.03)
+
+
+def test_sweep_and_transfer_cache():
+    y = diffraction.coordinates(1024, 0.05)
+    propagator = diffraction.AngularSpectrum(1024, 0.05, max_bytes=2 * 1024 * 8)
+    propagator.set_aperture(diffraction.slits(y, (-1.0, 1.0), 0.4))
+    expected = {(lam, z): propagator.intensity(lam, z) for lam in (0.4, 0.6) for z in (2.0, 4.0)}
+    for lam, z, intensity in propagator.sweep((0.4, 0.6), (2.0, 4.0)):
+        np.testing.assert_allclose(intensity, expected[lam, z], atol=1e-6 * intensity.max())
+    # Cache-ul LRU păstrează cel mult max_bytes de funcții de transfer
+    assert len(propagator._transfers) == 2
+    assert propagator.transfer(0.6, 4.0) is propagator.transfer(0.6, 4.0)
+
+
+def test_angular_spectrum_conserves_power():
+    y = diffraction.coordinates(4096, 0.02)
+    propagator = diffraction.AngularSpectrum(4096, 0.02, dtype=np.complex128, band_limit=False)
+    # Apertură gaussiană lată față de λ: practic nicio componentă evanescentă
+    aperture = np.exp(-(y / 1.0) ** 2)
+    propagator.set_aperture(aperture)
+    assert propagator.intensity(0.5, 10.0).sum() == pytest.approx((aperture**2).sum(), rel=1e-9)
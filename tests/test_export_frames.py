@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+import export_frames
+
+
+def test_export_rejects_zero_frames(tmp_path):
+    with pytest.raises(ValueError, match="niciun cadru"):
+        export_frames.export("DoubleSlit", tmp_path / "psi.npy", duration=0.01, fps=30)
+
+
+def test_export_writes_every_frame(tmp_path):
+    path, n_frames = export_frames.export("DoubleSlit", tmp_path / "psi.npy", duration=0.2, fps=20,
+                                          raw=True, width=32)
+    frames = np.load(path)
+    assert n_frames == 4 and frames.shape[0] == 4 and frames.dtype == np.float32
+
+
+def test_failed_writer_closes_fdtd_solver(tmp_path, monkeypatch):
+    solvers, create = [], export_frames.interference_solver
+
+    # Cu două fire rezolvitorul are un pool, eliberat doar de close()
+    def solver(physics):
+        solvers.append(create(physics, workers=2))
+        return solvers[-1]
+
+    def broken_writer(*args, **kwargs):
+        raise RuntimeError("ffmpeg nu este instalat")
+
+    monkeypatch.setattr(export_frames, "interference_solver", solver)
+    monkeypatch.setattr(export_frames, "FFmpegWriter", broken_writer)
+    with pytest.raises(RuntimeError):
+        export_frames.export("Interference", tmp_path / "fdtd.mp4", duration=0.1, fps=10, width=16,
+                             solver="fdtd")
+    assert len(solvers) == 1 and solvers[0]._pool is None
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+import fdtd
+from physics import check_params, compute, interference, wave_propagation
+
+
+def envelope(solver, period, n_frames=200):
+    """max |E| pe o perioadă, în fiecare punct al grilei"""
+    peak = np.zeros_like(solver.field)
+    for _, frame in solver.frames(every=period / n_frames, n_frames=n_frames):
+        np.maximum(peak, np.abs(frame), out=peak)
+    return peak
+
+
+def test_1d_vacuum_amplitude():
+    x = np.linspace(0, 20, 801)
+    solver = fdtd.FDTD1D(x)
+    solver.add_source(1.0, fdtd.continuous(np.pi))
+    solver.run_until(40)
+    peak = envelope(solver, 2.0)
+    assert peak[(x > 3) & (x < 18)] == pytest.approx(1.0, abs=5e-3)
+
+
+def test_1d_interface_reflection_and_transmission():
+    # n = 1.5: r = (1 - n) / (1 + n) = -0.2, t = 2 / (1 + n) = 0.8
+    x = np.linspace(0, 20, 801)
+    solver = fdtd.FDTD1D(x, index=np.where(x >= 10, 1.5, 1.0))
+    solver.add_source(1.0, fdtd.continuous(np.pi))
+    solver.run_until(60)
+    peak = envelope(solver, 2.0)
+    assert peak[(x > 12) & (x < 19)] == pytest.approx(0.8, abs=5e-3)
+    # Unda staționară din vid oscilează între 1 - |r| și 1 + |r|
+    vacuum = peak[(x > 2) & (x < 9)]
+    assert vacuum.min() == pytest.approx(0.8, abs=5e-3)
+    assert vacuum.max() == pytest.approx(1.2, abs=5e-3)
+
+
+@pytest.mark.parametrize("workers, tile_rows", [(4, None), (3, 7)])
+def test_2d_threaded_equals_serial(workers, tile_rows):
+    def run(**options):
+        axis = np.linspace(-3, 3, 121)
+        solver = fdtd.FDTD2D(axis, axis, index=lambda X, Y: np.where(Y > 1, 1.5, 1.0),
+                             conductivity=lambda X, Y: np.where(X > 2, 0.1, 0.0), **options)
+        solver.add_source(0.0, 0.0, fdtd.continuous(2.0))
+        solver.step(150)
+        solver.close()
+        return solver.field.copy()
+
+    assert np.array_equal(run(), run(workers=workers, tile_rows=tile_rows))
+
+
+def test_physics_simulate_flag():
+    assert "E" in wave_propagation(solver="fdtd", n_samples=50)
+    assert "E" not in wave_propagation(solver="fdtd", simulate=False)
+    assert "z" not in interference(solver="fdtd", simulate=False)
+    z = compute("Interference", solver="fdtd", resolution=10)["z"]
+    assert z.shape == (10, 10) and np.isfinite(z).all()
+    with pytest.raises(ValueError):
+        check_params("Interference", {"simulate": False})
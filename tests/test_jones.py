@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+import jones
+from optics import malus
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def random_chain(rng, shape):
+    """Polarizor parțial, lamă de undă și element general, pe unghiuri aleatoare"""
+    angles = rng.uniform(0, np.pi, (3,) + shape)
+    return (
+        jones.partial_polarizer(angles[0], 0.9, rng.uniform(0, 0.5, shape)),
+        jones.waveplate(angles[1], rng.uniform(0, 2 * np.pi, shape)),
+        jones.linear_element(angles[2], 0.8, 0.6, rng.uniform(0, np.pi, shape)),
+    )
+
+
+def test_mueller_matches_jones_on_stokes(rng):
+    shape = (50, 4)
+    matrix = jones.system(*random_chain(rng, shape))
+    vector = jones.elliptical_state(rng.uniform(0, np.pi, shape),
+                                    rng.uniform(-np.pi / 4, np.pi / 4, shape),
+                                    rng.uniform(0.5, 2.0, shape))
+    expected = jones.stokes(jones.apply(matrix, vector))
+    actual = jones.apply_mueller(jones.mueller(matrix), jones.stokes(vector))
+    np.testing.assert_allclose(actual, expected, atol=1e-5)
+
+
+def test_mueller_of_system_is_product_of_muellers(rng):
+    chain = random_chain(rng, (30,))
+    product = jones.mueller(chain[0])
+    for element in chain[1:]:
+        product = jones.mueller(element) @ product
+    np.testing.assert_allclose(jones.mueller(jones.system(*chain)), product, atol=1e-5)
+
+
+def test_compose_matches_matmul(rng):
+    a, b = random_chain(rng, (20, 3))[:2]
+    np.testing.assert_allclose(jones.compose(a, b), a @ b, atol=1e-6)
+
+
+def test_polarizer_intensity_follows_malus():
+    theta = np.linspace(0, np.pi, 37)
+    field = jones.apply(jones.linear_polarizer(theta), jones.linear_state(0.0, 2.0))
+    np.testing.assert_allclose(jones.intensity(field), malus(theta, 2.0), atol=1e-6)
+    # Lumina nepolarizată pierde jumătate la primul polarizor
+    stokes = jones.apply_mueller(jones.mueller(jones.linear_polarizer(theta)), jones.unpolarized())
+    np.testing.assert_allclose(stokes[:, 0], 0.5, atol=1e-6)
+
+
+def test_quarter_wave_plate_makes_circular_light():
+    field = jones.apply(jones.quarter_wave_plate(np.pi / 4), jones.linear_state(0.0))
+    assert abs(jones.poincare(jones.stokes(field))[2]) == pytest.approx(1.0, abs=1e-6)
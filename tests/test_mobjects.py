@@ -0,0 +1,21 @@
+import shutil
+
+import numpy as np
+import pytest
+
+manim = pytest.importorskip("manim")
+if shutil.which("latex") is None:
+    pytest.skip("MathTex are nevoie de LaTeX", allow_module_level=True)
+
+from mobjects import NumericLabel  # noqa: E402
+
+
+@pytest.mark.parametrize("aligned_edge", [manim.LEFT, manim.RIGHT])
+def test_label_keeps_position_after_move_and_cached_value(aligned_edge):
+    label = NumericLabel(r"\theta = {theta:.0f}°", font_size=24, aligned_edge=aligned_edge, theta=0)
+    label.to_corner(manim.DR).shift(0.3 * manim.UP)
+    center = label.get_center().copy()
+    label.set_value(theta=45)
+    # Valoarea 0 revine din cache, cu intrarea construită înainte de mutare
+    label.set_value(theta=0)
+    np.testing.assert_allclose(label.get_center(), center, atol=1e-6)
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+import optics
+
+
+def test_snell_and_total_internal_reflection():
+    theta1 = np.radians(np.linspace(0, 89, 90))
+    theta2 = optics.snell(1.5, 1.0, theta1)
+    tir = optics.total_internal_reflection(1.5, 1.0, theta1)
+    np.testing.assert_array_equal(np.isnan(theta2), tir)
+    np.testing.assert_allclose(1.5 * np.sin(theta1[~tir]), np.sin(theta2[~tir]))
+
+
+def test_fresnel_reflectance():
+    # Incidență normală: R = ((n1 - n2) / (n1 + n2))²; reflexie totală: R = 1
+    assert optics.fresnel_reflectance(1.0, 1.5, 0.0) == pytest.approx(0.04)
+    theta_b = np.arctan(1.5)
+    assert optics.fresnel_reflectance(1.0, 1.5, theta_b, "p") == pytest.approx(0.0, abs=1e-12)
+    assert optics.fresnel_reflectance(1.5, 1.0, np.radians(60)) == pytest.approx(1.0)
+
+
+def test_kernels_write_out_and_keep_dtype():
+    theta = np.linspace(0, 1, 10, dtype=np.float32)
+    out = np.empty(10, dtype=np.float32)
+    assert optics.malus(theta, out=out) is out
+    np.testing.assert_allclose(out, np.cos(theta) ** 2, rtol=1e-6)
+    assert optics.snell(np.float32(1.0), np.float32(1.5), theta).dtype == np.float32
+    assert optics.snell(1.0, 1.5, theta, dtype=np.float32).dtype == np.float32
+    with pytest.raises(ValueError):
+        optics.malus(theta, out=np.empty(3))
+
+
+def test_superposition_matches_direct_sum():
+    x, y = np.meshgrid(np.linspace(-2, 2, 30), np.linspace(-1, 3, 20))
+    sources = np.array([[-0.5, 0.0], [0.5, 0.0], [0.0, 1.0]])
+    amplitudes, phases = np.array([1.0, 0.5, 2.0]), np.array([0.0, 1.0, -0.3])
+    field = optics.superposition(x, y, sources, k=4.0, t=0.7, omega=2.0, amplitudes=amplitudes,
+                                 phases=phases)
+    expected = sum(a * np.exp(1j * (4.0 * np.hypot(x - sx, y - sy) + phi - 2.0 * 0.7))
+                   for (sx, sy), a, phi in zip(sources, amplitudes, phases))
+    np.testing.assert_allclose(field, expected, atol=1e-12)
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+from physics import SCENES, check_params, compute, default_params
+
+
+def test_refraction_rejects_total_internal_reflection():
+    with pytest.raises(ValueError, match="reflexie totală"):
+        compute("Refraction", n1=1.8, theta1_deg=60)
+    with pytest.raises(ValueError, match="reflexie totală"):
+        check_params("Refraction", {"n1": 1.8, "theta1_deg": 60})
+    # Dispersia: unghiul limită este dat de cel mai mic n2 din spectru
+    with pytest.raises(ValueError):
+        compute("Refraction", n1=1.5, n2=lambda wl: 1.3 + 0.2 * (wl < 500), theta1_deg=70)
+
+
+def test_refraction_below_critical_angle_is_finite():
+    physics = compute("Refraction", n1=1.5, n2=1.0, theta1_deg=30)
+    assert np.isfinite(physics["theta2"]) and np.isfinite(physics["spectrum"]["theta2"]).all()
+    assert check_params("Refraction", {"theta1_deg": 80}) == {"theta1_deg": 80}
+
+
+def test_check_params_rejects_unknown_names():
+    with pytest.raises(ValueError, match="necunoscuți"):
+        check_params("Reflection", {"theta": 30})
+
+
+@pytest.mark.parametrize("scene", sorted(SCENES))
+def test_default_params_compute(scene):
+    assert compute(scene, **default_params(scene))
@@ -0,0 +1,29 @@
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+import pi_gan  # noqa: E402
+
+
+def test_bank_clamps_d_below_aliasing_limit():
+    bank = pi_gan.FringeBank(128, 8, 8, d_range=(2e-6, 40e-6))
+    assert bank.d_range[1] == pytest.approx(pi_gan.max_separation(pi_gan.LAMBDA_RANGE[0], 128))
+    assert bank.separations.max() <= bank.d_range[1]
+    # Fără aliasing vârful așteptat crește cu d, pentru fiecare λ
+    assert np.all(np.diff(bank.peaks, axis=1) > 0)
+
+
+def test_bank_rejects_range_above_limit():
+    with pytest.raises(ValueError, match="aliasing"):
+        pi_gan.FringeBank(32, 2, 2, d_range=(5e-6, 20e-6))
+
+
+def test_bank_targets_are_normalized_fringes(tmp_path):
+    bank = pi_gan.FringeBank(32, 2, 3, d_range=(1e-6, 2e-6), mmap=True, directory=tmp_path)
+    expected = pi_gan.normalized_fringe(bank.wavelengths[1], bank.separations[2], 32)
+    np.testing.assert_array_equal(bank.targets[1, 2], expected)
+    # A doua bancă cu aceeași configurație citește fișierul mapat
+    again = pi_gan.FringeBank(32, 2, 3, d_range=(1e-6, 2e-6), mmap=True, directory=tmp_path)
+    assert isinstance(again.targets, np.memmap)
+    np.testing.assert_array_equal(again.peaks, bank.peaks)
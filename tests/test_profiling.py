@@ -0,0 +1,44 @@
+import functools
+import inspect
+
+from profiling import updater_name, wrap_updaters
+
+
+class Dot:
+    def __init__(self):
+        self.updaters = []
+
+    def add_updater(self, update_function, index=None):
+        self.updaters.append(update_function)
+        return self
+
+
+def test_wrap_updaters_names_and_keeps_signature():
+    calls = []
+
+    def wrap(function, name):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            calls.append(name)
+            return function(*args, **kwargs)
+        return wrapper
+
+    def move(mob, dt):
+        return dt
+
+    add_updater = wrap_updaters(Dot.add_updater, wrap)
+    assert add_updater.__name__ == "add_updater"
+    dot = Dot()
+    assert add_updater(dot, move) is dot
+    assert dot.updaters[0](dot, 0.5) == 0.5
+    assert calls == ["Dot:test_wrap_updaters_names_and_keeps_signature.move"]
+    # Manim alege între updater(m) și updater(m, dt) după semnătură
+    assert "dt" in inspect.signature(dot.updaters[0]).parameters
+
+
+def test_updater_name_without_qualname():
+    class Callable:
+        def __call__(self, mob):
+            pass
+
+    assert updater_name(Dot(), Callable()).startswith("Dot:<")
@@ -0,0 +1,26 @@
+from render_cache import RenderCache
+
+
+def write(path, size):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"\0" * size)
+    return path
+
+
+def test_put_keeps_the_partials_it_registers(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=150)
+    write(cache.partial_dir("Reflection", "l") / "a.mp4", 100)
+    cache.put("k1", write(tmp_path / "v1.mp4", 100), "Reflection", "l")
+    # Peste buget, dar nici videoclipul, nici parțialele tocmai salvate nu se șterg
+    assert cache.object_path("k1").exists()
+    assert (cache.partial_dir("Reflection", "l") / "a.mp4").exists()
+    assert set(cache.index) == {"k1", "partials:Reflection-l"}
+
+
+def test_put_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(tmp_path / "cache", max_bytes=250)
+    for key in ("k1", "k2", "k3"):
+        cache.put(key, write(tmp_path / f"{key}.mp4", 100), "Reflection", "l")
+    assert not cache.object_path("k1").exists()
+    assert set(cache.index) == {"k2", "k3"}
+    assert cache.get("k3", tmp_path / "out.mp4") and not cache.get("k1", tmp_path / "out.mp4")
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+import snell_dataset
+from optics import snell
+
+
+def test_output_does_not_depend_on_process_count(tmp_path):
+    serial = snell_dataset.generate(10_000, tmp_path / "serial", seed=3, chunk_rows=1024, jobs=1)
+    parallel = snell_dataset.generate(10_000, tmp_path / "parallel", seed=3, chunk_rows=1024, jobs=4)
+    a, b = snell_dataset.load(serial), snell_dataset.load(parallel)
+    for name in snell_dataset.COLUMNS:
+        assert a[name].tobytes() == b[name].tobytes()
+    # Altă sămânță, alte date
+    other = snell_dataset.load(snell_dataset.generate(10_000, tmp_path / "other", seed=4,
+                                                      chunk_rows=1024, jobs=1))
+    assert not np.array_equal(a["n1"], other["n1"])
+
+
+def test_rows_are_valid_and_in_range(tmp_path):
+    columns = snell_dataset.load(snell_dataset.generate(5000, tmp_path, seed=0, chunk_rows=777))
+    assert all(len(column) == 5000 for column in columns.values())
+    for name, (low, high) in snell_dataset.RANGES.items():
+        assert columns[name].min() >= low and columns[name].max() <= high
+    theta2 = np.degrees(snell(columns["n1"].astype(float), columns["n2"].astype(float),
+                              np.radians(columns["theta1"].astype(float))))
+    np.testing.assert_allclose(columns["theta2"], theta2, rtol=1e-5)
+    assert snell_dataset.metadata(tmp_path)["rows"] == 5000
+
+
+@pytest.mark.parametrize("n_rows, chunk_rows", [(0, 1024), (-5, 1024), (10, 0)])
+def test_rejects_empty_dataset(tmp_path, n_rows, chunk_rows):
+    with pytest.raises(ValueError):
+        snell_dataset.generate(n_rows, tmp_path, chunk_rows=chunk_rows)
+
+
+def test_more_jobs_than_chunks(tmp_path):
+    snell_dataset.generate(100, tmp_path, jobs=0)
+    snell_dataset.generate(100, tmp_path, jobs=16)
+    assert len(snell_dataset.load(tmp_path)["theta2"]) == 100
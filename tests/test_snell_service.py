@@ -0,0 +1,89 @@
+import http.client
+import json
+import threading
+
+import numpy as np
+import pytest
+
+from snell_service import MicroBatcher, Surrogate, analytic, parse_query, serve
+
+
+@pytest.fixture
+def service():
+    server, batcher = serve(analytic, port=0, max_delay=0.001)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server, batcher
+    server.shutdown()
+    server.server_close()
+    batcher.close()
+
+
+def post(server, body):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=5)
+    connection.request("POST", "/predict", json.dumps(body).encode(),
+                       {"Content-Type": "application/json"})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+def test_parse_query_rejects_invalid_fields():
+    for query in ({"n1": "abc", "n2": 1.5, "theta1": 30},
+                  {"n1": [1.0, 1.2], "n2": [1.5], "theta1": [10, 20]},
+                  {"n1": [1.0], "n2": 1.5, "theta1": [10]},
+                  {"n1": [], "n2": [], "theta1": []},
+                  {"n1": True, "n2": 1.5, "theta1": 30},
+                  [1.0, 1.5, 30]):
+        with pytest.raises(ValueError):
+            parse_query(query)
+    rows, is_batch = parse_query({"n1": [1.0, 1.2], "n2": [1.5, 1.5], "theta1": [10, 20]})
+    assert is_batch and rows.shape == (2, 3)
+
+
+def test_batcher_survives_bad_rows():
+    batcher = MicroBatcher(analytic, max_delay=0.001)
+    with pytest.raises(ValueError):
+        batcher.submit(["abc", 1.5, 30.0])
+    assert batcher._thread.is_alive()
+    assert batcher.submit([1.0, 1.5, 30.0]) == pytest.approx(19.47, abs=0.01)
+
+
+def test_submit_times_out():
+    blocked = threading.Event()
+    batcher = MicroBatcher(lambda rows: blocked.wait() or analytic(rows))
+    with pytest.raises(TimeoutError):
+        batcher.submit([1.0, 1.5, 30.0], timeout=0.05)
+    blocked.set()
+
+
+def test_invalid_requests_get_400(service):
+    server, batcher = service
+    assert post(server, {"n1": "abc", "n2": 1.5, "theta1": 30})[0] == 400
+    assert post(server, {"n1": [1.0, 1.2], "n2": [1.5], "theta1": [10, 20]})[0] == 400
+    assert batcher._thread.is_alive()
+    status, body = post(server, {"n1": 1.0, "n2": 1.5, "theta1": 30})
+    assert status == 200 and body["theta2"] == pytest.approx(19.47, abs=0.01)
+
+
+def test_total_internal_reflection_is_null(service):
+    server, _ = service
+    assert post(server, {"n1": 1.8, "n2": 1.0, "theta1": 60}) == (200, {"theta2": None})
+    status, body = post(server, {"n1": [1.8, 1.0], "n2": [1.0, 1.5], "theta1": [60, 30]})
+    assert status == 200 and body["theta2"][0] is None
+    assert body["theta2"][1] == pytest.approx(np.degrees(np.arcsin(np.sin(np.radians(30)) / 1.5)))
+
+
+def test_surrogate_returns_nan_on_total_internal_reflection():
+    # Un MLP liniar care întoarce θ1: orice valoare finită ar fi inventată la TIR
+    surrogate = Surrogate([np.array([[0.0], [0.0], [1.0]])], [np.zeros(1)], "identity")
+    theta2 = surrogate(np.array([[1.8, 1.0, 60.0], [1.0, 1.5, 30.0]]))
+    assert np.isnan(theta2[0]) and theta2[1] == pytest.approx(30.0)
+    assert np.array_equal(np.isnan(theta2), np.isnan(analytic([[1.8, 1.0, 60.0], [1.0, 1.5, 30.0]])))
+
+
+def test_close_stops_the_batcher_thread():
+    batcher = MicroBatcher(analytic, max_delay=0.001)
+    assert batcher.submit([1.0, 1.5, 30.0]) == pytest.approx(19.47, abs=0.01)
+    batcher.close(timeout=5)
+    assert not batcher._thread.is_alive()
+    assert batcher.stats()["requests"] == 1
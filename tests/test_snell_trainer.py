@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+torch = pytest.importorskip("torch")
+
+import snell_dataset  # noqa: E402
+import snell_trainer  # noqa: E402
+
+OPTIONS = dict(batch_size=256, collocation=64, hidden=(8,), workers=0, threads=1, log_every=10**9,
+               checkpoint_every=10**9, seed=1)
+
+
+@pytest.fixture(scope="module")
+def data(tmp_path_factory):
+    return snell_dataset.generate(3000, tmp_path_factory.mktemp("snell"), seed=0, chunk_rows=1000)
+
+
+def weights(path):
+    return torch.load(path, map_location="cpu", weights_only=False)["model"]
+
+
+def test_resume_matches_uninterrupted_run(data, tmp_path):
+    snell_trainer.train(data, tmp_path / "full", epochs=2, **OPTIONS)
+    # Întrerupt în mijlocul primei epoci, apoi reluat din last.pt
+    snell_trainer.train(data, tmp_path / "resumed", epochs=2, max_steps=4, **OPTIONS)
+    snell_trainer.train(data, tmp_path / "resumed", epochs=2, resume=True, **OPTIONS)
+    full, resumed = weights(tmp_path / "full" / "last.pt"), weights(tmp_path / "resumed" / "last.pt")
+    for name in full:
+        assert torch.equal(full[name], resumed[name]), name
+
+
+def test_tiny_validation_fraction_keeps_one_row(data, tmp_path):
+    snell_trainer.train(data, tmp_path, epochs=2, val_fraction=1e-6, patience=1, **OPTIONS)
+    best = torch.load(tmp_path / "best.pt", map_location="cpu", weights_only=False)
+    assert best["val_loss"] > 0
+
+
+def test_without_validation_all_epochs_run(data, tmp_path):
+    snell_trainer.train(data, tmp_path, epochs=3, val_fraction=0.0, patience=1, **OPTIONS)
+    last = torch.load(tmp_path / "last.pt", map_location="cpu", weights_only=False)
+    assert last["state"]["epoch"] == 3
+    assert math.isnan(torch.load(tmp_path / "best.pt", weights_only=False)["val_loss"])
@@ -0,0 +1,31 @@
+import numpy as np
+
+import spectral
+from physics import compute
+
+
+def test_color_names_follow_wavelength():
+    assert spectral.color_name([650, 550, 450]) == ["Roșu", "Verde", "Albastru"]
+    assert spectral.color_name(300) == ["Ultraviolet"]
+    assert spectral.color_name(np.array([400.0, 590.0, 760.0])) == ["Violet", "Portocaliu",
+                                                                      "Infraroșu"]
+
+
+def test_photonic_model_labels_every_wavelength():
+    physics = compute("PhotonicModel", wavelengths_nm=[450, 550])
+    assert physics["names"] == ["Albastru", "Verde"]
+    physics = compute("PhotonicModel", wavelengths_nm=[700, 600, 500, 420])
+    assert len(physics["names"]) == len(physics["rgb"]) == len(physics["energy_eV"]) == 4
+    assert compute("PhotonicModel", wavelengths_nm=550)["names"] == ["Verde"]
+
+
+def test_cie_table_edges_keep_constant_chromaticity():
+    table = spectral.CIE_TABLE
+    chromaticity = table / table.sum(axis=1, keepdims=True)
+    for outside, edge in ((spectral.CIE_WAVELENGTHS < 420, 420.0),
+                          (spectral.CIE_WAVELENGTHS > 650, 650.0)):
+        at_edge = chromaticity[spectral.CIE_WAVELENGTHS == edge][0]
+        np.testing.assert_allclose(chromaticity[outside], np.broadcast_to(at_edge, (outside.sum(), 3)),
+                                   atol=1e-12)
+    # Nicio variabilă de lucru rămasă în spațiul de nume al modulului
+    assert not {"_edge", "_outside", "_lobe_index", "_ratio"} & set(vars(spectral))